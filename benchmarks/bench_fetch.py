@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Eşzamanlı RSS alma hattını eski sıralı yöntemle karşılaştırır.
+# Yerel sunucular normal, yavaş, hata veren ve askıda kalan akışlar sunar.
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rss_feed_reader
+from feed_server import FeedServer
+
+
+# Akış listesini birkaç yerel sunucuya dağıt
+def build_feed_list(servers, feed_count, slow_count, failing_count, hanging_count):
+    feeds = []
+    for i in range(feed_count):
+        server = servers[i % len(servers)]
+        if i < slow_count:
+            query = "delay=2000"
+        elif i < slow_count + failing_count:
+            query = "status=500"
+        elif i < slow_count + failing_count + hanging_count:
+            query = "hang=1&hang_seconds=30"
+        else:
+            query = f"delay={50 + (i * 37) % 250}"
+        feeds.append(server.url(f"/feed/akis{i}?items=25&{query}"))
+    return feeds
+
+
+# Değişiklikten önceki sıralı algoritma (engelleyici time.sleep ile)
+def sequential_fetch(feeds, transport, max_retries=3, initial_delay=5):
+    all_entries = []
+    for url in feeds:
+        for attempt in range(max_retries):
+            try:
+                all_entries.extend(rss_feed_reader.fetch_feed_entries(url, transport))
+                break
+            except rss_feed_reader.FeedParseError:
+                continue
+            except Exception:
+                if attempt < max_retries - 1:
+                    time.sleep(initial_delay * (2 ** attempt))
+    return all_entries
+
+
+def run_with_limit(func, limit):
+    result = {}
+
+    def target():
+        result['entries'] = func()
+
+    started = time.monotonic()
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(limit)
+    elapsed = time.monotonic() - started
+    return elapsed, result.get('entries'), thread.is_alive()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS alma benchmark'ı")
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--slow", type=int, default=4)
+    parser.add_argument("--failing", type=int, default=3)
+    parser.add_argument("--hanging", type=int, default=2)
+    parser.add_argument("--deadline", type=float, default=10)
+    parser.add_argument("--sequential-limit", type=float, default=60)
+    args = parser.parse_args()
+
+    servers = [FeedServer().start() for _ in range(args.hosts)]
+    feeds = build_feed_list(servers, args.feeds, args.slow, args.failing, args.hanging)
+    cache_dir = tempfile.TemporaryDirectory()
+
+    try:
+        transport = rss_feed_reader.FeedTransport(cache_file=os.path.join(cache_dir.name, "http.json"))
+        health = rss_feed_reader.FeedHealthTracker(os.path.join(cache_dir.name, "health.json"))
+        for label in ("Eşzamanlı", "Koşullu GET"):
+            first_result = []
+            started = time.monotonic()
+            not_modified_before = sum(server.not_modified_count for server in servers)
+
+            def on_feed_entries(url, entries):
+                if not first_result:
+                    first_result.append(time.monotonic() - started)
+
+            elapsed, entries, _ = run_with_limit(
+                lambda: rss_feed_reader.get_rss_feed(feeds, initial_delay=1, deadline=args.deadline,
+                                                     on_feed_entries=on_feed_entries, transport=transport,
+                                                     health=health),
+                args.deadline + 5)
+            not_modified = sum(server.not_modified_count for server in servers) - not_modified_before
+            print(f"{label:<12}: {elapsed:7.2f} sn, {len(entries or [])} başlık, "
+                  f"ilk sonuç {first_result[0] if first_result else float('nan'):.2f} sn, "
+                  f"304 yanıtı {not_modified}")
+
+        sequential_transport = rss_feed_reader.FeedTransport(cache_file=os.path.join(cache_dir.name, "seq.json"))
+        elapsed, entries, timed_out = run_with_limit(
+            lambda: sequential_fetch(feeds, sequential_transport, initial_delay=1), args.sequential_limit)
+        suffix = " (süre sınırı aşıldı)" if timed_out else ""
+        print(f"{'Sıralı':<12}: {elapsed:7.2f} sn, {len(entries or [])} başlık{suffix}")
+    finally:
+        for server in servers:
+            server.stop()
+        cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
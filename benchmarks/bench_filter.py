@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Başlık filtresinin (tüm kurallar alan başına tek düzenli ifadede) maliyetini
+# kuralları tek tek deneyen yolla karşılaştırır. Kural sayısı arttıkça eski yolun
+# süresi doğrusal artar, birleşik eşleştiricininki yaklaşık sabit kalır.
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rss_feed_reader
+
+WORDS = ("ekonomi", "seçim", "deprem", "açıklama", "büyükşehir", "milli", "takım", "bakanlık",
+         "piyasa", "dolar", "hava", "durumu", "uyarı", "yağış", "öğrenci", "sınav", "sonuçları",
+         "kritik", "toplantı", "gündem", "iddia", "soruşturma", "maç", "transfer", "İstanbul", "Işık")
+
+
+def make_entries(rng, count, feeds=40):
+    entries = []
+    for i in range(count):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))).capitalize()
+        description = "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 60))) + "</p>"
+        entries.append(rss_feed_reader.FeedEntry(title, f"https://haber{i % feeds}.example.com/h/{i}",
+                                                 "", description.encode("utf-8"),
+                                                 f"https://haber{i % feeds}.example.com/rss"))
+    return entries
+
+
+# Eşleşmesi seyrek, gerçekçi anahtar kelimeler: sözlükteki kelimelerin uzantıları
+def make_rules(rng, count):
+    kinds = ("exclude", "boost", "boost")
+    fields = (None, None, "title", "description", "source")
+    rules = []
+    for i in range(count):
+        keyword = rng.choice(WORDS) + "".join(rng.choice("abcçdefgğhıijklmnoöprsştuüvyz") for _ in range(3))
+        field = "source" if i == 0 else rng.choice(fields)
+        rules.append((rng.choice(kinds), field, "haber7" if field == "source" else keyword))
+    return rules
+
+
+# Değişiklikten önceki yaklaşımın karşılığı: her kural için ayrı bir arama
+class PerRuleFilter:
+
+    def __init__(self, rules):
+        self.rules = [(kind, (field,) if field else ("title", "description"),
+                       re.compile(r"(?<!\w)" + re.escape(" ".join(rss_feed_reader.fold_text(keyword).split()))))
+                      for kind, field, keyword in rules]
+
+    def filter(self, entries):
+        kept = []
+        for entry in entries:
+            texts = {}
+            score = 0
+            for kind, fields, pattern in self.rules:
+                matched = False
+                for field in fields:
+                    if field not in texts:
+                        texts[field] = rss_feed_reader.HeadlineFilter.field_text(entry, field)
+                    if pattern.search(texts[field]):
+                        matched = True
+                        break
+                if not matched:
+                    continue
+                if kind == "exclude":
+                    score = None
+                    break
+                score += 1
+            if score is not None:
+                kept.append((score, entry))
+        kept.sort(key=lambda item: -item[0])
+        return [entry for _, entry in kept]
+
+
+def timed(func, entries, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(entries)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlık filtresi benchmark'ı")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--rules", default="10,100,1000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = make_entries(rng, args.entries)
+    print(f"{args.entries} başlık, {args.repeat} tekrarın en iyisi")
+    for rule_count in (int(count) for count in args.rules.split(",")):
+        rules = make_rules(rng, rule_count)
+        started = time.perf_counter()
+        headline_filter = rss_feed_reader.HeadlineFilter(rules)
+        compile_time = time.perf_counter() - started
+        legacy_time, legacy_result = timed(PerRuleFilter(rules).filter, entries, args.repeat)
+        compiled_time, compiled_result = timed(headline_filter.filter, entries, args.repeat)
+        same = [entry.title for entry in legacy_result] == [entry.title for entry in compiled_result]
+        print(f"{rule_count:>5} kural: tek tek {legacy_time * 1000:8.1f} ms, "
+              f"birleşik {compiled_time * 1000:8.1f} ms (derleme {compile_time * 1000:.1f} ms), "
+              f"{len(compiled_result)} başlık kaldı, sonuç {'aynı' if same else 'FARKLI'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+# Başlık modelinin bellek kullanımını iki ayrı ölçümle raporlar:
+#  1) aynı sayıda başlık için kayıt gösterimi (sözlük, __slots__'suz sınıf,
+#     FeedEntry) ve eski birleştirilmiş metnin maliyeti,
+#  2) 30 günlük benzetimde saklama kurallarının etkisi (iki tarafta da FeedEntry).
+# Ağ veya ekran gerekmez.
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rss_feed_reader
+
+SEPARATOR = " ---------- "
+WORDS = ("ekonomi", "seçim", "deprem", "açıklama", "büyükşehir", "milli", "takım", "bakanlık",
+         "piyasa", "dolar", "hava", "durumu", "uyarı", "yağış", "öğrenci", "sınav", "sonuçları",
+         "kritik", "toplantı", "gündem", "iddia", "soruşturma", "maç", "transfer")
+
+
+def make_title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))).capitalize()
+
+
+def make_description(rng):
+    return "<p>" + " ".join(rng.choice(WORDS) for _ in range(rng.randint(30, 60))) + "</p>"
+
+
+# Her yoklamada akışlardan gelen yeni başlıkları üret: (akış, başlık, açıklama, link)
+def churn(feed_count, items_per_day, poll_minutes, days, seed):
+    rng = random.Random(seed)
+    polls_per_day = 24 * 60 // poll_minutes
+    rate = items_per_day / polls_per_day
+    serial = 0
+    for poll in range(days * polls_per_day):
+        now = poll * poll_minutes * 60
+        batch = []
+        for feed_index in range(feed_count):
+            count = int(rate) + (1 if rng.random() < rate - int(rate) else 0)
+            for _ in range(count):
+                serial += 1
+                # Ayrıştırıcı her yanıtta yeni dizeler üretir; akış adresi de öyle
+                feed = "".join(("https://haber", str(feed_index), ".example.com/rss"))
+                batch.append((feed, make_title(rng), make_description(rng),
+                              f"https://haber{feed_index}.example.com/h/{serial}"))
+        yield poll, now, batch
+
+
+# __slots__ olmadan FeedEntry ile aynı alanları taşıyan sınıf; yalnızca
+# __slots__'un kazancını ayırmak için kullanılır
+class UnslottedEntry:
+
+    def __init__(self, title, link="", guid="", raw_description=b"", feed="", first_seen=None):
+        self.title = title
+        self.link = link
+        self.guid = guid
+        self.raw_description = raw_description
+        self.feed = sys.intern(feed)
+        self.first_seen = first_seen
+
+
+# Aynı başlıkları farklı gösterimlerle tut ve ayrılan belleği ölç. Başlık,
+# açıklama ve link dizeleri her gösterimde aynı olduğundan fark yalnızca
+# kaydın kendisinden (ve varsa birleştirilmiş metinden) gelir.
+def measure_representation(items, build):
+    gc.collect()
+    tracemalloc.start()
+    kept = build(items)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def build_dicts(items):
+    return [{'title': title, 'description': description, 'link': link, 'feed': feed}
+            for feed, title, description, link in items]
+
+
+def build_unslotted(items):
+    return [UnslottedEntry(title, link, link, description, feed, 0.0)
+            for feed, title, description, link in items]
+
+
+def build_slotted(items):
+    return [rss_feed_reader.FeedEntry(title, link, link, description, feed, 0.0)
+            for feed, title, description, link in items]
+
+
+def build_joined_text(items):
+    return SEPARATOR.join(title for _, title, _, _ in items)
+
+
+# Bellekte tutulan başlıklar: saklama kuralları olmadan (eski davranış) veya
+# bant başa sardığında apply_entry_retention ile. İki durumda da FeedEntry
+# kullanılır; fark yalnızca saklama kurallarından gelir.
+class Band:
+
+    def __init__(self, retention=None):
+        self.entries = []
+        self.retention = retention
+
+    def merge(self, now, batch):
+        for feed, title, description, link in batch:
+            self.entries.append(rss_feed_reader.FeedEntry(title, link, link, description.encode("utf-8"),
+                                                          feed, now))
+        if self.retention:
+            per_feed, max_age, global_cap = self.retention
+            self.entries = rss_feed_reader.apply_entry_retention(self.entries, now, per_feed, max_age, global_cap)
+
+
+def measure(band, args, report_days):
+    gc.collect()
+    tracemalloc.start()
+    results = {}
+    polls_per_day = 24 * 60 // args.poll_minutes
+    for poll, now, batch in churn(args.feeds, args.items_per_day, args.poll_minutes, args.days, args.seed):
+        band.merge(now, batch)
+        day = (poll + 1) / polls_per_day
+        if day in report_days:
+            del batch
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            results[int(day)] = (len(band.entries), current, peak)
+    tracemalloc.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlık modeli bellek benchmark'ı")
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--items-per-day", type=float, default=60)
+    parser.add_argument("--poll-minutes", type=int, default=15)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--per-feed", type=int, default=rss_feed_reader.STORED_ENTRIES_PER_FEED)
+    parser.add_argument("--max-age-days", type=float, default=rss_feed_reader.ENTRY_MAX_AGE / 86400)
+    parser.add_argument("--global-cap", type=int, default=rss_feed_reader.ENTRY_GLOBAL_CAP)
+    parser.add_argument("--entries", type=int, default=rss_feed_reader.ENTRY_GLOBAL_CAP,
+                        help="Gösterim karşılaştırmasındaki başlık sayısı")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # 1) Kayıt gösterimi: aynı sayıda başlık, saklama kuralı yok
+    rng = random.Random(args.seed)
+    items = [("".join(("https://haber", str(i % args.feeds), ".example.com/rss")), make_title(rng),
+              make_description(rng).encode("utf-8"), f"https://haber{i % args.feeds}.example.com/h/{i}")
+             for i in range(args.entries)]
+    print(f"Kayıt gösterimi: {args.entries} başlık (dizeler ortak, yalnızca kayıtlar ölçülür)")
+    for label, build in (("Sözlük", build_dicts), ("Sınıf, __slots__ yok", build_unslotted),
+                         ("FeedEntry (__slots__)", build_slotted), ("Birleştirilmiş metin", build_joined_text)):
+        size = measure_representation(items, build)
+        print(f"  {label:<22}: {size / 2**10:8.1f} KiB ({size / args.entries:6.1f} bayt/başlık)")
+
+    # 2) Saklama kuralları: aynı kayıt türü, 30 günlük benzetim
+    report_days = {day for day in (1, 3, 7, 14, 30, args.days) if day <= args.days}
+    bands = (("Sınırsız", Band()),
+             ("Saklama", Band((args.per_feed, args.max_age_days * 86400, args.global_cap))))
+    print(f"Saklama kuralları: {args.feeds} akış, akış başına günde {args.items_per_day:g} başlık, "
+          f"{args.poll_minutes} dakikada bir yoklama, {args.days} gün (FeedEntry)")
+    for label, band in bands:
+        results = measure(band, args, report_days)
+        for day in sorted(results):
+            count, current, peak = results[day]
+            print(f"  {label:<10} gün {day:>2}: {count:>7} başlık, {current / 2**20:8.1f} MiB "
+                  f"(tepe {peak / 2**20:8.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Büyük akışlarda akarak ayrıştırmayı (StreamingFeedParser, en yeni N başlıkta
+# okumayı bırakır) tüm gövdeyi indirip feedparser ile ayrıştıran eski yolla
+# karşılaştırır. Sentetik akışlar yerel sunucudan indirilir; --recorded-dir ile
+# kaydedilmiş gerçek akışlar (feed_server.py --record) da ölçülür.
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rss_feed_reader
+import rss_workers
+from feed_server import FeedServer, build_rss
+
+
+# Değişiklikten önceki yol: tüm gövde okunur, feedparser tüm başlıkları ayrıştırır
+def legacy_parse(transport, url, item_cap):
+    body, response_headers, _ = transport.fetch(url)
+    _, records = rss_workers.parse_feed_records(body, response_headers, item_cap=None)
+    return len(body), records, True
+
+
+# Yeni yol: gövde geldikçe ayrıştırılır; hızlı yol kullanılamazsa feedparser
+def streaming_parse(transport, url, item_cap):
+    body, response_headers, stream_parser = transport.fetch(url, item_cap=item_cap)
+    if stream_parser is not None:
+        return len(body), stream_parser.records(), True
+    _, records = rss_workers.parse_feed_records(body, response_headers, item_cap=item_cap)
+    return len(body), records, False
+
+
+def measure(parse, transport, url, item_cap, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        received, records, fast_path = parse(transport, url, item_cap)
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    parse(transport, url, item_cap)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), received, peak, records, fast_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Akarak ayrıştırma benchmark'ı")
+    parser.add_argument("--items", default="200,2000,10000",
+                        help="Sentetik akışların başlık sayıları (virgülle ayrılmış)")
+    parser.add_argument("--item-cap", type=int, default=rss_feed_reader.FEED_ITEM_CAP)
+    parser.add_argument("--recorded-dir", help="Kaydedilmiş akışların dizini")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Sentetik akışlar önceden dosyaya yazılır; böylece sunucunun belgeyi üretmesi
+    # bellek ölçümüne karışmaz
+    cache_dir = tempfile.TemporaryDirectory()
+    synthetic_dir = os.path.join(cache_dir.name, "sentetik")
+    os.makedirs(synthetic_dir)
+    for count in (int(value) for value in args.items.split(",") if value.strip()):
+        with open(os.path.join(synthetic_dir, f"sentetik-{count}.xml"), "wb") as f:
+            f.write(build_rss("buyuk", count))
+    servers = [FeedServer(recorded_dir=synthetic_dir).start()]
+    if args.recorded_dir:
+        servers.append(FeedServer(recorded_dir=args.recorded_dir).start())
+    feeds = [(name, server.url(f"/recorded/{name}")) for server in servers for name in server.recorded_names()]
+
+    try:
+        # Her istek tam yanıt alsın diye önbellek doğrulayıcıları kullanılmaz
+        transport = rss_feed_reader.FeedTransport(cache_file=os.path.join(cache_dir.name, "http.json"),
+                                                  max_bytes=256 * 1024 * 1024)
+        print(f"En yeni {args.item_cap} başlık, {args.repeat} tekrarın ortancası")
+        for label, url in feeds:
+            legacy_time, legacy_bytes, legacy_peak, legacy_records, _ = measure(
+                legacy_parse, transport, url, args.item_cap, args.repeat)
+            stream_time, stream_bytes, stream_peak, stream_records, fast_path = measure(
+                streaming_parse, transport, url, args.item_cap, args.repeat)
+            # Aynı en yeni başlıklar seçilmiş mi (açıklamalardaki bağlantı düzeltmeleri hariç)
+            body, response_headers, _ = transport.fetch(url)
+            _, expected = rss_workers.parse_feed_records(body, response_headers, item_cap=args.item_cap)
+            same = [record[:3] for record in stream_records] == [record[:3] for record in expected]
+            print(f"{label[:32]:<32} eski: {legacy_time * 1000:8.1f} ms {legacy_bytes / 2**20:6.2f} MiB "
+                  f"tepe {legacy_peak / 2**20:6.1f} MiB {len(legacy_records):>6} başlık | "
+                  f"akarak: {stream_time * 1000:7.1f} ms {stream_bytes / 2**20:6.2f} MiB "
+                  f"tepe {stream_peak / 2**20:5.1f} MiB {len(stream_records):>4} başlık, "
+                  f"{'hızlı yol' if fast_path else 'feedparser'}, {'aynı' if same else 'FARKLI'}")
+    finally:
+        for server in servers:
+            server.stop()
+        cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+
+# Ekran, canlı akış veya ses donanımı olmadan sıcak yolları ölçen benchmark takımı:
+#   draw   - ScrollingTextWindow.on_draw, ekran dışı bir cairo ImageSurface üzerine
+#   layout - calculate_title_pixel_positions, 10 - 10.000 başlıklık sentetik akışlar
+#   fetch  - get_rss_feed, gecikme ve hataları ayarlanabilen yerel sunucuya karşı
+#   tts    - speak_text, sahte piper modülü ve aplay komutuyla
+#   startup - modülün içe aktarılma süresi ve ekran varsa ilk kareye kadar geçen süre
+# Her benchmark tepe belleğin (RSS) ayrı ölçülebilmesi için ayrı bir süreçte
+# çalışır. Sonuçlar kayıtlı taban çizgisiyle (baseline.json) karşılaştırılır.
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rss_feed_reader
+from feed_server import FeedServer
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+BENCHMARK_NAMES = ("draw", "layout", "fetch", "tts", "startup")
+# Bu ölçümlerde büyük değer daha iyidir; diğerlerinde küçük değer
+HIGHER_IS_BETTER = {"fps"}
+
+WORDS = ("ekonomi", "seçim", "deprem", "açıklama", "büyükşehir", "milli", "takım", "bakanlık",
+         "piyasa", "dolar", "hava", "durumu", "uyarı", "yağış", "öğrenci", "sınav", "sonuçları",
+         "kritik", "toplantı", "gündem", "iddia", "soruşturma", "maç", "transfer", "İstanbul")
+
+
+def synthetic_entries(count, seed=1):
+    rng = random.Random(seed)
+    return [rss_feed_reader.FeedEntry(" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))),
+                                      f"http://example.invalid/{i}", f"haber-{i}", b"<p>ozet</p>",
+                                      f"http://example.invalid/akis{i % 20}")
+            for i in range(count)]
+
+
+def percentile(values, fraction):
+    return rss_feed_reader.SpeechLatencyStats.percentile(values, fraction)
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Allocation:
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+# Pencerenin bant çizimi ve yerleşimi için kullandığı alanları taşıyan, GTK
+# penceresi gerektirmeyen sahte "self"
+class HeadlessBand:
+
+    SEPARATOR = rss_feed_reader.ScrollingTextWindow.SEPARATOR
+
+    def __init__(self, width, height):
+        self.screen_width = width
+        self.allocation = Allocation(width, height)
+        self.entries = []
+        self.status_message = None
+        self.x_position = width
+        self.title_pixel_positions = []
+        self.title_offset_index = rss_feed_reader.TitleOffsetIndex()
+        self.hovered_title_index = None
+        self.total_text_band_width_px = 0
+        self.band_content_width_px = 0
+        self.layout_font_size = None
+        self.text_measurer = rss_feed_reader.TextMeasurer(self.set_cairo_font_settings,
+                                                          (rss_feed_reader.BAND_FONT_FAMILY, "bold"))
+        self.band_renderer = rss_feed_reader.TextBandRenderer(self.set_cairo_font_settings)
+        self.tile_prerender_pending = False
+        self.metrics = rss_feed_reader.get_metrics()
+        self.metrics_overlay_visible = False
+        self.last_layout_ms = 0.0
+        self.first_frame_drawn = True
+
+    def get_allocation(self):
+        return self.allocation
+
+    def get_app_paintable(self):
+        return True
+
+    def get_scale_factor(self):
+        return 1
+
+
+for method_name in ("measurement_font_size", "set_cairo_font_settings", "calculate_title_pixel_positions",
+                    "record_layout_time", "layout_title_pixel_positions", "append_title_layout",
+                    "update_band_renderer", "prerender_band_tiles", "on_draw"):
+    setattr(HeadlessBand, method_name, getattr(rss_feed_reader.ScrollingTextWindow, method_name))
+
+
+def bench_draw(args):
+    import cairo
+    from gi.repository import GLib
+
+    band = HeadlessBand(args.width, args.height)
+    band.entries = synthetic_entries(args.draw_entries)
+    band.calculate_title_pixel_positions()
+    surface = cairo.ImageSurface(rss_feed_reader.cairo_argb32_format(), args.width, args.height)
+    main_context = GLib.MainContext.default()
+    step = rss_feed_reader.ScrollingTextWindow.SCROLL_SPEED_PX_PER_SEC / 60
+
+    frame_ms = []
+    for _ in range(args.frames):
+        started = time.perf_counter()
+        band.on_draw(None, cairo.Context(surface))
+        surface.flush()
+        # Çizimin boşta çalışmak üzere bıraktığı işler (karo ön çizimi) karenin parçasıdır
+        while main_context.pending():
+            main_context.iteration(False)
+        frame_ms.append((time.perf_counter() - started) * 1000)
+
+        band.x_position -= step
+        if band.x_position + band.total_text_band_width_px < 0:
+            band.x_position = band.screen_width
+
+    total_seconds = sum(frame_ms) / 1000
+    return {
+        "fps": len(frame_ms) / total_seconds if total_seconds else 0.0,
+        "frame_p50_ms": percentile(frame_ms, 0.5),
+        "frame_p95_ms": percentile(frame_ms, 0.95),
+        "frame_p99_ms": percentile(frame_ms, 0.99),
+        "frame_max_ms": max(frame_ms),
+    }
+
+
+# Her boyut repeat kez ölçülür, gürültüye karşı ortanca değer raporlanır
+def bench_layout(args):
+    results = {}
+    for count in args.layout_sizes:
+        entries = synthetic_entries(count)
+        cold_ms = []
+        warm_ms = []
+        for _ in range(args.repeat):
+            band = HeadlessBand(args.width, args.height)
+            band.entries = entries
+            started = time.perf_counter()
+            band.calculate_title_pixel_positions()
+            cold_ms.append((time.perf_counter() - started) * 1000)
+            # Ölçüm önbelleği dolu iken (ör. pencere yeniden boyutlanmadan yenileme)
+            started = time.perf_counter()
+            band.calculate_title_pixel_positions()
+            warm_ms.append((time.perf_counter() - started) * 1000)
+        results[f"layout_{count}_cold_ms"] = percentile(cold_ms, 0.5)
+        results[f"layout_{count}_warm_ms"] = percentile(warm_ms, 0.5)
+    return results
+
+
+def bench_fetch(args):
+    servers = [FeedServer(recorded_dir=args.recorded_dir).start() for _ in range(args.hosts)]
+    cache_dir = tempfile.mkdtemp(prefix="bench-fetch-")
+    try:
+        recorded = servers[0].recorded_names()
+        feeds = []
+        for i in range(args.feeds):
+            server = servers[i % len(servers)]
+            if i < args.failing:
+                query = "status=500"
+            else:
+                query = f"delay={args.latency_ms + (i * 37) % max(1, args.latency_jitter_ms)}"
+            if recorded:
+                feeds.append(server.url(f"/recorded/{recorded[i % len(recorded)]}?{query}&n={i}"))
+            else:
+                feeds.append(server.url(f"/feed/akis{i}?items={args.items}&{query}"))
+
+        transport = rss_feed_reader.FeedTransport(cache_file=os.path.join(cache_dir, "http.json"))
+        health = rss_feed_reader.FeedHealthTracker(os.path.join(cache_dir, "health.json"))
+        results = {}
+        for label in ("cold", "conditional"):
+            started = time.perf_counter()
+            entries = rss_feed_reader.get_rss_feed(feeds, initial_delay=args.retry_delay, transport=transport,
+                                                   health=health)
+            results[f"refresh_{label}_s"] = time.perf_counter() - started
+            results[f"refresh_{label}_entries"] = len(entries or [])
+        rss_feed_reader.get_feed_parse_pool().shutdown()
+        return results
+    finally:
+        for server in servers:
+            server.stop()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+STUB_PIPER_MODULE = """
+import os
+import time
+
+DELAY_PER_CHAR = float(os.environ.get("BENCH_PIPER_DELAY_PER_CHAR", "0.0005"))
+BYTES_PER_CHAR = int(os.environ.get("BENCH_PIPER_BYTES_PER_CHAR", "200"))
+
+
+class PiperVoice:
+
+    @classmethod
+    def load(cls, model_path, config_path=None):
+        return cls()
+
+    def synthesize_stream_raw(self, text, length_scale=1.0):
+        for start in range(0, len(text), 20):
+            part = text[start:start + 20]
+            time.sleep(DELAY_PER_CHAR * len(part))
+            yield bytes(BYTES_PER_CHAR * len(part))
+"""
+
+# Gerçek ses cihazı gibi veriyi gerçek zamanlı tüketir; boru dolunca yazan taraf bekler
+STUB_APLAY = """#!{python}
+import sys
+import time
+BYTES_PER_SECOND = {bytes_per_second}
+while True:
+    data = sys.stdin.buffer.read1({period_bytes})
+    if not data:
+        break
+    time.sleep(len(data) / BYTES_PER_SECOND)
+"""
+
+
+# Sahte piper modülünü ve aplay komutunu hazırla; seslendirme işçisi ve ses
+# çıkışı gerçek sentez ve ses cihazı yerine bunları kullanır
+def install_tts_stubs(stub_dir):
+    python_dir = os.path.join(stub_dir, "python", "piper")
+    bin_dir = os.path.join(stub_dir, "bin")
+    voice_dir = os.path.join(stub_dir, "voice")
+    for path in (python_dir, bin_dir, voice_dir):
+        os.makedirs(path, exist_ok=True)
+    with open(os.path.join(python_dir, "__init__.py"), "w", encoding="utf-8") as f:
+        f.write(STUB_PIPER_MODULE)
+    aplay_path = os.path.join(bin_dir, "aplay")
+    with open(aplay_path, "w", encoding="utf-8") as f:
+        f.write(STUB_APLAY.format(python=sys.executable,
+                                  bytes_per_second=rss_feed_reader.AUDIO_BYTES_PER_SECOND,
+                                  period_bytes=rss_feed_reader.AudioSink().period_bytes))
+    os.chmod(aplay_path, 0o755)
+    for suffix in (".onnx", ".onnx.json"):
+        with open(os.path.join(voice_dir, rss_feed_reader.PIPER_VOICE_NAME + suffix), "wb") as f:
+            f.write(b"{}")
+
+    os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
+    os.environ["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.join(stub_dir, "python"), os.environ.get("PYTHONPATH")]))
+    rss_feed_reader.PIPER_VOICE_DIR = voice_dir
+    rss_feed_reader.speech_cache = rss_feed_reader.SpeechCache(cache_dir=os.path.join(stub_dir, "cache"))
+
+
+def bench_tts(args):
+    stub_dir = tempfile.mkdtemp(prefix="bench-tts-")
+    try:
+        install_tts_stubs(stub_dir)
+        os.environ["BENCH_PIPER_DELAY_PER_CHAR"] = str(args.piper_delay_per_char)
+        os.environ["BENCH_PIPER_BYTES_PER_CHAR"] = str(args.piper_bytes_per_char)
+        titles = [entry.title for entry in synthetic_entries(args.utterances, seed=7)]
+
+        started = time.perf_counter()
+        rss_feed_reader.speak_text("Seslendirme işçisi başlatılıyor.")
+        results = {"tts_cold_start_ms": (time.perf_counter() - started) * 1000}
+
+        for label in ("miss", "hit"):
+            wall_ms = []
+            stats = rss_feed_reader.SpeechLatencyStats()
+            rss_feed_reader.speech_latency_stats = stats
+            for title in titles:
+                started = time.perf_counter()
+                rss_feed_reader.speak_text(title)
+                wall_ms.append((time.perf_counter() - started) * 1000)
+            snapshot = stats.snapshot()
+            results[f"tts_{label}_first_audio_p50_ms"] = snapshot["first_audio_p50_ms"]
+            results[f"tts_{label}_first_audio_p95_ms"] = snapshot["first_audio_p95_ms"]
+            results[f"tts_{label}_wall_p50_ms"] = percentile(wall_ms, 0.5)
+        return results
+    finally:
+        if rss_feed_reader.piper_worker is not None:
+            rss_feed_reader.piper_worker.stop()
+        shutil.rmtree(stub_dir, ignore_errors=True)
+
+
+# Soğuk başlangıç: rss_feed_reader'ı yeni bir süreçte içe aktarma süresi
+# (yorumlayıcının kendi açılışı çıkarılır). Grafik ortam varsa uygulama
+# --measure-startup ile çalıştırılıp ilk karenin süresi de ölçülür.
+def bench_startup(args):
+    package_dir = os.path.dirname(BENCHMARK_DIR)
+    script = os.path.join(package_dir, "rss_feed_reader.py")
+
+    def run_seconds(command):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=package_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return time.perf_counter() - started
+
+    interpreter = [run_seconds([sys.executable, "-c", "pass"]) for _ in range(args.repeat)]
+    imports = [run_seconds([sys.executable, "-c", "import rss_feed_reader"]) for _ in range(args.repeat)]
+    results = {"import_ms": (percentile(imports, 0.5) - percentile(interpreter, 0.5)) * 1000}
+
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        first_frames = []
+        for _ in range(args.repeat):
+            completed = subprocess.run([sys.executable, script, "--measure-startup"], cwd=package_dir,
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=60)
+            lines = completed.stdout.strip().splitlines()
+            if lines:
+                first_frames.append(json.loads(lines[-1])["time_to_first_frame_ms"])
+        if first_frames:
+            results["time_to_first_frame_ms"] = percentile(first_frames, 0.5)
+    return results
+
+
+BENCHMARKS = {"draw": bench_draw, "layout": bench_layout, "fetch": bench_fetch, "tts": bench_tts,
+              "startup": bench_startup}
+
+
+def run_child(name, argv):
+    completed = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name] + argv,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        return {"error": f"çıkış kodu {completed.returncode}"}
+    return json.loads(lines[-1])
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, metrics in results.items():
+        print(f"\n[{name}]")
+        if "error" in metrics:
+            print(f"  başarısız: {metrics['error']}")
+            continue
+        for metric, value in metrics.items():
+            previous = baseline.get(name, {}).get(metric)
+            line = f"  {metric:<32} {value:12.3f}"
+            if isinstance(previous, (int, float)) and previous:
+                change = (value - previous) / previous
+                worse = -change if metric in HIGHER_IS_BETTER else change
+                line += f"   taban {previous:12.3f}  {change:+7.1%}"
+                if worse > tolerance and not metric.endswith("_entries"):
+                    line += "  GERİLEME"
+                    regressions.append(f"{name}.{metric}")
+            print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başsız (headless) benchmark takımı")
+    parser.add_argument("benchmarks", nargs="*", help=f"Çalıştırılacak benchmark'lar ({', '.join(BENCHMARK_NAMES)})")
+    parser.add_argument("--child", choices=BENCHMARK_NAMES, help=argparse.SUPPRESS)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--draw-entries", type=int, default=200)
+    parser.add_argument("--layout-sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--recorded-dir", help="Kaydedilmiş akış dosyalarının dizini")
+    parser.add_argument("--feeds", type=int, default=30)
+    parser.add_argument("--hosts", type=int, default=3)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--failing", type=int, default=2)
+    parser.add_argument("--latency-ms", type=int, default=80)
+    parser.add_argument("--latency-jitter-ms", type=int, default=200)
+    parser.add_argument("--retry-delay", type=float, default=0.2)
+    parser.add_argument("--utterances", type=int, default=10)
+    parser.add_argument("--piper-delay-per-char", type=float, default=0.0005)
+    parser.add_argument("--piper-bytes-per-char", type=int, default=200)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları taban çizgisi olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="İzin verilen gerileme oranı")
+    args = parser.parse_args()
+    unknown = [name for name in args.benchmarks if name not in BENCHMARK_NAMES]
+    if unknown:
+        parser.error(f"bilinmeyen benchmark: {', '.join(unknown)}")
+
+    if args.child:
+        import logging
+        logging.disable(logging.CRITICAL)
+        result = BENCHMARKS[args.child](args)
+        result["peak_rss_mb"] = peak_rss_mb()
+        print(json.dumps(result))
+        return
+
+    child_argv = [arg for arg in sys.argv[1:] if arg not in BENCHMARK_NAMES and arg != "--save-baseline"]
+    results = {name: run_child(name, child_argv) for name in (args.benchmarks or BENCHMARK_NAMES)}
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        baseline.update({name: metrics for name, metrics in results.items() if "error" not in metrics})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nTaban çizgisi kaydedildi: {args.baseline}")
+    elif regressions:
+        print(f"\n{len(regressions)} ölçümde gerileme: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+# Benchmark'lar için yerel RSS sunucusu.
+# Sorgu parametreleriyle yavaş, hatalı veya askıda kalan akışlar taklit edilir:
+#   /feed/<ad>?items=20&delay=150&status=500&hang=1
+# recorded_dir verilirse kaydedilmiş akışlar aynı parametrelerle sunulur:
+#   /recorded/<dosya adı>?delay=150
+
+import argparse
+import hashlib
+import os
+import re
+import threading
+import time
+import urllib.request
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+
+# Sentetik bir RSS 2.0 belgesi üret (başlıklar yeniden eskiye, onar dakika arayla)
+def build_rss(name, items, newest=1750000000):
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0"><channel>',
+        f'<title>{escape(name)}</title>',
+        f'<link>http://example.invalid/{escape(name)}</link>',
+        '<description>Benchmark akışı</description>',
+    ]
+    for i in range(items):
+        description = escape(f'<h4>{name} haber özeti {i}</h4><p>Ayrıntılar <a href="#">burada</a>.</p>')
+        parts.append(
+            '<item>'
+            f'<title>{escape(name)} kaynağından örnek haber başlığı {i}</title>'
+            f'<link>http://example.invalid/{escape(name)}/{i}</link>'
+            f'<guid>{escape(name)}-{i}</guid>'
+            f'<pubDate>{formatdate(newest - i * 600, usegmt=True)}</pubDate>'
+            f'<description>{description}</description>'
+            '</item>'
+        )
+    parts.append('</channel></rss>')
+    return '\n'.join(parts).encode('utf-8')
+
+
+class FeedRequestHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        name = parts.path.rstrip('/').rsplit('/', 1)[-1] or 'feed'
+
+        self.server.request_count += 1
+
+        if query.get('hang'):
+            time.sleep(float(query.get('hang_seconds', 3600)))
+            return
+
+        delay_ms = float(query.get('delay', 0))
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+        status = int(query.get('status', 200))
+        if status != 200:
+            self.send_error(status)
+            return
+
+        if parts.path.startswith('/recorded/'):
+            body = self.server.recorded_feed(name)
+            if body is None:
+                self.send_error(404)
+                return
+        else:
+            body = build_rss(name, int(query.get('items', 20)))
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.server.not_modified_count += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# Arka planda çalışan tek bir yerel sunucu (her biri ayrı bir "host" gibi davranır)
+class FeedServer:
+
+    def __init__(self, host='127.0.0.1', port=0, recorded_dir=None):
+        self.httpd = ThreadingHTTPServer((host, port), FeedRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.request_count = 0
+        self.httpd.not_modified_count = 0
+        self.httpd.recorded_feed = self.recorded_feed
+        self.recorded_dir = recorded_dir
+        self.recorded_cache = {}
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    @property
+    def request_count(self):
+        return self.httpd.request_count
+
+    @property
+    def not_modified_count(self):
+        return self.httpd.not_modified_count
+
+    def recorded_names(self):
+        if not self.recorded_dir:
+            return []
+        return sorted(name for name in os.listdir(self.recorded_dir)
+                      if os.path.isfile(os.path.join(self.recorded_dir, name)))
+
+    def recorded_feed(self, name):
+        if not self.recorded_dir or name not in self.recorded_names():
+            return None
+        if name not in self.recorded_cache:
+            with open(os.path.join(self.recorded_dir, name), 'rb') as f:
+                self.recorded_cache[name] = f.read()
+        return self.recorded_cache[name]
+
+    def url(self, path):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+
+# Canlı akışları benchmark'larda yeniden sunmak üzere dosyaya kaydet
+def record_feeds(urls, recorded_dir):
+    os.makedirs(recorded_dir, exist_ok=True)
+    for index, url in enumerate(urls):
+        name = f"{index:03d}-" + re.sub(r'[^A-Za-z0-9.-]+', '_', urlsplit(url).netloc + urlsplit(url).path)[:80]
+        try:
+            request = urllib.request.Request(url, headers={'User-Agent': 'RSSReadScrollWindow'})
+            with urllib.request.urlopen(request, timeout=20) as response:
+                body = response.read()
+        except Exception as e:
+            print(f"Kaydedilemedi ({url}): {e}")
+            continue
+        with open(os.path.join(recorded_dir, name + ".xml"), 'wb') as f:
+            f.write(body)
+        print(f"Kaydedildi: {url} -> {name}.xml ({len(body)} bayt)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark'lar için yerel RSS sunucusu")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recorded-dir", help="Kaydedilmiş akışların dizini")
+    parser.add_argument("--record", nargs="*", metavar="URL",
+                        help="Verilen (yoksa rss.ini'deki) akışları --recorded-dir dizinine kaydet")
+    args = parser.parse_args()
+
+    if args.record is not None:
+        if not args.recorded_dir:
+            parser.error("--record için --recorded-dir gerekli")
+        urls = args.record
+        if not urls:
+            import configparser
+            config = configparser.ConfigParser()
+            config.read(os.path.expanduser("~/.config/rss.ini"))
+            urls = [url.strip() for url in config.get('RSS', 'feeds', fallback='').split(',') if url.strip()]
+        record_feeds(urls, args.recorded_dir)
+        raise SystemExit(0)
+
+    server = FeedServer(port=args.port, recorded_dir=args.recorded_dir).start()
+    print(f"Yerel RSS sunucusu çalışıyor: {server.url('/feed/ornek?items=20')}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
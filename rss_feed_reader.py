@@ -1,254 +1,3489 @@
 #!/usr/bin/env python3
 
+import time
+# İlk karenin ne kadar sürede çizildiğini ölçmek için başlangıç anı
+STARTUP_TIME = time.monotonic()
+
 import gi
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, Gdk, GLib
-import feedparser
+from gi.repository import Gtk, Gdk, GLib, Gio, Pango
 import subprocess
+import sys
+import select
+import socket
+import socketserver
+import signal
+import argparse
 import logging
 import re
 import threading
-import io
 import cairo
-import time
-import lxml.html
-import webbrowser
 import os
-import requests
 import configparser
-import validators
-import socket
+import io
+import importlib
+import json
+import tempfile
+import sqlite3
+import hashlib
+import html
+import unicodedata
+import zlib
+import pickle
+import resource
+import math
+import bisect
+import heapq
+import random
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit, urljoin
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from rss_workers import (FRAME_HEADER, WEEKDAY_NAMES, FeedParseError, parse_feed_date,
+                         newest_records)
+
+# Log ayarları
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Ağır modülleri ilk kullanıldıklarında içe aktaran vekil. Bant, akış alma,
+# ayrıştırma ve doğrulama yığınları yüklenmeden çizilir; bu modüller ilk
+# ihtiyaç duyulduğunda (çoğunlukla arka plandaki ilk RSS isteğinde) yüklenir.
+class LazyModule:
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    started = time.monotonic()
+                    self._module = importlib.import_module(self._name)
+                    logger.debug(f"{self._name} modülü {(time.monotonic() - started) * 1000:.0f} ms'de yüklendi.")
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+feedparser = LazyModule("feedparser")
+lxml_html = LazyModule("lxml.html")
+requests = LazyModule("requests")
+validators = LazyModule("validators")
+webbrowser = LazyModule("webbrowser")
+
+# Konfigürasyon dosyası ayarları
+CONFIG_DIR = os.path.expanduser("~/.config")
+CONFIG_FILE = os.path.join(CONFIG_DIR, "rss.ini")
+DEFAULT_RSS_URL = "https://www.gercekgundem.com/rss/"
+# Akış listesindeki art arda değişiklikler bu kadar saniye sonra tek seferde kaydedilir
+CONFIG_SAVE_DELAY = 1.0
+
+# Kayan bant yazı tipi
+BAND_FONT_FAMILY = "DejaVu Sans"
+
+# RSS alma ayarları: eşzamanlı iş parçacığı sayısı, aynı sunucuya aynı anda
+# yapılabilecek en fazla istek ve tüm yenileme için toplam süre sınırı (saniye)
+FETCH_MAX_WORKERS = 8
+FETCH_PER_HOST_LIMIT = 2
+FETCH_DEADLINE = 60
+
+# Akış sağlığı (rss.ini'nin yanında saklanır) ve devre kesici: art arda
+# FEED_BREAKER_THRESHOLD yenilemede alınamayan akış karantinaya alınır ve
+# yalnızca her seferinde ikiye katlanan aralıklarla (saniye) denenir
+FEED_HEALTH_FILE = os.path.join(CONFIG_DIR, "rss_health.json")
+FEED_BREAKER_THRESHOLD = 3
+FEED_PROBE_MIN_INTERVAL = 15 * 60
+FEED_PROBE_MAX_INTERVAL = 24 * 60 * 60
+
+# Akış başına uyarlanır yoklama ayarları (saniye): varsayılan, en kısa ve en uzun
+# yoklama aralığı, planlanan zamana eklenen rastgele sapma oranı ve dakikada
+# yapılabilecek en fazla zamanlanmış istek
+POLL_DEFAULT_INTERVAL = 600
+POLL_MIN_INTERVAL = 120
+POLL_MAX_INTERVAL = 2 * 60 * 60
+POLL_JITTER = 0.1
+POLL_MAX_REQUESTS_PER_MINUTE = 20
+
+# HTTP taşıma katmanı ayarları
+USER_AGENT = 'RSSReadScrollWindow'
+HTTP_CACHE_FILE = os.path.join(CONFIG_DIR, "rss_http_cache.json")
+FEED_MAX_BYTES = 5 * 1024 * 1024
+HTTP_TIMEOUT = (5, 20)  # (bağlantı, okuma) saniye
+
+# RSS ayrıştırmanın yapıldığı ayrı süreç sayısı ve bir akışı ayrıştırmak için
+# beklenen en uzun süre (saniye)
+PARSE_WORKERS = 2
+PARSE_TIMEOUT = 30
+
+# Ayrıştırma ve Piper işçilerinin giriş noktası; GTK'yı içe aktarmaz
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rss_workers.py")
+
+# Başlıkların kalıcı olarak saklandığı SQLite veritabanı
+ENTRY_DB_FILE = os.path.join(CONFIG_DIR, "rss_entries.db")
+STORED_ENTRIES_PER_FEED = 50
+
+# Uzun süre çalışan bantta bellekte tutulacak başlık sınırları: akış başına en
+# fazla başlık (STORED_ENTRIES_PER_FEED), en yüksek yaş (saniye) ve toplam sınır
+ENTRY_MAX_AGE = 3 * 24 * 60 * 60
+ENTRY_GLOBAL_CAP = 1500
+
+# Akış başına ayrıştırılan en fazla başlık (en yeniler). RSS 2.0 ve Atom akışları
+# indirilirken ayrıştırılır; bu sayıya ulaşılınca akışın kalanı okunmaz.
+FEED_ITEM_CAP = STORED_ENTRIES_PER_FEED
+
+# Piper ses modeli ve sentez ayarları
+PIPER_VOICE_DIR = os.path.join(os.path.expanduser("~"), "piper-voices", "tr", "tr_TR", "fettah", "medium")
+PIPER_VOICE_BASE_URL = "https://huggingface.co/rhasspy/piper-voices/raw/main/tr/tr_TR/fettah/medium/"
+PIPER_VOICE_NAME = "tr_TR-fettah-medium"
+PIPER_LENGTH_SCALE = 0.733
+PIPER_TIMEOUT = 15
+
+# Ses çıkışı ayarları (Piper ham çıktısı: 22050 Hz, 16 bit, mono)
+AUDIO_SAMPLE_RATE = 22050
+AUDIO_BYTES_PER_SECOND = AUDIO_SAMPLE_RATE * 2
+AUDIO_BUFFER_TIME_US = 200000
+AUDIO_PERIOD_TIME_US = 50000
+# Önbellekten oynatılan sesin ses çıkışına yazıldığı parça boyu (Piper
+# komutunun parçalarıyla aynı, örnek hizası için çift)
+SPEECH_CHUNK_BYTES = 16384
+
+# Sentezlenmiş seslerin önbelleği: diskte boyut sınırlı LRU, bellekte küçük bir sıcak küme
+SPEECH_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                                "rss_feed_reader", "tts")
+SPEECH_CACHE_MAX_BYTES = 200 * 1024 * 1024
+SPEECH_CACHE_MEMORY_BYTES = 16 * 1024 * 1024
+
+# Çalışma zamanı ölçümlerinin Prometheus metin biçiminde sunulduğu yerel adres;
+# port 0 ise sunucu başlatılmaz
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9478
+
+# Aynı oturumdaki pencerelerin bağlandığı ortak arka plan servisinin soketi.
+# Servis akışları bir kez alır ve tek seslendirme kuyruğunu yönetir; aynı başlık
+# farklı pencerelerden DAEMON_SPEECH_REPEAT_WINDOW saniye içinde yeniden istenirse
+# bir kez seslendirilir.
+DAEMON_SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+                                  f"rss_feed_reader-{os.getuid()}.sock")
+DAEMON_SPEECH_REPEAT_WINDOW = 120
+
+# Çalışma zamanı ölçümleri: (ad, tür, açıklama, histogram kova sınırları)
+FRAME_BUCKETS = (0.004, 0.008, 0.0125, 0.0167, 0.025, 0.0333, 0.05, 0.1, 0.25)
+DRAW_BUCKETS = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.0167, 0.0333, 0.1)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+METRIC_DEFINITIONS = (
+    ("rss_frame_interval_seconds", "histogram", "Ardışık kareler arasındaki süre", FRAME_BUCKETS),
+    ("rss_frame_update_seconds", "histogram", "update_position süresi", DRAW_BUCKETS),
+    ("rss_draw_seconds", "histogram", "on_draw süresi", DRAW_BUCKETS),
+    ("rss_layout_seconds", "histogram", "Başlık ölçümü ve yerleşim süresi", DURATION_BUCKETS),
+    ("rss_feed_fetch_seconds", "histogram", "Akış indirme süresi", DURATION_BUCKETS),
+    ("rss_feed_parse_seconds", "histogram", "Akış ayrıştırma süresi", DURATION_BUCKETS),
+    ("rss_feed_bytes_total", "counter", "İndirilen akış gövdesi baytı", None),
+    ("rss_feed_responses_total", "counter", "Akış yanıtları (durum: 200, 304, error)", None),
+    ("rss_filtered_entries_total", "counter", "Anahtar kelime kurallarıyla atılan başlıklar", None),
+    ("rss_tts_synthesis_seconds", "histogram", "Piper sentez süresi", DURATION_BUCKETS),
+    ("rss_tts_first_audio_seconds", "histogram", "Seslendirme isteğinden ilk sese kadar geçen süre",
+     DURATION_BUCKETS),
+    ("rss_tts_playback_end_seconds", "histogram", "Seslendirme isteğinden oynatmanın sonuna kadar geçen süre",
+     DURATION_BUCKETS),
+    ("rss_tts_queue_depth", "gauge", "Oynatılmayı bekleyen başlık sayısı", None),
+    ("rss_band_entries", "gauge", "Bantta gösterilen başlık sayısı", None),
+    ("rss_daemon_clients", "gauge", "Ortak servise bağlı pencere sayısı", None),
+    ("process_resident_memory_bytes", "gauge", "Sürecin bellekte yerleşik boyutu (RSS)", None),
+    ("rss_time_to_first_frame_seconds", "gauge", "Süreç başlangıcından ilk çizilen kareye kadar geçen süre", None),
+)
+
+# Sayaç, gösterge ve histogramlardan oluşan basit ölçüm kaydı.
+# Değerler etiketlere göre ayrı tutulur; render() Prometheus metin biçimini
+# üretir. Toplayıcılar (collector) yalnızca okuma sırasında çağrılır.
+class MetricsRegistry:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.definitions = OrderedDict()  # ad -> (tür, açıklama, kovalar)
+        self.values = OrderedDict()  # (ad, etiketler) -> sayı veya [kova sayıları, toplam, adet]
+        self.collectors = []
+
+    def describe(self, name, metric_type, help_text, buckets=None):
+        self.definitions[name] = (metric_type, help_text, tuple(buckets) if buckets else None)
+
+    def add_collector(self, collector):
+        self.collectors.append(collector)
+
+    @staticmethod
+    def label_key(labels):
+        return tuple(sorted(labels.items()))
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, self.label_key(labels))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.values[(name, self.label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        buckets = self.definitions[name][2]
+        key = (name, self.label_key(labels))
+        with self.lock:
+            histogram = self.values.get(key)
+            if histogram is None:
+                histogram = self.values[key] = [[0] * len(buckets), 0.0, 0]
+            index = bisect.bisect_left(buckets, value)
+            if index < len(buckets):
+                histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    # Histogramdan kova sınırları arasında doğrusal aradeğerleme ile yüzdelik tahmini
+    def quantile(self, name, fraction, **labels):
+        buckets = self.definitions[name][2]
+        with self.lock:
+            histogram = self.values.get((name, self.label_key(labels)))
+            if not histogram or not histogram[2]:
+                return None
+            counts, _, total = histogram[0][:], histogram[1], histogram[2]
+        rank = fraction * total
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(buckets, counts):
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return buckets[-1]
+
+    @staticmethod
+    def format_labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ""
+        escaped = (f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+                   for key, value in pairs)
+        return "{" + ",".join(escaped) + "}"
+
+    def render(self):
+        for collector in self.collectors:
+            try:
+                collector(self)
+            except Exception as e:
+                logger.error(f"Ölçüm toplayıcısı hatası: {e}")
+
+        lines = []
+        with self.lock:
+            for name, (metric_type, help_text, buckets) in self.definitions.items():
+                series = [(labels, value) for (metric, labels), value in self.values.items() if metric == name]
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in series:
+                    if metric_type != "histogram":
+                        lines.append(f"{name}{self.format_labels(labels)} {value}")
+                        continue
+                    counts, total, count = value
+                    cumulative = 0
+                    for upper, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{self.format_labels(labels, [('le', upper)])} {cumulative}")
+                    lines.append(f"{name}_bucket{self.format_labels(labels, [('le', '+Inf')])} {count}")
+                    lines.append(f"{name}_sum{self.format_labels(labels)} {total}")
+                    lines.append(f"{name}_count{self.format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+# Sürecin bellekte yerleşik boyutu (bayt)
+def resident_memory_bytes():
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # /proc yoksa en azından tepe değeri bildir
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+metrics_registry = None
+metrics_registry_lock = threading.Lock()
+
+def get_metrics():
+    global metrics_registry
+    with metrics_registry_lock:
+        if metrics_registry is None:
+            metrics_registry = MetricsRegistry()
+            for name, metric_type, help_text, buckets in METRIC_DEFINITIONS:
+                metrics_registry.describe(name, metric_type, help_text, buckets)
+            metrics_registry.add_collector(
+                lambda registry: registry.set("process_resident_memory_bytes", resident_memory_bytes()))
+        return metrics_registry
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = get_metrics().render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# Ölçümleri http://METRICS_HOST:port/metrics adresinde sunan sunucuyu arka planda başlat
+def start_metrics_server(port=METRICS_PORT, host=METRICS_HOST):
+    if not port:
+        return None
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    except OSError as e:
+        logger.warning(f"Ölçüm sunucusu başlatılamadı ({host}:{port}): {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    logger.info(f"Ölçümler http://{host}:{server.server_address[1]}/metrics adresinde sunuluyor.")
+    return server
+
+# Tüm seslendirmelerin aktığı tek ve kalıcı ses çıkışı.
+# Her başlık için yeni bir aplay başlatmak yerine tek bir aplay süreci açık
+# tutulur ve Piper'dan gelen PCM parçaları üretildikçe doğrudan ona yazılır.
+# Boru üzerinden oynatmanın ne zaman bittiği bilinemediği için, yazılan bayt
+# miktarından bir oynatma bitiş zamanı tahmini tutulur.
+class AudioSink:
+
+    IGNORED_STDERR_PREFIXES = ("Playing raw data", "underrun")
+
+    def __init__(self):
+        self.process = None
+        self.lock = threading.Lock()
+        self.play_until = 0.0
+        # Bir periyodu dolduramayan son parça aplay'de beklemesin diye her
+        # cümlenin sonuna iki periyotluk sessizlik eklenir
+        period_bytes = AUDIO_BYTES_PER_SECOND * AUDIO_PERIOD_TIME_US // 1_000_000
+        self.period_bytes = period_bytes + period_bytes % 2
+        self.flush_padding = bytes(2 * self.period_bytes)
+
+    def command(self):
+        return ["aplay", "-q", "-r", str(AUDIO_SAMPLE_RATE), "-f", "S16_LE", "-t", "raw", "-c", "1",
+                f"--buffer-time={AUDIO_BUFFER_TIME_US}", f"--period-time={AUDIO_PERIOD_TIME_US}", "-"]
+
+    def ensure_running(self):
+        if self.process and self.process.poll() is None:
+            return
+        if self.process:
+            logger.warning(f"aplay süreci sonlanmış (çıkış kodu {self.process.returncode}), yeniden başlatılıyor.")
+        self.process = subprocess.Popen(self.command(), stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+        self.play_until = 0.0
+        threading.Thread(target=self.drain_stderr, args=(self.process,), daemon=True).start()
+
+    def drain_stderr(self, process):
+        for line in process.stderr:
+            line = line.decode('utf-8', errors='ignore').strip()
+            if line and not line.startswith(self.IGNORED_STDERR_PREFIXES):
+                logger.error(f"Aplay stderr: {line}")
+
+    # PCM parçasını kopyalamadan, periyot boyunda dilimler halinde ses çıkışına
+    # yaz ve tahmini bitiş zamanını döndür. Boru ve aplay tamponu doluyken yazma,
+    # önceki ses çalınana kadar bekler; bu bekleme play_until'de zaten hesaba
+    # katıldığından zaman yazmadan önce okunur.
+    def write(self, chunk):
+        view = memoryview(chunk)
+        with self.lock:
+            for start in range(0, len(view), self.period_bytes):
+                piece = view[start:start + self.period_bytes]
+                now = time.monotonic()
+                for attempt in range(2):
+                    try:
+                        self.ensure_running()
+                        self.process.stdin.write(piece)
+                        break
+                    except (BrokenPipeError, OSError) as e:
+                        logger.error(f"Ses çıkışına yazılamadı: {e}")
+                        if self.process:
+                            self.process.kill()
+                            self.process.wait()
+                        if attempt:
+                            raise
+                self.play_until = max(now, self.play_until) + len(piece) / AUDIO_BYTES_PER_SECOND
+            return self.play_until
+
+    # Cümle bittiğinde kalan sesi oynatmaya zorla, tahmini bitiş zamanını döndür
+    def end_utterance(self):
+        play_until = self.play_until
+        self.write(self.flush_padding)
+        return play_until
+
+    def wait_until(self, play_until):
+        remaining = play_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def stop(self):
+        with self.lock:
+            process = self.process
+            self.process = None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
+
+audio_sink = None
+audio_sink_lock = threading.Lock()
+
+def get_audio_sink():
+    global audio_sink
+    with audio_sink_lock:
+        if audio_sink is None:
+            audio_sink = AudioSink()
+        return audio_sink
+
+# Ses cihazını başlatmak için kalıcı ses çıkışını aç ve ses modelini bir kez
+# doğrula; ikisi de arka planda, ilk başlık seslendirilmeden önce yapılır
+def initialize_audio():
+    try:
+        sink = get_audio_sink()
+        with sink.lock:
+            sink.ensure_running()
+    except FileNotFoundError:
+        logger.error("aplay komutu bulunamadı. Lütfen aplay'in yüklü olduğundan emin olun.")
+    except Exception as e:
+        logger.error(f"Ses cihazı başlatma hatası: {e}")
+    ensure_voice_model()
+
+# Başarısız bir model indirmesinin en erken ne zaman yeniden deneneceği (saniye)
+VOICE_MODEL_RETRY_INTERVAL = 300
+voice_model_files = None
+voice_model_failed_at = None
+voice_model_lock = threading.Lock()
+
+# Ses modelinin dosya yollarını döndür. Dosyalar süreç başına bir kez doğrulanır
+# (gerekirse indirilir) ve sonuç saklanır; başlık başına dosya sistemi veya ağ
+# erişimi yapılmaz. İndirme başarısız olduysa bir süre yeniden denenmez.
+def ensure_voice_model():
+    global voice_model_files, voice_model_failed_at
+    with voice_model_lock:
+        if voice_model_files is not None:
+            return voice_model_files
+        if (voice_model_failed_at is not None
+                and time.monotonic() - voice_model_failed_at < VOICE_MODEL_RETRY_INTERVAL):
+            return None
+        model_files = provision_voice_model()
+        if model_files is None:
+            voice_model_failed_at = time.monotonic()
+        else:
+            voice_model_files = model_files
+        return model_files
+
+# Piper ses modelini ve yapılandırmasını gerekirse indir, dosya yollarını döndür
+def provision_voice_model():
+    try:
+        os.makedirs(PIPER_VOICE_DIR, exist_ok=True)
+    except OSError as e:
+        logger.error(f"Ses modeli dizini oluşturulamadı ({PIPER_VOICE_DIR}): {e}")
+        return None
+
+    model_files = {
+        "model": {
+            "url": PIPER_VOICE_BASE_URL + PIPER_VOICE_NAME + ".onnx",
+            "path": os.path.join(PIPER_VOICE_DIR, PIPER_VOICE_NAME + ".onnx")
+        },
+        "config": {
+            "url": PIPER_VOICE_BASE_URL + PIPER_VOICE_NAME + ".onnx.json",
+            "path": os.path.join(PIPER_VOICE_DIR, PIPER_VOICE_NAME + ".onnx.json")
+        }
+    }
+
+    for file_type, file_info in model_files.items():
+        if not os.path.exists(file_info["path"]):
+            logger.info(f"{file_type} dosyası indiriliyor: {file_info['url']}")
+            try:
+                response = requests.get(file_info["url"], stream=True, timeout=10)
+                response.raise_for_status()
+                # Yarım kalan bir indirme sonraki açılışta geçerli model sanılmasın
+                partial_path = file_info["path"] + ".part"
+                with open(partial_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.replace(partial_path, file_info["path"])
+                logger.info(f"{file_type} dosyası indirildi: {file_info['path']}")
+            except Exception as e:
+                logger.error(f"{file_type} dosyası indirilemedi: {e}")
+                return None
+
+    return {file_type: file_info["path"] for file_type, file_info in model_files.items()}
+
+# Seslendirme gecikmesi ölçümleri: ilk sese kadar geçen süre ve istekten
+# oynatmanın bitişine kadar geçen süre
+class SpeechLatencyStats:
+
+    WINDOW_SIZE = 200
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_audio = deque(maxlen=self.WINDOW_SIZE)
+        self.playback_end = deque(maxlen=self.WINDOW_SIZE)
+        self.total_requests = 0
+
+    def record(self, first_audio_seconds, playback_end_seconds):
+        with self.lock:
+            self.total_requests += 1
+            if first_audio_seconds is not None:
+                self.first_audio.append(first_audio_seconds)
+            if playback_end_seconds is not None:
+                self.playback_end.append(playback_end_seconds)
+        metrics = get_metrics()
+        if first_audio_seconds is not None:
+            metrics.observe("rss_tts_first_audio_seconds", first_audio_seconds)
+        if playback_end_seconds is not None:
+            metrics.observe("rss_tts_playback_end_seconds", playback_end_seconds)
+        logger.debug(f"Seslendirme gecikmesi: ilk ses "
+                     f"{first_audio_seconds * 1000 if first_audio_seconds is not None else float('nan'):.0f} ms, "
+                     f"oynatma sonu "
+                     f"{playback_end_seconds * 1000 if playback_end_seconds is not None else float('nan'):.0f} ms")
+
+    @staticmethod
+    def percentile(values, fraction):
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'total_requests': self.total_requests,
+                'first_audio_p50_ms': self.percentile(self.first_audio, 0.5) * 1000,
+                'first_audio_p95_ms': self.percentile(self.first_audio, 0.95) * 1000,
+                'playback_end_p50_ms': self.percentile(self.playback_end, 0.5) * 1000,
+                'playback_end_p95_ms': self.percentile(self.playback_end, 0.95) * 1000,
+            }
+
+speech_latency_stats = SpeechLatencyStats()
+
+# İşçi sürecinin çıktısından tam olarak size bayt oku; veri tek bir tampona
+# doğrudan okunur. deadline geçerse TimeoutError, süreç kapanırsa EOFError.
+def read_pipe_exact(stream, size, deadline):
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("İşçi süreci zaman aşımına uğradı.")
+        ready, _, _ = select.select([stream], [], [], remaining)
+        if not ready:
+            continue
+        count = stream.readinto(view[received:])
+        if not count:
+            raise EOFError("İşçi süreci beklenmedik şekilde kapandı.")
+        received += count
+    return data
+
+# Kalıcı Piper sentez süreci.
+# Ses modeli yalnızca bir kez yüklenir; metinler süreç girişine satır satır
+# (JSON) yazılır, ham PCM ses ise uzunluk önekli parçalar halinde geri akar.
+# Sıfır uzunluklu parça cümlenin bittiğini bildirir. Süreç çökerse bir sonraki
+# istekte yeniden başlatılır.
+class PiperWorker:
+
+    RESTART_DELAY = 2
+
+    def __init__(self, model_path, config_path, length_scale=PIPER_LENGTH_SCALE, timeout=PIPER_TIMEOUT):
+        self.model_path = model_path
+        self.config_path = config_path
+        self.length_scale = length_scale
+        self.timeout = timeout
+        self.process = None
+        self.lock = threading.Lock()
+        self.last_start_time = 0
+        self.restart_count = 0
+
+    def command(self):
+        return [sys.executable, WORKER_SCRIPT, "--tts-worker",
+                "--model", self.model_path, "--config", self.config_path,
+                "--length-scale", str(self.length_scale)]
+
+    def ensure_running(self):
+        if self.process and self.process.poll() is None:
+            return
+        if self.process:
+            logger.warning(f"Piper süreci sonlanmış (çıkış kodu {self.process.returncode}), yeniden başlatılıyor.")
+            self.restart_count += 1
+            # Sürekli çöken bir süreci art arda başlatmaktan kaçın
+            wait_time = self.last_start_time + self.RESTART_DELAY - time.monotonic()
+            if wait_time > 0:
+                time.sleep(wait_time)
+        self.last_start_time = time.monotonic()
+        self.process = subprocess.Popen(self.command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+
+    def stop(self):
+        process = self.process
+        self.process = None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
+
+    # Metni sentezle; her PCM parçası geldikçe on_chunk çağrılır
+    def synthesize(self, text, on_chunk):
+        with self.lock:
+            try:
+                self.ensure_running()
+                request = json.dumps({"text": text}, ensure_ascii=False) + "\n"
+                self.process.stdin.write(request.encode("utf-8"))
+                self.process.stdin.flush()
+
+                deadline = time.monotonic() + self.timeout
+                stdout = self.process.stdout
+                while True:
+                    (size,) = FRAME_HEADER.unpack(read_pipe_exact(stdout, FRAME_HEADER.size, deadline))
+                    if size == 0:
+                        return True
+                    on_chunk(read_pipe_exact(stdout, size, deadline))
+            except Exception as e:
+                logger.error(f"Piper sentez hatası: {e}")
+                if self.process:
+                    self.process.kill()
+                    self.process.wait()
+                return False
+
+piper_worker = None
+piper_worker_lock = threading.Lock()
+
+def get_piper_worker(model_files):
+    global piper_worker
+    with piper_worker_lock:
+        if piper_worker is None:
+            piper_worker = PiperWorker(model_files["model"], model_files["config"])
+        return piper_worker
+
+# Sentezlenmiş PCM sesleri metin ve ses ayarlarının özetine göre saklayan önbellek.
+# Aynı başlık her bant turunda ve yenilemede tekrar geldiği için tekrarlar
+# Piper çalıştırılmadan doğrudan oynatılır. Disk tarafı boyut sınırlı bir LRU'dur
+# (en eski dokunulan dosyalar silinir), sık kullanılanlar ayrıca bellekte tutulur.
+class SpeechCache:
+
+    def __init__(self, cache_dir=SPEECH_CACHE_DIR, max_bytes=SPEECH_CACHE_MAX_BYTES,
+                 memory_bytes=SPEECH_CACHE_MEMORY_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_limit = memory_bytes
+        self.lock = threading.Lock()
+        self.disk_index = OrderedDict()  # anahtar -> bayt, en eski dokunulan başta
+        self.disk_bytes = 0
+        self.memory = OrderedDict()  # anahtar -> PCM
+        self.memory_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.load_index()
+
+    def load_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pcm"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(files):
+            self.disk_index[key] = size
+            self.disk_bytes += size
+        self.evict_disk()
+
+    @staticmethod
+    def normalize(text):
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    # Anahtar: normalize edilmiş metin ile ses modeli ve sentez parametrelerinin özeti
+    def key(self, text, model_files, length_scale=PIPER_LENGTH_SCALE):
+        parts = [self.normalize(text), os.path.basename(model_files["model"]),
+                 str(length_scale), str(AUDIO_SAMPLE_RATE)]
+        try:
+            stat = os.stat(model_files["model"])
+            parts.append(f"{stat.st_size}:{int(stat.st_mtime)}")
+        except OSError:
+            pass
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key + ".pcm")
+
+    def contains(self, key):
+        with self.lock:
+            return key in self.memory or key in self.disk_index
+
+    def get(self, key):
+        with self.lock:
+            audio = self.memory.get(key)
+            if audio is not None:
+                self.memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+            on_disk = key in self.disk_index
+
+        if on_disk:
+            try:
+                with open(self.path(key), "rb") as f:
+                    audio = f.read()
+                os.utime(self.path(key))
+            except OSError:
+                audio = None
+
+        with self.lock:
+            if audio is None:
+                if on_disk:
+                    self.forget_disk(key)
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            if key in self.disk_index:
+                self.disk_index.move_to_end(key)
+            self.remember_in_memory(key, audio)
+            return audio
+
+    def put(self, key, audio):
+        try:
+            write_file_atomic(self.path(key), audio)
+        except OSError as e:
+            logger.error(f"Ses önbelleğine yazılamadı: {e}")
+            return
+        with self.lock:
+            self.forget_disk(key)
+            self.disk_index[key] = len(audio)
+            self.disk_bytes += len(audio)
+            self.remember_in_memory(key, audio)
+            self.evict_disk()
+
+    def remember_in_memory(self, key, audio):
+        if len(audio) > self.memory_limit:
+            return
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        self.memory[key] = audio
+        self.memory_bytes += len(audio)
+        while self.memory_bytes > self.memory_limit:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+
+    def forget_disk(self, key):
+        size = self.disk_index.pop(key, None)
+        if size is not None:
+            self.disk_bytes -= size
+
+    def evict_disk(self):
+        while self.disk_bytes > self.max_bytes and self.disk_index:
+            key, size = self.disk_index.popitem(last=False)
+            self.disk_bytes -= size
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+
+    def snapshot(self):
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                'memory_bytes': self.memory_bytes,
+                'disk_bytes': self.disk_bytes,
+                'disk_entries': len(self.disk_index),
+            }
+
+speech_cache = None
+speech_cache_lock = threading.Lock()
+
+def get_speech_cache():
+    global speech_cache
+    with speech_cache_lock:
+        if speech_cache is None:
+            speech_cache = SpeechCache()
+        return speech_cache
+
+# Seslendirilecek metni temizle; seslendirmeye uygun değilse None döndür
+def prepare_speech_text(text):
+    if not text or text.isspace() or re.fullmatch(r'[- .]*', text):
+        return None
+    cleaned_text = re.sub(r'\s*----------\s*', '. ', text).strip()
+    if len(cleaned_text) < 10:
+        return None
+    return cleaned_text
+
+# Metni oynatmadan sentezleyip ses önbelleğine koy (ön sentez)
+def presynthesize_text(text):
+    cleaned_text = prepare_speech_text(text)
+    if not cleaned_text:
+        return
+    try:
+        model_files = ensure_voice_model()
+        if not model_files:
+            return
+        cache = get_speech_cache()
+        cache_key = cache.key(cleaned_text, model_files)
+        if cache.contains(cache_key):
+            return
+        audio_chunks = []
+        if get_piper_worker(model_files).synthesize(cleaned_text, audio_chunks.append) and audio_chunks:
+            cache.put(cache_key, b"".join(audio_chunks))
+    except Exception as e:
+        logger.error(f"Ön sentez hatası: {e}")
+
+# Metni seslendirme fonksiyonu (RAM'de işleme)
+def speak_text(text):
+    cleaned_text = prepare_speech_text(text)
+    if not cleaned_text:
+        return
+
+    try:
+        model_files = ensure_voice_model()
+        if not model_files:
+            return
+
+        requested_at = time.monotonic()
+        first_audio_at = None
+        sink_failed = False
+        sink = get_audio_sink()
+        cache = get_speech_cache()
+        cache_key = cache.key(cleaned_text, model_files)
+        cached_audio = cache.get(cache_key)
+
+        if cached_audio is not None:
+            # Önbellekte varsa Piper hiç çalıştırılmadan doğrudan oynat
+            logger.debug(f"Ses önbellekten oynatılıyor (isabet oranı {cache.snapshot()['hit_rate']:.0%}).")
+            first_audio_at = time.monotonic()
+            audio = memoryview(cached_audio)
+            try:
+                # Sentez yolundaki gibi parça parça yaz; uzun sesler tek yazımda beklemez
+                for start in range(0, len(audio), SPEECH_CHUNK_BYTES):
+                    sink.write(audio[start:start + SPEECH_CHUNK_BYTES])
+            except OSError:
+                return
+        else:
+            audio_chunks = []
+
+            # Piper'ın ürettiği her parça beklemeden ve kopyalanmadan ses çıkışına akar
+            def on_chunk(chunk):
+                nonlocal first_audio_at, sink_failed
+                if first_audio_at is None:
+                    first_audio_at = time.monotonic()
+                audio_chunks.append(chunk)
+                if sink_failed:
+                    return
+                try:
+                    sink.write(chunk)
+                except OSError:
+                    sink_failed = True
+
+            synthesis_started = time.monotonic()
+            synthesized = get_piper_worker(model_files).synthesize(cleaned_text, on_chunk)
+            get_metrics().observe("rss_tts_synthesis_seconds", time.monotonic() - synthesis_started)
+
+            if synthesized and audio_chunks:
+                cache.put(cache_key, b"".join(audio_chunks))
+            if sink_failed:
+                return
+            if first_audio_at is None:
+                if synthesized:
+                    logger.warning("Piper'dan ses verisi alınamadı.")
+                return
+
+        play_until = sink.end_utterance()
+        sink.wait_until(play_until)
+        speech_latency_stats.record(first_audio_at - requested_at, play_until - requested_at)
+
+    except FileNotFoundError:
+        logger.error("Piper veya aplay komutu bulunamadı. Lütfen kurulu olduklarından ve PATH'inizde olduklarından veya tam yolların doğru olduğundan emin olun.")
+    except Exception as e:
+        logger.error(f"Seslendirme hatası: {e}")
+
+# Konfigürasyonu geçici dosya üzerinden atomik olarak yaz; yazım yarıda kalırsa
+# eski dosya bozulmadan kalır
+def write_config(config):
+    buffer = io.StringIO()
+    config.write(buffer)
+    write_file_atomic(CONFIG_FILE, buffer.getvalue().encode("utf-8"))
+
+# Konfigürasyon dosyasını oku ve varsayılan RSS adresini ekle
+def load_rss_feeds():
+    # Adreslerdeki % karakterleri (ör. %20) değişken sanılmasın diye interpolation kapalı
+    config = configparser.ConfigParser(interpolation=None)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+
+    if not os.path.exists(CONFIG_FILE):
+        config['RSS'] = {'feeds': DEFAULT_RSS_URL}
+        write_config(config)
+        logger.info(f"Konfigürasyon dosyası oluşturuldu: {CONFIG_FILE}")
+    else:
+        config.read(CONFIG_FILE)
+        if 'RSS' not in config or 'feeds' not in config['RSS']:
+            config['RSS'] = {'feeds': DEFAULT_RSS_URL}
+            write_config(config)
+            logger.info(f"Konfigürasyon dosyasına varsayılan RSS adresi eklendi.")
+
+    feeds = config['RSS'].get('feeds', DEFAULT_RSS_URL).split(',')
+    feeds = [feed.strip() for feed in feeds if feed.strip()]
+    if not feeds:
+        feeds = [DEFAULT_RSS_URL]
+    return feeds
+
+# Konfigürasyon dosyasına RSS feed'lerini atomik olarak kaydet; dosyadaki
+# diğer bölümler korunur
+def save_rss_feeds(feeds):
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(CONFIG_FILE)
+    if 'RSS' not in config:
+        config['RSS'] = {}
+    config['RSS']['feeds'] = ','.join(feeds)
+    write_config(config)
+    logger.info(f"{len(feeds)} RSS feed'i kaydedildi: {CONFIG_FILE}")
+
+# Akış listesi yazımlarını birleştiren yazıcı (ana döngüde kullanılır). Bir
+# akışı birkaç sıra taşımak gibi art arda yapılan değişiklikler, son değişiklikten
+# delay saniye sonra tek bir atomik yazımla kaydedilir.
+class FeedListWriter:
+
+    def __init__(self, delay=CONFIG_SAVE_DELAY):
+        self.delay = delay
+        self.pending = None
+        self.source_id = None
+
+    def schedule(self, feeds):
+        self.pending = list(feeds)
+        if self.source_id is not None:
+            GLib.source_remove(self.source_id)
+        self.source_id = GLib.timeout_add(int(self.delay * 1000), self.on_timeout)
+
+    def on_timeout(self):
+        self.source_id = None
+        self.flush()
+        return False
+
+    # Bekleyen değişikliği hemen yaz (ör. çıkışta veya ortak servis okumadan önce)
+    def flush(self):
+        if self.source_id is not None:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+        if self.pending is None:
+            return
+        feeds, self.pending = self.pending, None
+        try:
+            save_rss_feeds(feeds)
+        except Exception as e:
+            logger.error(f"RSS feed'leri kaydedilemedi ({CONFIG_FILE}): {e}")
+
+# OPML dosyasındaki akış adreslerini (iç içe kategoriler dahil) belge sırasıyla oku
+def read_opml_feeds(path):
+    tree = ElementTree.parse(path)
+    return [outline.get("xmlUrl").strip() for outline in tree.iter("outline")
+            if outline.get("xmlUrl", "").strip()]
+
+# İçe aktarılacak adresleri toplu doğrula: (geçerli, yinelenen, geçersiz) listeleri
+def validate_feed_urls(urls, existing_feeds):
+    seen = set(existing_feeds)
+    valid, duplicates, invalid = [], [], []
+    for url in urls:
+        if url in seen:
+            duplicates.append(url)
+        elif urlsplit(url).scheme not in ("http", "https") or not validators.url(url):
+            invalid.append(url)
+        else:
+            seen.add(url)
+            valid.append(url)
+    return valid, duplicates, invalid
+
+# Akış listesini OPML 2.0 olarak atomik biçimde yaz
+def write_opml_feeds(path, feeds):
+    opml = ElementTree.Element("opml", version="2.0")
+    head = ElementTree.SubElement(opml, "head")
+    ElementTree.SubElement(head, "title").text = "Kayan Haberler"
+    ElementTree.SubElement(head, "dateCreated").text = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime())
+    body = ElementTree.SubElement(opml, "body")
+    for url in feeds:
+        ElementTree.SubElement(body, "outline", type="rss", text=url, xmlUrl=url)
+    ElementTree.indent(opml)
+    write_file_atomic(path, ElementTree.tostring(opml, encoding="utf-8", xml_declaration=True) + b"\n")
+
+# Dosyayı önce geçici bir dosyaya yazıp sonra yerine taşıyarak atomik olarak kaydet.
+# mkstemp dosyayı 0600 ile açtığından eski dosyanın izinleri (yoksa open() ile
+# oluşturulacak dosyanınkiler) korunur.
+def write_file_atomic(path, data):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~FILE_UMASK
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+# os.umask yalnızca değiştirilerek okunabilir; iş parçacıkları başlamadan bir kez okunur
+FILE_UMASK = os.umask(0)
+os.umask(FILE_UMASK)
+
+# Ağ bağlantısı durumunu ana döngüyü engellemeden izler.
+# Etkin bir soket denemesi yapmak yerine pasif sinyaller kullanılır: sistemin
+# Gio.NetworkMonitor bildirimleri ile gerçek RSS isteklerinin başarılı veya
+# başarısız olması. Bağlantı yokken akışlar üstel artan aralıklarla yeniden
+# denenir. Durum değişiklikleri ana döngüye GLib.idle_add ile iletilir.
+class ConnectivityMonitor:
+
+    MIN_RETRY_INTERVAL = 10
+    MAX_RETRY_INTERVAL = 300
+
+    def __init__(self, on_change, on_retry):
+        self.on_change = on_change
+        self.on_retry = on_retry
+        self.retry_interval = self.MIN_RETRY_INTERVAL
+        self.retry_source_id = None
+        try:
+            self.network_monitor = Gio.NetworkMonitor.get_default()
+            self.network_monitor.connect("network-changed", self.on_network_changed)
+            self.available = self.network_monitor.get_network_available()
+        except Exception as e:
+            logger.warning(f"Gio.NetworkMonitor kullanılamıyor, yalnızca RSS isteklerine göre karar verilecek: {e}")
+            self.network_monitor = None
+            self.available = True
+
+    def on_network_changed(self, monitor, available):
+        if available != self.available:
+            logger.debug(f"Sistem ağ durumu değişti: {'bağlı' if available else 'bağlı değil'}")
+        self.set_available(available)
+
+    # RSS iş parçacıklarından çağrılabilir
+    def report_success(self):
+        GLib.idle_add(self.set_available, True)
+
+    def report_failure(self):
+        GLib.idle_add(self.set_available, False)
+
+    def set_available(self, available):
+        if available:
+            self.retry_interval = self.MIN_RETRY_INTERVAL
+            if self.retry_source_id is not None:
+                GLib.source_remove(self.retry_source_id)
+                self.retry_source_id = None
+        elif self.retry_source_id is None:
+            logger.debug(f"Ağ bağlantısı yok, {self.retry_interval} saniye sonra tekrar denenecek.")
+            self.retry_source_id = GLib.timeout_add_seconds(self.retry_interval, self.on_retry_timeout)
+            self.retry_interval = min(self.retry_interval * 2, self.MAX_RETRY_INTERVAL)
+
+        if available != self.available:
+            self.available = available
+            self.on_change(available)
+        return False
+
+    def on_retry_timeout(self):
+        self.retry_source_id = None
+        self.on_retry()
+        return False
+
+# Azami boyutu aşan RSS yanıtları için hata
+class FeedTooLargeError(Exception):
+    pass
+
+# Karantinada olduğu için bu yenilemede istenmeyen akışlar on_feed_failed'e
+# bu hatayla bildirilir
+class FeedQuarantinedError(Exception):
+    pass
+
+# RSS akışları için HTTP taşıma katmanı.
+# Her sunucu için kalıcı bağlantılı (keep-alive) bir oturum tutar, sıkıştırılmış
+# yanıtları kabul eder ve URL başına ETag/Last-Modified değerlerini diskte saklar.
+# Sunucu 304 döndürdüğünde akış yeniden indirilmez ve ayrıştırılmaz; son
+# ayrıştırılan başlıklar kullanılır.
+class FeedTransport:
+
+    def __init__(self, cache_file=HTTP_CACHE_FILE, max_bytes=FEED_MAX_BYTES, timeout=HTTP_TIMEOUT):
+        self.cache_file = cache_file
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.sessions = {}
+        self.cached_entries = {}
+        self.poll_hints = {}  # url -> {"max_age", "ttl", "skip_hours", "skip_days"}
+        self.lock = threading.Lock()
+        self.validators = self.load_validators()
+        self.validators_dirty = False
+        self.accept_encoding = "gzip, deflate, br" if self.brotli_available() else "gzip, deflate"
+
+    @staticmethod
+    def brotli_available():
+        for module_name in ("brotli", "brotlicffi"):
+            try:
+                __import__(module_name)
+                return True
+            except ImportError:
+                continue
+        return False
+
+    def load_validators(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                validators_by_url = json.load(f)
+            if isinstance(validators_by_url, dict):
+                return validators_by_url
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"HTTP önbellek dosyası okunamadı ({self.cache_file}): {e}")
+        return {}
+
+    def save_validators(self):
+        with self.lock:
+            if not self.validators_dirty:
+                return
+            data = json.dumps(self.validators, ensure_ascii=False, indent=1).encode("utf-8")
+            self.validators_dirty = False
+        try:
+            write_file_atomic(self.cache_file, data)
+        except Exception as e:
+            logger.error(f"HTTP önbellek dosyası yazılamadı ({self.cache_file}): {e}")
+
+    def session_for(self, url):
+        host = feed_host(url)
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_PER_HOST_LIMIT)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': self.accept_encoding})
+                self.sessions[host] = session
+            return session
+
+    # Akışı indir. Değişmemişse (304) None, aksi halde (gövde, başlıklar,
+    # ayrıştırıcı) döndürür. item_cap verilirse gövde geldikçe StreamingFeedParser
+    # ile ayrıştırılır ve en yeni item_cap başlık okununca bağlantı bırakılır; bu
+    # durumda gövde yalnızca okunan kısımdır. Hızlı ayrıştırıcı akışı işleyemezse
+    # tüm gövde okunur ve ayrıştırıcı yerine None döner.
+    def fetch(self, url, item_cap=None):
+        headers = {}
+        with self.lock:
+            cached_validators = self.validators.get(url) if url in self.cached_entries else None
+        if cached_validators:
+            if cached_validators.get("etag"):
+                headers["If-None-Match"] = cached_validators["etag"]
+            if cached_validators.get("last_modified"):
+                headers["If-Modified-Since"] = cached_validators["last_modified"]
+
+        with self.session_for(url).get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if response.status_code == 304 and cached_validators:
+                self.note_freshness(url, {key.lower(): value for key, value in response.headers.items()})
+                return None
+            response.raise_for_status()
+
+            # Akarak ayrıştırılan büyük akışların yalnızca başı okunacağından
+            # Content-Length sınırı yalnızca tüm gövde gerektiğinde uygulanır
+            stream_parser = StreamingFeedParser(item_cap, response.url) if item_cap else None
+            content_length = response.headers.get("Content-Length")
+            if (stream_parser is None and content_length and content_length.isdigit()
+                    and int(content_length) > self.max_bytes):
+                raise FeedTooLargeError(f"{url}: {content_length} bayt (sınır {self.max_bytes})")
+
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise FeedTooLargeError(f"{url}: {self.max_bytes} bayt sınırı aşıldı")
+                chunks.append(chunk)
+                if stream_parser is not None and stream_parser.feed(chunk):
+                    logger.debug(f"{url}: en yeni {item_cap} başlık alındı, akışın kalanı okunmadı "
+                                 f"({received} bayt).")
+                    break
+
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            response_headers["content-location"] = response.url
+            if stream_parser is not None and not stream_parser.close():
+                logger.debug(f"{url}: hızlı ayrıştırıcı kullanılamadı ({stream_parser.failed}), "
+                             f"feedparser kullanılacak.")
+                stream_parser = None
+            return b"".join(chunks), response_headers, stream_parser
+
+    # Başarıyla ayrıştırılan bir yanıtın doğrulayıcılarını ve başlıklarını sakla.
+    # feed_info, akışın kendi yoklama ipuçlarıdır (ttl, skipHours, skipDays).
+    def remember(self, url, response_headers, entries, feed_info=None):
+        self.note_freshness(url, response_headers, feed_info)
+        with self.lock:
+            self.cached_entries[url] = entries
+            validators_for_url = {}
+            if response_headers.get("etag"):
+                validators_for_url["etag"] = response_headers["etag"]
+            if response_headers.get("last-modified"):
+                validators_for_url["last_modified"] = response_headers["last-modified"]
+            if self.validators.get(url) != (validators_for_url or None):
+                if validators_for_url:
+                    self.validators[url] = validators_for_url
+                else:
+                    self.validators.pop(url, None)
+                self.validators_dirty = True
+
+    def cached(self, url):
+        with self.lock:
+            return self.cached_entries.get(url)
+
+    # Yeniden başlatmadan sonra depodaki başlıkları 304 yanıtları için önbelleğe
+    # al; böylece kayıtlı doğrulayıcılar ilk yoklamadan itibaren gönderilir
+    def seed(self, entries):
+        entries_by_feed = {}
+        for entry in entries:
+            entries_by_feed.setdefault(entry.feed, []).append(entry)
+        with self.lock:
+            for url, feed_entries in entries_by_feed.items():
+                if url in self.validators and url not in self.cached_entries:
+                    self.cached_entries[url] = feed_entries
+
+    # Yanıtın Cache-Control max-age veya Expires başlığından tazelik süresini
+    # (saniye) hesapla; önbelleğe alınmaması istenen yanıtlar için None döndür
+    @staticmethod
+    def freshness_lifetime(response_headers):
+        cache_control = response_headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return None
+        match = re.search(r'(?<![\w-])max-age\s*=\s*"?(\d+)', cache_control)
+        if match:
+            return int(match.group(1))
+        if not response_headers.get("expires"):
+            return None
+        try:
+            expires = parsedate_to_datetime(response_headers["expires"])
+            date = (parsedate_to_datetime(response_headers["date"])
+                    if response_headers.get("date") else datetime.now(timezone.utc))
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=timezone.utc)
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError, IndexError):
+            # Geçersiz Expires değeri (ör. "0") yanıtın zaten bayat olduğunu söyler
+            return 0
+        return max(0, int((expires - date).total_seconds()))
+
+    # Akışın yoklama ipuçlarını güncelle. 304 yanıtlarında yalnızca HTTP tazelik
+    # süresi yenilenir, akışın kendi ipuçları korunur.
+    def note_freshness(self, url, response_headers, feed_info=None):
+        max_age = self.freshness_lifetime(response_headers)
+        with self.lock:
+            hints = dict(self.poll_hints.get(url, {}))
+            hints["max_age"] = max_age
+            if feed_info is not None:
+                hints.update(feed_info)
+            self.poll_hints[url] = hints
+
+    def hints_for(self, url):
+        with self.lock:
+            return dict(self.poll_hints.get(url, {}))
+
+default_feed_transport = None
+default_feed_transport_lock = threading.Lock()
+
+def get_feed_transport():
+    global default_feed_transport
+    with default_feed_transport_lock:
+        if default_feed_transport is None:
+            default_feed_transport = FeedTransport()
+        return default_feed_transport
+
+# Açıklama HTML'ini temizle: bağlantıları at, varsa ilk h4'ü yoksa tüm metni al
+def clean_description(raw_description):
+    if not raw_description:
+        return "Açıklama bulunamadı."
+    try:
+        doc = lxml_html.fromstring(raw_description)
+        # Hızlı ayrıştırıcı açıklamaları feedparser gibi arındırmaz
+        for element in doc.xpath('//script|//style'):
+            element.drop_tree()
+        for a_tag in doc.xpath('//a'):
+            a_tag.drop_tree()
+        h4_elements = doc.xpath('//h4')
+        if h4_elements:
+            description = h4_elements[0].text_content().strip()
+        else:
+            description = doc.text_content().strip()
+        return description or "Açıklama bulunamadı."
+    except Exception as e:
+        logger.error(f"HTML ayrıştırma hatası: {e}")
+        return "Açıklama ayrıştırılamadı."
+
+# Tek bir RSS akışını al ve başlıkları ayıkla
+def fetch_feed_entries(url, transport=None):
+    transport = transport or get_feed_transport()
+    metrics = get_metrics()
+    started = time.monotonic()
+    response = transport.fetch(url, item_cap=FEED_ITEM_CAP)
+    metrics.observe("rss_feed_fetch_seconds", time.monotonic() - started, feed=url)
+    if response is None:
+        logger.debug(f"RSS değişmemiş (304), ayrıştırma atlandı: {url}")
+        metrics.inc("rss_feed_responses_total", feed=url, status="304")
+        return transport.cached(url)
+
+    body, response_headers, stream_parser = response
+    metrics.inc("rss_feed_responses_total", feed=url, status="200")
+    metrics.inc("rss_feed_bytes_total", len(body), feed=url)
+    if stream_parser is not None:
+        # Ayrıştırma indirmeyle iç içe yapıldı; yalnızca ayrıştırıcıda geçen süre ölçülür
+        feed_info = stream_parser.feed_info
+        entries = feed_entries_from_records(url, stream_parser.records())
+        metrics.observe("rss_feed_parse_seconds", stream_parser.parse_seconds, feed=url)
+    else:
+        started = time.monotonic()
+        entries, feed_info = get_feed_parse_pool().parse(url, body, response_headers)
+        metrics.observe("rss_feed_parse_seconds", time.monotonic() - started, feed=url)
+    transport.remember(url, response_headers, entries, feed_info)
+    return entries
+
+ATOM_NAMESPACE = "{http://www.w3.org/2005/Atom}"
+CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_DATE_TAG = "{http://purl.org/dc/elements/1.1/}date"
+
+# RSS 2.0 ve Atom akışlarını indirilirken parça parça ayrıştıran hızlı yol.
+# feedparser tüm belgeyi ve her başlığı bellekte nesne ağacına çevirirken burada
+# her item/entry kapandığı anda kayda dönüştürülüp ağaçtan atılır. Akış yeniden
+# eskiye sıralı olduğu sürece item_cap başlığa ulaşılınca feed() True döndürür
+# ve çağıran okumayı bırakır. Desteklenmeyen biçimlerde (RSS 1.0, HTML ile
+# karışık akışlar) ve XML hatalarında failed doldurulur; çağıran tüm belgeyi
+# ayrıştırma işçisinde feedparser ile ayrıştırır. Bu ayrıştırıcı indirme
+# iş parçacığında (GTK ile aynı süreçte) çalıştığından, yeniden eskiye sıralı
+# olmayan akışlarda da hemen bırakılır: en yeniler ancak tüm belge okununca
+# bilinir ve büyük bir belgeyi bu süreçte ayrıştırmak ana döngüyü yavaşlatır.
+# Sonuçlar parse_feed_records ile aynı biçimdedir.
+class StreamingFeedParser:
+
+    def __init__(self, item_cap=FEED_ITEM_CAP, base_url=""):
+        self.item_cap = item_cap
+        self.base_url = base_url
+        self.parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self.stack = []
+        self.item_tag = None  # RSS için "item", Atom için entry
+        self.channel_tag = None  # başlıkları içeren öğe
+        self.dated_records = []
+        self.last_published = None
+        self.feed_info = {"ttl": None, "skip_hours": [], "skip_days": []}
+        self.done = False
+        self.failed = None  # hızlı yolun kullanılamama nedeni
+        self.parse_seconds = 0.0
+
+    def feed(self, chunk):
+        if self.done or self.failed:
+            return self.done
+        started = time.perf_counter()
+        try:
+            self.parser.feed(chunk)
+            self.process_events()
+        except ElementTree.ParseError as e:
+            self.failed = f"XML hatası: {e}"
+        self.parse_seconds += time.perf_counter() - started
+        return self.done
+
+    # Belge sonu; hızlı yol başarılıysa True döndür
+    def close(self):
+        if not (self.done or self.failed):
+            started = time.perf_counter()
+            try:
+                self.parser.close()
+                self.process_events()
+            except ElementTree.ParseError as e:
+                self.failed = f"XML hatası: {e}"
+            self.parse_seconds += time.perf_counter() - started
+            if self.item_tag is None and not self.failed:
+                self.failed = "boş belge"
+        return not self.failed
+
+    def records(self):
+        return newest_records(self.dated_records, self.item_cap)
+
+    def process_events(self):
+        for event, element in self.parser.read_events():
+            if event == "start":
+                if self.item_tag is None and not self.detect_format(element):
+                    return
+                self.stack.append(element)
+                continue
+            self.stack.pop()
+            parent_tag = self.stack[-1].tag if self.stack else None
+            if element.tag == self.item_tag and parent_tag == self.channel_tag:
+                self.add_item(element)
+                self.stack[-1].remove(element)
+                if self.done or self.failed:
+                    return
+            elif element.tag == "ttl" and parent_tag == "channel":
+                ttl = (element.text or "").strip()
+                if ttl.isdigit() and int(ttl) > 0:
+                    self.feed_info["ttl"] = int(ttl)
+            elif element.tag == "hour" and parent_tag == "skipHours":
+                hour = (element.text or "").strip()
+                if hour.isdigit():
+                    skip_hours = set(self.feed_info["skip_hours"]) | {int(hour) % 24}
+                    self.feed_info["skip_hours"] = sorted(skip_hours)
+            elif element.tag == "day" and parent_tag == "skipDays":
+                day = (element.text or "").strip().lower()
+                if day in WEEKDAY_NAMES:
+                    skip_days = set(self.feed_info["skip_days"]) | {WEEKDAY_NAMES.index(day)}
+                    self.feed_info["skip_days"] = sorted(skip_days)
+
+    def detect_format(self, root):
+        if root.tag == "rss":
+            self.item_tag, self.channel_tag = "item", "channel"
+        elif root.tag == ATOM_NAMESPACE + "feed":
+            self.item_tag, self.channel_tag = ATOM_NAMESPACE + "entry", root.tag
+        else:
+            self.failed = f"desteklenmeyen biçim: {root.tag}"
+            return False
+        return True
+
+    def add_item(self, element):
+        if self.item_tag == "item":
+            published, record = self.rss_record(element)
+        else:
+            published, record = self.atom_record(element)
+        if record is None:
+            return
+        if published is not None:
+            if self.last_published is not None and published > self.last_published:
+                self.failed = "başlıklar yeniden eskiye sıralı değil"
+                return
+            self.last_published = published
+        self.dated_records.append((published, record))
+        if self.item_cap is not None and len(self.dated_records) >= self.item_cap:
+            self.done = True
+
+    @staticmethod
+    def element_text(element):
+        return "".join(element.itertext()).strip() if element is not None else ""
+
+    def rss_record(self, item):
+        title = self.element_text(item.find("title"))
+        if not title:
+            return None, None
+        link = self.element_text(item.find("link"))
+        guid_element = item.find("guid")
+        guid = self.element_text(guid_element)
+        # feedparser kalıcı bağlantı sayılan guid'leri akış adresine göre çözer;
+        # başlık anahtarları iki yolda aynı kalsın diye aynısı yapılır
+        if guid and guid_element.get("isPermaLink", "true").lower() != "false":
+            guid = urljoin(self.base_url, guid)
+            link = link or guid
+        if not link:
+            logger.warning(f"Başlık için link bulunamadı: {title[:50]}...")
+        description = self.element_text(item.find("description")) or self.element_text(item.find(CONTENT_ENCODED_TAG))
+        published = parse_feed_date(self.element_text(item.find("pubDate"))
+                                    or self.element_text(item.find(DC_DATE_TAG)))
+        return published, (title, link, guid, description.encode("utf-8"))
+
+    def atom_record(self, entry):
+        title = self.element_text(entry.find(ATOM_NAMESPACE + "title"))
+        if not title:
+            return None, None
+        link = ""
+        for link_element in entry.iter(ATOM_NAMESPACE + "link"):
+            if link_element.get("rel", "alternate") == "alternate" and link_element.get("href"):
+                link = urljoin(self.base_url, link_element.get("href").strip())
+                break
+        if not link:
+            logger.warning(f"Başlık için link bulunamadı: {title[:50]}...")
+        guid = self.element_text(entry.find(ATOM_NAMESPACE + "id"))
+        description = (self.element_text(entry.find(ATOM_NAMESPACE + "summary"))
+                       or self.element_text(entry.find(ATOM_NAMESPACE + "content")))
+        published = parse_feed_date(self.element_text(entry.find(ATOM_NAMESPACE + "published"))
+                                    or self.element_text(entry.find(ATOM_NAMESPACE + "updated")))
+        return published, (title, link, guid, description.encode("utf-8"))
+
+# Tek bir ayrıştırma işçisi süreci (rss_workers.py --parse-worker). İstek ve
+# yanıtlar uzunluk önekli pickle çerçeveleridir; süreç çökerse bir sonraki
+# istekte yeniden başlatılır.
+class FeedParseWorker:
+
+    def __init__(self, timeout=PARSE_TIMEOUT):
+        self.timeout = timeout
+        self.process = None
+
+    def ensure_running(self):
+        if self.process and self.process.poll() is None:
+            return
+        self.process = subprocess.Popen([sys.executable, WORKER_SCRIPT, "--parse-worker"],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+
+    def stop(self):
+        process = self.process
+        self.process = None
+        if process and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
+
+    # ("ok", (ipuçları, kayıtlar)) veya ("error", hata) döndür; işçi yanıt
+    # vermezse süreç sonlandırılır ve hata yükseltilir
+    def parse(self, body, response_headers, item_cap):
+        try:
+            self.ensure_running()
+            payload = pickle.dumps((body, response_headers, item_cap), protocol=pickle.HIGHEST_PROTOCOL)
+            frame = memoryview(FRAME_HEADER.pack(len(payload)) + payload)
+            while frame:
+                frame = frame[self.process.stdin.write(frame):]
+            deadline = time.monotonic() + self.timeout
+            stdout = self.process.stdout
+            (size,) = FRAME_HEADER.unpack(read_pipe_exact(stdout, FRAME_HEADER.size, deadline))
+            return pickle.loads(read_pipe_exact(stdout, size, deadline))
+        except Exception:
+            if self.process:
+                self.process.kill()
+                self.process.wait()
+                self.process = None
+            raise
+
+# RSS ayrıştırmasını ayrı süreçlere taşır.
+# feedparser işleri ana süreçte GTK ile GIL için yarışmaz; sonuçlar sıkıştırılmış
+# kayıtlar olarak boru üzerinden döner. İşçiler ilk ayrıştırmada başlatılır.
+# Çöken işçi yeniden başlatılıp akış bir kez daha denenir; yine çökerse akış
+# ana süreçte ayrıştırılmaz, bu yenilemede atlanır.
+class FeedParsePool:
+
+    def __init__(self, max_workers=PARSE_WORKERS):
+        self.max_workers = max_workers
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.idle_workers = []
+        self.workers = []
+        self.lock = threading.Lock()
+
+    def parse(self, url, body, response_headers):
+        with self.slots:
+            with self.lock:
+                if self.idle_workers:
+                    worker = self.idle_workers.pop()
+                else:
+                    worker = FeedParseWorker()
+                    self.workers.append(worker)
+            try:
+                for attempt in range(2):
+                    try:
+                        status, result = worker.parse(body, response_headers, FEED_ITEM_CAP)
+                        break
+                    except TimeoutError:
+                        raise FeedParseError(f"ayrıştırma {worker.timeout} saniyede bitmedi")
+                    except Exception as e:
+                        if attempt:
+                            raise FeedParseError(f"ayrıştırma süreci iki kez çöktü: {e}")
+                        logger.error(f"Ayrıştırma süreci çöktü, yeniden başlatılıp tekrar denenecek ({url}): {e}")
+            finally:
+                with self.lock:
+                    self.idle_workers.append(worker)
+        if status == "error":
+            raise result
+        feed_info, records = result
+        return feed_entries_from_records(url, records), feed_info
+
+    def shutdown(self):
+        with self.lock:
+            workers = self.workers
+            self.workers = []
+            self.idle_workers = []
+        for worker in workers:
+            worker.stop()
+
+# (başlık, link, guid, ham açıklama) kayıtlarından akışın başlıklarını oluştur
+def feed_entries_from_records(url, records):
+    feed = sys.intern(url)
+    now = time.time()
+    return [FeedEntry(title, link, guid, raw_description, feed, now)
+            for title, link, guid, raw_description in records]
+
+feed_parse_pool = None
+feed_parse_pool_lock = threading.Lock()
+
+def get_feed_parse_pool():
+    global feed_parse_pool
+    with feed_parse_pool_lock:
+        if feed_parse_pool is None:
+            feed_parse_pool = FeedParsePool()
+        return feed_parse_pool
+
+# Bant, depo ve seslendirme arasında taşınan başlık kaydı. Haftalarca çalışan
+# bantta binlerce başlık tutulduğundan sözlük yerine __slots__ kullanılır ve
+# akış adresi (kaynak) sys.intern ile tüm başlıklar arasında paylaşılır.
+# raw_description, temizlenmemiş açıklama HTML'inin UTF-8 baytlarıdır; boost,
+# başlık filtresinin öne alma puanıdır.
+class FeedEntry:
+
+    __slots__ = ("title", "link", "guid", "raw_description", "feed", "first_seen", "boost")
+
+    def __init__(self, title, link="", guid="", raw_description=b"", feed="", first_seen=None, boost=0):
+        self.title = title
+        self.link = link
+        self.guid = guid
+        self.raw_description = raw_description
+        self.feed = sys.intern(feed)
+        self.first_seen = time.time() if first_seen is None else first_seen
+        self.boost = boost
+
+    def __repr__(self):
+        return f"FeedEntry({self.title[:40]!r}, feed={self.feed!r})"
+
+# Başlığı akışlar ve yenilemeler arasında tanımlayan anahtar (GUID, yoksa link, yoksa başlık)
+def entry_key(entry):
+    return entry.guid or entry.link or entry.title
+
+# Bellekteki başlıklara saklama kurallarını uygula: en yeni başlıklar (bantta
+# sonda olanlar) tutulur; akış başına per_feed, toplamda global_cap başlıktan
+# fazlası ve max_age saniyeden eski olanlar atılır. Sıra korunur.
+def apply_entry_retention(entries, now=None, per_feed=STORED_ENTRIES_PER_FEED,
+                          max_age=ENTRY_MAX_AGE, global_cap=ENTRY_GLOBAL_CAP):
+    now = time.time() if now is None else now
+    oldest_allowed = now - max_age
+    per_feed_counts = {}
+    kept = []
+    for entry in reversed(entries):
+        if len(kept) >= global_cap:
+            break
+        if entry.first_seen < oldest_allowed:
+            continue
+        count = per_feed_counts.get(entry.feed, 0)
+        if count >= per_feed:
+            continue
+        per_feed_counts[entry.feed] = count + 1
+        kept.append(entry)
+    kept.reverse()
+    return kept
+
+# Açıklamaları yalnızca gerektiğinde (ilk kez fare üzerine gelindiğinde) temizleyen
+# ve sonucu başlık başına saklayan sınırlı önbellek. Banttan çıkan başlıkların
+# açıklamaları atılır.
+class DescriptionCache:
+
+    MAX_ENTRIES = 256
+
+    def __init__(self):
+        self.descriptions = OrderedDict()  # (başlık anahtarı, ham açıklama özeti) -> açıklama
+
+    def get(self, entry):
+        raw_description = entry.raw_description or b""
+        key = (entry_key(entry), hash(raw_description))
+        description = self.descriptions.get(key)
+        if description is not None:
+            self.descriptions.move_to_end(key)
+            return description
+
+        description = clean_description(raw_description.decode("utf-8", errors="replace").strip())
+        self.descriptions[key] = description
+        if len(self.descriptions) > self.MAX_ENTRIES:
+            self.descriptions.popitem(last=False)
+        return description
+
+    # Yalnızca banttaki başlıkların açıklamalarını tut
+    def retain(self, entry_keys):
+        for key in [key for key in self.descriptions if key[0] not in entry_keys]:
+            del self.descriptions[key]
+
+# Türkçe büyük/küçük harf katlama: İ→i ve I→ı (str.lower "İ"yi "i̇" yapar).
+# Sözlüklü str.translate uzun metinlerde iki replace çağrısından çok yavaştır.
+def turkish_casefold(text):
+    return text.replace("İ", "i").replace("I", "ı").casefold()
+
+COMBINING_MARK_PATTERN = re.compile("[\u0300-\u036f]")
+
+# Karşılaştırma için metni katla: Türkçe büyük/küçük harf katlama ve aksanların
+# atılması. Bazı kaynaklar Türkçe karakter kullanmadığından ("Istanbul trafigi")
+# ı da i'ye indirgenir. Yinelenen ayıklama ve başlık filtresi aynı katlamayı kullanır.
+def fold_text(text):
+    folded = unicodedata.normalize("NFKD", turkish_casefold(text).replace("ı", "i"))
+    return COMBINING_MARK_PATTERN.sub("", folded)
+
+# Yakın kopya karşılaştırması için başlığı normalleştir: katlama ve noktalamanın atılması
+def normalize_title(title):
+    return " ".join(re.findall(r"\w+", fold_text(title)))
+
+# Anahtar kelimelerden tek bir düzenli ifade kur: kelimeler ortak önekleri
+# paylaşan bir ağaca (trie) dizilir, böylece eşleştirme maliyeti kural sayısıyla
+# değil yalnızca metnin uzunluğuyla artar. Bir konumda en uzun kelime eşleşir.
+def keyword_trie_pattern(keywords):
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        pattern = "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if "" in node else pattern
+
+    return build(trie)
+
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+# rss.ini [Filters] bölümündeki anahtar kelime kuralları:
+#   include = ...  tanımlıysa yalnızca bunlardan birini içeren başlıklar gösterilir
+#   exclude = ...  içeren başlıklar atılır
+#   boost = ...    eşleşen her kural başlığın puanını artırır; puanlı yeni
+#                  başlıklar bantta henüz görünmeyen başlıkların önüne alınır
+# Kelimeler virgülle ayrılır; önüne title:, description: veya source: (akış
+# adresi) yazılarak alan seçilir, yazılmazsa başlık ve açıklamada aranır.
+# Karşılaştırma fold_text ile katlanmış metinde ve kelime başlarında yapılır;
+# "deprem" kuralı "depremde", "İstanbul" kuralı "Istanbul" ile de eşleşir. Her alanın kelimeleri tek bir düzenli ifadede
+# birleştirilir.
+class HeadlineFilter:
+
+    FIELDS = ("title", "description", "source")
+    KINDS = ("include", "exclude", "boost")
+
+    def __init__(self, rules=()):
+        self.kinds = []  # kural no -> tür
+        keywords = {field: {} for field in self.FIELDS}  # alan -> katlanmış kelime -> {kural no}
+        for kind, field, keyword in rules:
+            folded = " ".join(fold_text(keyword).split())
+            if not folded or kind not in self.KINDS:
+                continue
+            rule = len(self.kinds)
+            self.kinds.append(kind)
+            for target in ((field,) if field else ("title", "description")):
+                keywords[target].setdefault(folded, set()).add(rule)
+        self.has_include = "include" in self.kinds
+
+        # Alan başına (düzenli ifade, eşleşen kelime -> kurallar). Bir konumda
+        # yalnızca en uzun kelime döndüğünden, kelimenin önekleri olan diğer
+        # kelimelerin kuralları da ona eklenir ("son" ve "son dakika").
+        self.matchers = []
+        for field, table in keywords.items():
+            if not table:
+                continue
+            rules_by_keyword = {}
+            for keyword in table:
+                rules = set()
+                for end in range(1, len(keyword) + 1):
+                    rules.update(table.get(keyword[:end], ()))
+                rules_by_keyword[keyword] = tuple(rules)
+            # Bakış (lookahead) içindeki yakalama iç içe geçen eşleşmeleri de bulur
+            pattern = re.compile(r"(?<!\w)(?=(" + keyword_trie_pattern(table) + "))")
+            self.matchers.append((field, pattern, rules_by_keyword))
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @staticmethod
+    def field_text(entry, field):
+        if field == "title":
+            text = entry.title
+        elif field == "source":
+            text = entry.feed
+        else:
+            raw_description = (entry.raw_description or b"").decode("utf-8", errors="replace")
+            text = html.unescape(HTML_TAG_PATTERN.sub(" ", raw_description))
+        return " ".join(fold_text(text).split())
+
+    # Başlık atılacaksa None, yoksa eşleşen öne alma kuralı sayısını döndür
+    def score(self, entry):
+        matched = set()
+        for field, pattern, rules_by_keyword in self.matchers:
+            for match in pattern.finditer(self.field_text(entry, field)):
+                matched.update(rules_by_keyword[match.group(1)])
+        included = not self.has_include
+        boost = 0
+        for rule in matched:
+            kind = self.kinds[rule]
+            if kind == "exclude":
+                return None
+            if kind == "include":
+                included = True
+            else:
+                boost += 1
+        return boost if included else None
+
+    # Atılmayan başlıkları (puan, başlık) olarak, puana göre kararlı sırada döndür;
+    # puan başlığın boost alanına da yazılır
+    def rank(self, entries):
+        if not self.matchers:
+            return [(0, entry) for entry in entries]
+        ranked = []
+        for entry in entries:
+            score = self.score(entry)
+            if score is not None:
+                entry.boost = score
+                ranked.append((score, entry))
+        ranked.sort(key=lambda item: -item[0])
+        return ranked
+
+    def filter(self, entries):
+        return [entry for _, entry in self.rank(entries)]
+
+    # Sırayı değiştirmeden yalnızca atılacak başlıkları çıkar (bantta kullanılır)
+    def retain(self, entries):
+        if not self.matchers:
+            return list(entries)
+        return [entry for entry in entries if self.score(entry) is not None]
+
+# Konfigürasyon dosyasının [Filters] bölümünden kuralları oku
+def load_headline_filter(config_file=CONFIG_FILE):
+    config = configparser.ConfigParser(interpolation=None)
+    try:
+        config.read(config_file)
+    except configparser.Error as e:
+        logger.error(f"Filtre kuralları okunamadı ({config_file}): {e}")
+        return HeadlineFilter()
+    rules = []
+    if config.has_section('Filters'):
+        for kind in HeadlineFilter.KINDS:
+            for item in re.split(r"[,\n]", config['Filters'].get(kind, '')):
+                field, separator, keyword = item.partition(':')
+                field = field.strip().lower()
+                if separator and field in HeadlineFilter.FIELDS:
+                    rules.append((kind, field, keyword))
+                else:
+                    rules.append((kind, None, item))
+    return HeadlineFilter(rules)
+
+headline_filter = None
+headline_filter_mtime = None
+headline_filter_lock = threading.Lock()
+
+# Kurallar, konfigürasyon dosyası değiştikçe yeniden derlenir
+def get_headline_filter():
+    global headline_filter, headline_filter_mtime
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    with headline_filter_lock:
+        if headline_filter is None or mtime != headline_filter_mtime:
+            headline_filter = load_headline_filter(CONFIG_FILE)
+            headline_filter_mtime = mtime
+            if len(headline_filter):
+                logger.info(f"{len(headline_filter)} başlık filtresi kuralı yüklendi.")
+        return headline_filter
+
+# Aynı haberin farklı akışlardan gelen kopyalarını banda girmeden ayıklar.
+# Önce link ve GUID tam eşleşmesine bakılır; ardından normalleştirilmiş başlığın
+# karakter parçalarından (shingle) MinHash imzası çıkarılır ve imza bantlara
+# bölünerek (LSH) yalnızca aynı kovaya düşen adaylar karşılaştırılır. Böylece
+# her yeni başlık tüm başlıklarla değil, birkaç adayla karşılaştırılır. Benzerlik
+# yalnızca farklı akışlar arasında aranır; bir akışın birbirine benzeyen günlük
+# başlıkları ("Dolar bugün ne kadar? 12 Ocak" / "13 Ocak") ayrı haberlerdir.
+class StoryDeduplicator:
+
+    NUM_HASHES = 32
+    BANDS = 8
+    SHINGLE_SIZE = 4
+    SIMILARITY_THRESHOLD = 0.6
+    MAX_STORIES = ENTRY_GLOBAL_CAP * 2
+    HASH_PRIME = (1 << 61) - 1
+
+    def __init__(self):
+        rng = random.Random(0x5EED)
+        self.hash_params = [(rng.randrange(1, self.HASH_PRIME), rng.randrange(self.HASH_PRIME))
+                            for _ in range(self.NUM_HASHES)]
+        self.rows_per_band = self.NUM_HASHES // self.BANDS
+        self.stories = OrderedDict()  # entry_key -> (link, guid, imza, eklenme zamanı, akış)
+        self.by_link = {}
+        self.by_guid = {}
+        self.buckets = {}  # (bant, imza parçası) -> {entry_key}
+        self.released = []  # unutulan haberlerin anahtarları; kopyaları yeniden sunulur
+        self.lock = threading.Lock()
+        self.duplicates = 0
+        self.saved_title_chars = 0
+        self.saved_description_bytes = 0
+
+    def signature(self, title):
+        text = normalize_title(title)
+        size = self.SHINGLE_SIZE
+        shingles = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+        hashed = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+        prime = self.HASH_PRIME
+        return tuple(min((a * h + b) % prime for h in hashed) for a, b in self.hash_params)
+
+    def band_keys(self, signature):
+        rows = self.rows_per_band
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.BANDS)]
+
+    def find_duplicate(self, entry, signature):
+        if entry.link and entry.link in self.by_link:
+            return self.by_link[entry.link]
+        if entry.guid and entry.guid in self.by_guid:
+            return self.by_guid[entry.guid]
+
+        candidates = set()
+        for band_key in self.band_keys(signature):
+            candidates.update(self.buckets.get(band_key, ()))
+        for candidate in candidates:
+            _, _, other, _, feed = self.stories[candidate]
+            if feed == entry.feed:
+                continue
+            matching = sum(1 for mine, theirs in zip(signature, other) if mine == theirs)
+            if matching / self.NUM_HASHES >= self.SIMILARITY_THRESHOLD:
+                return candidate
+        return None
+
+    def add(self, key, entry, signature):
+        self.stories[key] = (entry.link, entry.guid, signature, time.monotonic(), entry.feed)
+        if entry.link:
+            self.by_link.setdefault(entry.link, key)
+        if entry.guid:
+            self.by_guid.setdefault(entry.guid, key)
+        for band_key in self.band_keys(signature):
+            self.buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key):
+        link, guid, signature, _, _ = self.stories.pop(key)
+        self.released.append(key)
+        if self.by_link.get(link) == key:
+            del self.by_link[link]
+        if self.by_guid.get(guid) == key:
+            del self.by_guid[guid]
+        for band_key in self.band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+
+    # Kopyaları ayıkla, benzersiz (veya daha önce kabul edilmiş başlıkların
+    # güncellenmiş) girdileri sırayı koruyarak döndür
+    def filter(self, entries):
+        return self.split(entries)[0]
+
+    # (benzersiz, atılan kopyalar) listelerini döndür; kopyalar (başlık, asıl
+    # haberin anahtarı) çiftleridir
+    def split(self, entries):
+        unique = []
+        duplicates = []
+        with self.lock:
+            for entry in entries:
+                key = entry_key(entry)
+                if key in self.stories:
+                    self.stories.move_to_end(key)
+                    unique.append(entry)
+                    continue
+                signature = self.signature(entry.title)
+                original = self.find_duplicate(entry, signature)
+                if original is not None:
+                    self.duplicates += 1
+                    self.saved_title_chars += len(entry.title)
+                    self.saved_description_bytes += len(entry.raw_description)
+                    logger.debug(f"Yinelenen haber atlandı: {entry.title[:50]} ({entry.feed})")
+                    duplicates.append((entry, original))
+                    continue
+                self.add(key, entry, signature)
+                unique.append(entry)
+            while len(self.stories) > self.MAX_STORIES:
+                self.remove(next(iter(self.stories)))
+        return unique, duplicates
+
+    # Yalnızca bantta kalan başlıkları hatırla; banttan çıkan bir haberin
+    # başka akıştan gelen kopyası yeniden gösterilebilir. Son yenilemede kabul
+    # edilip henüz banda eklenmemiş olabilecek başlıklar korunur.
+    def retain(self, entry_keys):
+        cutoff = time.monotonic() - FETCH_DEADLINE
+        with self.lock:
+            for key in [key for key, story in self.stories.items()
+                        if key not in entry_keys and story[3] < cutoff]:
+                self.remove(key)
+
+    # Son çağrıdan beri unutulan haberlerin anahtarlarını döndür
+    def take_released(self):
+        with self.lock:
+            released, self.released = self.released, []
+        return released
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "duplicates": self.duplicates,
+                "saved_title_chars": self.saved_title_chars,
+                "saved_description_bytes": self.saved_description_bytes,
+                "stories": len(self.stories),
+            }
+
+# Başlıkları kalıcı olarak saklayan SQLite deposu.
+# Her yenilemede gelen başlıklar depoya işlenir (upsert) ve yalnızca yeni veya
+# değişmiş olanlar döndürülür; böylece bant baştan kurulmak yerine güncellenir.
+# Açılışta bant, ağ yanıt vermeden önce depodaki başlıklarla çizilir.
+class EntryStore:
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            entry_key TEXT PRIMARY KEY,
+            feed_url TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,  -- ham açıklama HTML'i, gösterilirken temizlenir
+            link TEXT NOT NULL,
+            guid TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            spoken_count INTEGER NOT NULL DEFAULT 0,
+            last_spoken REAL,
+            duplicate_of TEXT  -- başka akıştaki asıl haberin anahtarı; kopyalar banda girmez
+        );
+        CREATE INDEX IF NOT EXISTS entries_link ON entries (link);
+        CREATE INDEX IF NOT EXISTS entries_feed ON entries (feed_url, first_seen);
+    """
+
+    def __init__(self, db_file=ENTRY_DB_FILE):
+        os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(entries)")}
+        if "duplicate_of" not in columns:
+            self.connection.execute("ALTER TABLE entries ADD COLUMN duplicate_of TEXT")
+        self.connection.commit()
+
+    @staticmethod
+    def content_hash(entry):
+        content = "\x1f".join((entry.title, entry.link)).encode("utf-8")
+        return hashlib.sha1(content + b"\x1f" + entry.raw_description).hexdigest()
+
+    # Bir akışın başlıklarını depoya işle, yeni veya değişmiş olanları döndür.
+    # Daha önce görülmüş başlıkların first_seen değeri depodakiyle eşitlenir.
+    def merge(self, feed_url, entries):
+        now = time.time()
+        changed = []
+        with self.lock, self.connection:
+            for entry in entries:
+                key = entry_key(entry)
+                content_hash = self.content_hash(entry)
+                row = self.connection.execute(
+                    "SELECT content_hash, first_seen FROM entries WHERE entry_key = ?", (key,)).fetchone()
+                if row is None:
+                    entry.first_seen = now
+                    self.connection.execute(
+                        "INSERT INTO entries (entry_key, feed_url, title, description, link, guid, "
+                        "content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, feed_url, entry.title, entry.raw_description.decode("utf-8", errors="replace"),
+                         entry.link, entry.guid, content_hash, now, now))
+                    changed.append(entry)
+                    continue
+
+                entry.first_seen = row[1]
+                if row[0] != content_hash:
+                    self.connection.execute(
+                        "UPDATE entries SET title = ?, description = ?, link = ?, content_hash = ?, "
+                        "last_seen = ? WHERE entry_key = ?",
+                        (entry.title, entry.raw_description.decode("utf-8", errors="replace"),
+                         entry.link, content_hash, now, key))
+                    changed.append(entry)
+                else:
+                    self.connection.execute(
+                        "UPDATE entries SET last_seen = ? WHERE entry_key = ?", (now, key))
+        return changed
+
+    # Akışlarda artık görünmeyen eski başlıkları ve akış başına sınırı aşanları sil.
+    # Akışın son yanıtında bulunan başlıklar silinmez; aksi halde bir sonraki
+    # yenilemede yeniymiş gibi geri gelirlerdi. Asıl haberi silinen kopyalar da
+    # silinir, böylece bir sonraki yenilemede yeniden sunulurlar.
+    def prune(self, per_feed=STORED_ENTRIES_PER_FEED, max_age=ENTRY_MAX_AGE):
+        with self.lock, self.connection:
+            removed = self.connection.execute(
+                "DELETE FROM entries WHERE last_seen < ?", (time.time() - max_age,)).rowcount
+            removed += self.connection.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                "  SELECT rowid FROM ("
+                "    SELECT rowid, last_seen,"
+                "      ROW_NUMBER() OVER (PARTITION BY feed_url ORDER BY last_seen DESC, first_seen DESC) AS rank,"
+                "      MAX(last_seen) OVER (PARTITION BY feed_url) AS latest"
+                "    FROM entries"
+                "  ) WHERE rank > ? AND last_seen < latest"
+                ")", (per_feed,)).rowcount
+            removed += self.connection.execute(
+                "DELETE FROM entries WHERE duplicate_of IS NOT NULL"
+                "  AND duplicate_of NOT IN (SELECT entry_key FROM entries)").rowcount
+        if removed:
+            logger.debug(f"Depodan {removed} eski başlık silindi.")
+        return removed
+
+    # Açılışta gösterilecek başlıkları akış sırasına göre döndür
+    def load_entries(self, feeds, per_feed=STORED_ENTRIES_PER_FEED):
+        entries = []
+        with self.lock:
+            for feed_url in feeds:
+                rows = self.connection.execute(
+                    "SELECT title, description, link, guid, first_seen FROM ("
+                    "  SELECT title, description, link, guid, first_seen, rowid FROM entries"
+                    "  WHERE feed_url = ? AND duplicate_of IS NULL ORDER BY last_seen DESC, rowid LIMIT ?"
+                    ") ORDER BY rowid", (feed_url, per_feed)).fetchall()
+                for title, raw_description, link, guid, first_seen in rows:
+                    entries.append(FeedEntry(title, link, guid, raw_description.encode("utf-8"),
+                                             feed_url, first_seen))
+        return entries
+
+    # Atılan kopyaları asıl haberleriyle işaretle. Depoda kaldıkları için sonraki
+    # yenilemelerde değişmemiş sayılırlar ve yeniden ayıklanıp sayılmazlar.
+    def mark_duplicates(self, duplicates):
+        with self.lock, self.connection:
+            self.connection.executemany("UPDATE entries SET duplicate_of = ? WHERE entry_key = ?",
+                                        [(original, entry_key(entry)) for entry, original in duplicates])
+
+    # Asıl haberi banttan çıkan kopyaları sil; bir sonraki yenilemede yeniymiş
+    # gibi döndürülürler
+    def release_duplicates(self, original_keys):
+        with self.lock, self.connection:
+            self.connection.executemany("DELETE FROM entries WHERE duplicate_of = ?",
+                                        [(key,) for key in original_keys])
+
+    def mark_spoken(self, entry):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "UPDATE entries SET spoken_count = spoken_count + 1, last_spoken = ? WHERE entry_key = ?",
+                (time.time(), entry_key(entry)))
+
+# Bir akışın sağlık kaydı
+class FeedHealth:
+
+    FIELDS = ("consecutive_failures", "last_success", "last_failure", "last_error",
+              "average_latency", "quarantined_until", "probe_interval")
+
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.last_success = None
+        self.last_failure = None
+        self.last_error = None
+        self.average_latency = None  # başarılı isteklerin süresinin üstel ortalaması (saniye)
+        self.quarantined_until = None
+        self.probe_interval = FEED_PROBE_MIN_INTERVAL
+
+    def to_json(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_json(cls, data):
+        health = cls()
+        for field in cls.FIELDS:
+            if field in data:
+                setattr(health, field, data[field])
+        return health
+
+    def is_quarantined(self, now=None):
+        now = time.time() if now is None else now
+        return self.quarantined_until is not None and self.quarantined_until > now
+
+# Bir akışın başlıklarını depoya işle ve yeni veya değişmiş olanlardan başka
+# akışlardaki haberlerin kopyalarını ayıkla. Kopyalar depoda işaretli kalır ve
+# her yenilemede yeniden sayılmaz; asıl haber banttan çıkınca silinip bir sonraki
+# yenilemede yeniden sunulurlar.
+def merge_feed_entries(entry_store, story_deduplicator, feed_url, entries):
+    changed = entry_store.merge(feed_url, entries)
+    unique, duplicates = story_deduplicator.split(changed)
+    if duplicates:
+        entry_store.mark_duplicates(duplicates)
+    released = story_deduplicator.take_released()
+    if released:
+        entry_store.release_duplicates(released)
+    return unique
+
+# Pencere (bağımsız çalışırken) ve ortak servisin ortak yenileme akışı: akışları
+# al, her akış tamamlandıkça başlıkları depoya işle, kopyaları ayıkla ve yeni
+# veya değişmiş başlıkları on_changed(nesil, başlıklar) ile ana döngüye ilet.
+# feeds verilmezse tüm liste yenilenir, on_feed_list(akışlar) çağrılır ve daha
+# önce başlamış yenilemelerin sonuçları atılır; verilirse yalnızca zamanı gelen
+# akışlar alınır. Tam yenilemede hiç başlık alınamazsa on_fetch_failure çağrılır.
+# owner; rss_feeds, fetch_generation, last_fetch_started, poll_scheduler,
+# entry_store, story_deduplicator, connectivity ve schedule_next_poll taşır.
+def refresh_feeds(owner, feeds, on_feed_list, on_changed, on_fetch_failure):
+    owner.last_fetch_started = time.monotonic()
+    full_refresh = feeds is None
+    if full_refresh:
+        owner.fetch_generation += 1
+        feeds = list(owner.rss_feeds)
+        GLib.idle_add(on_feed_list, feeds)
+        owner.poll_scheduler.forget_removed(feeds)
+        get_feed_health().forget_removed(feeds)
+        owner.poll_scheduler.mark_in_flight(feeds)
+    generation = owner.fetch_generation
+
+    network_failures = []
+    skipped = []
+    completed = set()
+    duplicates_before = owner.story_deduplicator.snapshot()["duplicates"]
+
+    def on_feed_entries(url, entries):
+        completed.add(url)
+        changed = merge_feed_entries(owner.entry_store, owner.story_deduplicator, url, entries)
+        next_poll = owner.poll_scheduler.record_result(url, len(changed))
+        logger.debug(f"{url}: {len(changed)} yeni veya değişmiş başlık, sonraki yoklama "
+                     f"{max(0, next_poll - time.time()):.0f} sn sonra.")
+        if changed:
+            GLib.idle_add(on_changed, generation, changed)
+
+    def on_feed_failed(url, error):
+        completed.add(url)
+        owner.poll_scheduler.record_result(url, 0, failed=True)
+        if isinstance(error, FeedQuarantinedError):
+            skipped.append(url)
+        elif is_network_error(error):
+            network_failures.append(url)
+
+    entries = get_rss_feed(feeds, on_feed_entries=on_feed_entries, on_feed_failed=on_feed_failed,
+                           connectivity=owner.connectivity)
+    owner.entry_store.prune()
+
+    dedup_stats = owner.story_deduplicator.snapshot()
+    if dedup_stats["duplicates"] > duplicates_before:
+        logger.info(f"Yinelenen haberler: bu yenilemede {dedup_stats['duplicates'] - duplicates_before}, "
+                    f"toplam {dedup_stats['duplicates']} başlık atlandı; "
+                    f"{dedup_stats['saved_title_chars']} karakter ölçüm ve seslendirme, "
+                    f"{dedup_stats['saved_description_bytes']} bayt açıklama tasarruf edildi.")
+    # Süre sınırı nedeniyle bırakılan akışlar da yeniden planlanır
+    for url in feeds:
+        if url not in completed:
+            owner.poll_scheduler.record_result(url, 0, failed=True)
+    GLib.idle_add(owner.schedule_next_poll)
+
+    # Gerçek isteklerin sonucu bağlantı durumunu belirler
+    if entries:
+        owner.connectivity.report_success()
+    elif network_failures and len(network_failures) + len(skipped) == len(feeds):
+        owner.connectivity.report_failure()
+
+    if full_refresh and not entries and generation == owner.fetch_generation:
+        GLib.idle_add(on_fetch_failure)
+
+# Akışların sağlığını izleyen ve diskte saklayan devre kesici.
+# Bir yenilemede tüm denemelere rağmen alınamayan (ağ veya HTTP hatası, süre
+# sınırı, ayrıştırılamayan belge) akışın ardışık hata sayısı artar; eşik aşılınca
+# akış karantinaya alınır ve get_rss_feed onu atlar. Karantina bitince tek bir
+# deneme yapılır; o da başarısız olursa karantina süresi ikiye katlanır.
+# İlk başarılı alma kaydı sıfırlar. Bağlantı yokken yaşanan hatalar ve denenen
+# her akışın bağlantı hatasıyla düştüğü yenilemeler akışın değil ağın sorunu
+# olduğundan sayılmaz.
+class FeedHealthTracker:
+
+    LATENCY_ALPHA = 0.3
+    MAX_ERROR_LENGTH = 200
+
+    def __init__(self, health_file=FEED_HEALTH_FILE, threshold=FEED_BREAKER_THRESHOLD,
+                 min_probe_interval=FEED_PROBE_MIN_INTERVAL, max_probe_interval=FEED_PROBE_MAX_INTERVAL):
+        self.health_file = health_file
+        self.threshold = threshold
+        self.min_probe_interval = min_probe_interval
+        self.max_probe_interval = max_probe_interval
+        self.lock = threading.Lock()
+        self.feeds = self.load()
+        self.dirty = False
+
+    def load(self):
+        try:
+            with open(self.health_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return {url: FeedHealth.from_json(health) for url, health in data.items()
+                        if isinstance(health, dict)}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Akış sağlığı dosyası okunamadı ({self.health_file}): {e}")
+        return {}
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = json.dumps({url: health.to_json() for url, health in self.feeds.items()},
+                              ensure_ascii=False, indent=1).encode("utf-8")
+            self.dirty = False
+        try:
+            write_file_atomic(self.health_file, data)
+        except Exception as e:
+            logger.error(f"Akış sağlığı dosyası yazılamadı ({self.health_file}): {e}")
+
+    def health_for(self, url):
+        health = self.feeds.get(url)
+        if health is None:
+            health = self.feeds[url] = FeedHealth()
+        return health
+
+    # Karantinadaki akışlar için False döndür
+    def allow(self, url, now=None):
+        with self.lock:
+            health = self.feeds.get(url)
+            return health is None or not health.is_quarantined(now)
+
+    def record_success(self, url, latency, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            health = self.health_for(url)
+            if health.quarantined_until is not None:
+                logger.info(f"Akış yeniden alınabildi, karantina kaldırıldı: {url}")
+            health.consecutive_failures = 0
+            health.last_success = now
+            health.last_error = None
+            health.quarantined_until = None
+            health.probe_interval = self.min_probe_interval
+            if health.average_latency is None:
+                health.average_latency = latency
+            else:
+                health.average_latency = (self.LATENCY_ALPHA * latency +
+                                          (1 - self.LATENCY_ALPHA) * health.average_latency)
+            self.dirty = True
+
+    def record_failure(self, url, error, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            health = self.health_for(url)
+            health.consecutive_failures += 1
+            health.last_failure = now
+            health.last_error = str(error)[:self.MAX_ERROR_LENGTH]
+            if health.consecutive_failures >= self.threshold:
+                # Karantina sonrası deneme de başarısızsa süre ikiye katlanır
+                if health.quarantined_until is not None:
+                    health.probe_interval = min(health.probe_interval * 2, self.max_probe_interval)
+                health.quarantined_until = now + health.probe_interval
+                logger.warning(f"{url} art arda {health.consecutive_failures} kez alınamadı, "
+                               f"{health.probe_interval / 60:.0f} dakika karantinada.")
+            self.dirty = True
+
+    # Akışın sağlık kaydının bir kopyası (hiç alınmadıysa None)
+    def snapshot(self, url):
+        with self.lock:
+            health = self.feeds.get(url)
+            return FeedHealth.from_json(health.to_json()) if health else None
+
+    def forget_removed(self, feeds):
+        feed_set = set(feeds)
+        with self.lock:
+            removed = [url for url in self.feeds if url not in feed_set]
+            for url in removed:
+                del self.feeds[url]
+            if removed:
+                self.dirty = True
+
+    # Bağlantı geri geldiğinde çağrılır: karantinalar kaldırılır ve bekleme
+    # süreleri en kısaya döner, böylece her akış bir sonraki yenilemede denenir.
+    # Ardışık hata sayısı korunur; gerçekten bozuk bir akış tek bir hatayla
+    # yeniden karantinaya girer.
+    def reset_backoff(self):
+        with self.lock:
+            released = 0
+            for health in self.feeds.values():
+                if health.quarantined_until is not None or health.probe_interval != self.min_probe_interval:
+                    released += health.quarantined_until is not None
+                    health.quarantined_until = None
+                    health.probe_interval = self.min_probe_interval
+                    self.dirty = True
+        if released:
+            logger.info(f"Bağlantı geri geldi, karantinadaki {released} akış yeniden denenecek.")
+        self.save()
+
+feed_health = None
+feed_health_lock = threading.Lock()
+
+def get_feed_health():
+    global feed_health
+    with feed_health_lock:
+        if feed_health is None:
+            feed_health = FeedHealthTracker()
+        return feed_health
+
+# Bu hatalar aynı yenilemede yeniden denenmez: belge yeniden indirilse de aynı
+# sonucu verir (ayrıştırılamayan veya çok büyük akış, 429 dışındaki 4xx yanıtları)
+def is_permanent_fetch_error(error):
+    if isinstance(error, (FeedParseError, FeedTooLargeError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return 400 <= error.response.status_code < 500 and error.response.status_code != 429
+    return False
+
+# Sunucuya hiç ulaşılamadığını gösteren hatalar (kapalı port, çözülemeyen ad,
+# zaman aşımı). Tek bir akışta görülürse akışın, hepsinde görülürse ağın sorunudur.
+def is_network_error(error):
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+# Eşzamanlılık sınırı için akışın sunucusunu (host:port) döndür
+def feed_host(url):
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return url
+
+# RSS verilerini eşzamanlı olarak al.
+# Her akış bir iş parçacığı havuzunda alınır; aynı sunucuya aynı anda en fazla
+# per_host_limit istek yapılır. Başarısız akışlar iş parçacığını uyutmak yerine
+# daha sonraki bir zamana yeniden planlanır, böylece bir akış diğerlerini
+# bekletmez. Tüm yenileme deadline saniyeyi aşarsa kalan akışlar bırakılır.
+# on_feed_entries verilirse her akış başarıyla tamamlandığında (başlık olmasa da)
+# (url, başlıklar) ile, on_feed_failed verilirse tüm denemeleri başarısız olan
+# akış için (url, hata) ile çağrılır; karantinada olduğu için atlanan akışlar da
+# FeedQuarantinedError ile bildirilir. connectivity verilirse bağlantı yokken
+# alınan hatalar devre kesiciye yazılmaz; bağlantı hataları ise denenen her akış
+# bu hatayla düşmediyse yenilemenin sonunda yazılır. Başlıklar depoya, yinelenen ayıklamaya ve
+# banda ulaşmadan önce başlık filtresinden geçer; atılanlar hiç ölçülmez,
+# çizilmez ve seslendirilmez. Öne alınanlar akışın başına taşınır ve boost
+# puanlarıyla banda ulaşır; bant onları henüz görünmeyen başlıkların önüne
+# yerleştirir. Döndürülen birleşik liste de puana göre kararlı sıralıdır.
+def get_rss_feed(feeds, max_retries=3, initial_delay=5, on_feed_entries=None,
+                 deadline=FETCH_DEADLINE, max_workers=FETCH_MAX_WORKERS,
+                 per_host_limit=FETCH_PER_HOST_LIMIT, transport=None, on_feed_failed=None, health=None,
+                 headline_filter=None, connectivity=None):
+    transport = transport or get_feed_transport()
+    health = health or get_feed_health()
+    if headline_filter is None:
+        headline_filter = get_headline_filter()
+    results = {}
+    start_time = time.monotonic()
+    end_time = start_time + deadline
+
+    # (hazır olma zamanı, sıra, url, deneme) öğelerinden oluşan öncelik kuyruğu.
+    # Karantinadaki akışlar istek yapılmadan atlanır.
+    pending = []
+    skipped = []
+    for order, url in enumerate(feeds):
+        if health.allow(url):
+            pending.append((start_time, order, url, 0))
+        else:
+            skipped.append(url)
+    if skipped:
+        logger.info(f"Karantinadaki {len(skipped)} akış bu yenilemede atlandı.")
+        if on_feed_failed:
+            for url in skipped:
+                on_feed_failed(url, FeedQuarantinedError("akış karantinada"))
+    heapq.heapify(pending)
+    in_flight = {}
+    started_at = {}  # url -> son denemenin başlangıcı
+    host_load = {}
+    network_failures = []  # (url, hata); devre kesiciye yenilemenin sonunda yazılır
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss-fetch")
+    try:
+        while pending or in_flight:
+            now = time.monotonic()
+            if now >= end_time:
+                logger.warning(f"RSS yenileme süre sınırı ({deadline} sn) aşıldı, "
+                               f"{len(pending) + len(in_flight)} akış bırakıldı.")
+                # Yanıt vermeyen ve yeniden denemesi bekleyen akışlar başarısız sayılır
+                if connectivity is None or connectivity.available:
+                    for _, _, url, _ in list(in_flight.values()) + [item for item in pending if item[3] > 0]:
+                        health.record_failure(url, "süre sınırı aşıldı")
+                break
+
+            blocked = []
+            while pending and pending[0][0] <= now and len(in_flight) < max_workers:
+                item = heapq.heappop(pending)
+                host = feed_host(item[2])
+                if host_load.get(host, 0) >= per_host_limit:
+                    blocked.append(item)
+                    continue
+                host_load[host] = host_load.get(host, 0) + 1
+                in_flight[executor.submit(fetch_feed_entries, item[2], transport)] = item
+                started_at[item[2]] = time.monotonic()
+            for item in blocked:
+                heapq.heappush(pending, item)
+
+            timeout = end_time - now
+            waiting_retries = [ready_time - now for ready_time, _, _, _ in pending if ready_time > now]
+            if waiting_retries:
+                timeout = min(timeout, min(waiting_retries))
+
+            if not in_flight:
+                time.sleep(max(0, timeout))
+                continue
+
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                ready_time, order, url, attempt = in_flight.pop(future)
+                host = feed_host(url)
+                host_load[host] -= 1
+                try:
+                    entries = future.result()
+                except Exception as e:
+                    get_metrics().inc("rss_feed_responses_total", feed=url, status="error")
+                    permanent = is_permanent_fetch_error(e)
+                    if isinstance(e, FeedParseError):
+                        logger.error(f"RSS ayrıştırma hatası ({url}): {e}")
+                    else:
+                        logger.error(f"RSS alınırken hata ({url}, deneme {attempt + 1}/{max_retries}): {e}")
+                    if not permanent and attempt < max_retries - 1:
+                        delay = initial_delay * (2 ** attempt)
+                        logger.info(f"{delay} saniye sonra tekrar denenecek...")
+                        heapq.heappush(pending, (time.monotonic() + delay, order, url, attempt + 1))
+                    else:
+                        if is_network_error(e):
+                            network_failures.append((url, e))
+                        elif connectivity is None or connectivity.available:
+                            health.record_failure(url, e)
+                        if on_feed_failed:
+                            on_feed_failed(url, e)
+                    continue
+
+                health.record_success(url, time.monotonic() - started_at[url])
+                entries = entries or []
+                ranked = headline_filter.rank(entries)
+                if len(ranked) < len(entries):
+                    get_metrics().inc("rss_filtered_entries_total", len(entries) - len(ranked), feed=url)
+                results[order] = [entry for _, entry in ranked]
+                if on_feed_entries:
+                    on_feed_entries(url, results[order])
+
+        # Denenen her akış bağlantı hatasıyla düştüyse sorun büyük olasılıkla ağdadır
+        if (network_failures and len(network_failures) < len(feeds) - len(skipped)
+                and (connectivity is None or connectivity.available)):
+            for url, error in network_failures:
+                health.record_failure(url, error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        transport.save_validators()
+        health.save()
+
+    logger.debug(f"RSS yenileme {time.monotonic() - start_time:.2f} saniyede tamamlandı "
+                 f"({len(results)}/{len(feeds)} akış).")
+    all_entries = [entry for order in sorted(results) for entry in results[order]]
+    all_entries.sort(key=lambda entry: -entry.boost)
+    if not all_entries:
+        logger.warning("RSS akışlarında başlık bulunamadı.")
+        return None
+    return all_entries
+
+# Akış başına yoklama durumu
+class FeedPollState:
+
+    def __init__(self, now):
+        self.next_poll = now
+        self.in_flight = False
+        self.interval = POLL_DEFAULT_INTERVAL
+        self.item_interval = None  # yeni başlıklar arasındaki sürenin üstel ortalaması
+        self.last_new_item_time = None
+        self.idle_polls = 0
+
+# Her akışı kendi güncellenme hızına göre yoklayan zamanlayıcı.
+# Aralık, akışta gözlenen yeni başlık sıklığının üstel hareketli ortalamasından
+# (EWMA) hesaplanır ve yeni başlık gelmeyen her yoklamada uzar. Akışın RSS ttl
+# değeri ve HTTP Cache-Control/Expires tazelik süresi alt sınır olarak uygulanır,
+# skipHours/skipDays saatleri atlanır. Aynı anda planlanan akışlar rastgele
+# sapmayla dağıtılır ve dakikada en fazla max_requests_per_minute istek yapılır.
+class FeedPollScheduler:
+
+    EWMA_ALPHA = 0.3
+    IDLE_GROWTH = 1.5
+    MAX_IDLE_STEPS = 5
+
+    def __init__(self, hints_for, max_requests_per_minute=POLL_MAX_REQUESTS_PER_MINUTE):
+        self.hints_for = hints_for
+        self.max_requests_per_minute = max_requests_per_minute
+        self.states = {}
+        self.request_times = deque()
+        self.lock = threading.Lock()
+
+    def state_for(self, url, now):
+        state = self.states.get(url)
+        if state is None:
+            state = self.states[url] = FeedPollState(now)
+        return state
+
+    # Zamanı gelmiş akışları en gecikmiş olandan başlayarak, istek sınırını
+    # aşmayacak kadarını seçip yoklanıyor olarak işaretle
+    def take_due_feeds(self, feeds, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            while self.request_times and self.request_times[0] <= now - 60:
+                self.request_times.popleft()
+            budget = self.max_requests_per_minute - len(self.request_times)
+            due = sorted((state.next_poll, url) for url, state in
+                         ((url, self.state_for(url, now)) for url in feeds)
+                         if not state.in_flight and state.next_poll <= now)
+            taken = [url for _, url in due[:max(0, budget)]]
+            for url in taken:
+                self.states[url].in_flight = True
+                self.request_times.append(now)
+            if len(due) > len(taken):
+                logger.debug(f"İstek sınırı nedeniyle {len(due) - len(taken)} akışın yoklaması ertelendi.")
+            return taken
+
+    # Tam yenilemede (akış listesi değiştiğinde) tüm akışlar sınır gözetmeden yoklanır
+    def mark_in_flight(self, feeds, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            for url in feeds:
+                self.state_for(url, now).in_flight = True
+
+    # Bir yoklamanın sonucunu işle ve akışın sonraki yoklama zamanını belirle
+    def record_result(self, url, new_items, failed=False, now=None):
+        now = time.time() if now is None else now
+        hints = self.hints_for(url)
+        with self.lock:
+            state = self.state_for(url, now)
+            state.in_flight = False
+            if failed:
+                state.next_poll = now + max(POLL_MIN_INTERVAL, state.interval)
+                return state.next_poll
+
+            if new_items:
+                if state.last_new_item_time is not None:
+                    observed = (now - state.last_new_item_time) / new_items
+                    if state.item_interval is None:
+                        state.item_interval = observed
+                    else:
+                        state.item_interval = (self.EWMA_ALPHA * observed +
+                                               (1 - self.EWMA_ALPHA) * state.item_interval)
+                state.last_new_item_time = now
+                state.idle_polls = 0
+            else:
+                state.idle_polls = min(state.idle_polls + 1, self.MAX_IDLE_STEPS)
+
+            state.interval = self.poll_interval(state, hints)
+            jittered = state.interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+            state.next_poll = self.skip_forward(now + jittered, hints)
+            return state.next_poll
+
+    def poll_interval(self, state, hints):
+        # Ortalama olarak her yeni başlık için iki yoklama yapılır
+        interval = state.item_interval / 2 if state.item_interval else POLL_DEFAULT_INTERVAL
+        interval *= self.IDLE_GROWTH ** state.idle_polls
+
+        floor = POLL_MIN_INTERVAL
+        if hints.get("ttl"):
+            floor = max(floor, hints["ttl"] * 60)
+        if hints.get("max_age"):
+            floor = max(floor, hints["max_age"])
+        return min(max(interval, floor), max(POLL_MAX_INTERVAL, floor))
+
+    # Yoklama zamanı akışın atlanmasını istediği bir saate (GMT) veya güne
+    # denk geliyorsa izin verilen ilk saat başına ertele
+    @staticmethod
+    def skip_forward(timestamp, hints):
+        skip_hours = set(hints.get("skip_hours") or ())
+        skip_days = set(hints.get("skip_days") or ())
+        if not skip_hours and not skip_days:
+            return timestamp
+        for _ in range(24 * 7):
+            moment = datetime.fromtimestamp(timestamp, timezone.utc)
+            if moment.hour not in skip_hours and moment.weekday() not in skip_days:
+                return timestamp
+            timestamp = (moment.replace(minute=0, second=0, microsecond=0).timestamp() + 3600)
+        return timestamp
+
+    def seconds_until_next(self, feeds, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            waiting = [self.state_for(url, now).next_poll for url in feeds
+                       if not self.state_for(url, now).in_flight]
+        if not waiting:
+            return None
+        return max(0.0, min(waiting) - now)
+
+    def forget_removed(self, feeds):
+        feed_set = set(feeds)
+        with self.lock:
+            for url in [url for url in self.states if url not in feed_set]:
+                del self.states[url]
+
+# Cairo ARGB32 formatını sürümden bağımsız olarak döndür
+def cairo_argb32_format():
+    try:
+        return cairo.Format.ARGB32
+    except AttributeError:
+        return cairo.FORMAT_ARGB32
+
+# Kayan metin bandını karolar (tile) halinde önceden çizip önbellekte tutar.
+# Her karede tüm başlık dizisini yeniden şekillendirip çizmek yerine yalnızca
+# görünür alanla kesişen bir-iki karo pencereye kopyalanır.
+class TextBandRenderer:
+
+    TILE_WIDTH = 1024
+    # Önbellek sınırı görünüm genişliğinden hesaplanır: iki karoya taşan görünür
+    # alan ve kaydırma yönündeki bir sonraki karo her zaman sığar
+    EXTRA_CACHED_TILES = 2
+    SHADOW_OFFSET = 1
+
+    def __init__(self, set_font_settings):
+        self.set_font_settings = set_font_settings
+        self.runs = []  # (başlangıç_px, bitiş_px, metin), başlangıca göre sıralı
+        self.run_ends = []
+        self.content_width = 0
+        self.height = 0
+        self.scale = 1
+        self.tiles = OrderedDict()
+
+    def set_content(self, runs, content_width, height, scale=1):
+        self.runs = runs
+        self.run_ends = [end for _, end, _ in runs]
+        self.content_width = content_width
+        self.height = max(1, height)
+        self.scale = max(1, scale)
+        self.tiles.clear()
+
+    def clear(self):
+        self.set_content([], 0, self.height, self.scale)
+
+    # Bandın sonuna yeni parçalar ekle; yalnızca eski içeriğin sonuna denk gelen
+    # ve sonrasındaki karolar geçersiz olur, görünür karolar korunur
+    def extend_content(self, runs, content_width):
+        first_dirty_tile = max(0, int(math.floor((self.content_width - self.height) / self.TILE_WIDTH)))
+        self.runs.extend(runs)
+        self.run_ends.extend(end for _, end, _ in runs)
+        self.content_width = content_width
+        for index in [i for i in self.tiles if i >= first_dirty_tile]:
+            del self.tiles[index]
+
+    # Verilen konumdan sonraki parçaları at; ardından gelen extend_content o
+    # konumdan sonraki karoları geçersiz kılar
+    def truncate_content(self, content_width):
+        keep = bisect.bisect_right(self.run_ends, content_width)
+        del self.runs[keep:]
+        del self.run_ends[keep:]
+        self.content_width = content_width
+
+    def tile_indices(self, x_position, view_width, lookahead=0):
+        if self.content_width <= 0:
+            return range(0)
+        band_left = -x_position
+        last_tile = int(math.ceil(self.content_width / self.TILE_WIDTH)) - 1
+        first = max(0, int(math.floor(band_left / self.TILE_WIDTH)))
+        last = min(last_tile, int(math.floor((band_left + view_width + lookahead) / self.TILE_WIDTH)))
+        return range(first, last + 1)
+
+    def needs_prerender(self, x_position, view_width):
+        return any(index not in self.tiles
+                   for index in self.tile_indices(x_position, view_width, self.TILE_WIDTH))
+
+    def prerender(self, x_position, view_width):
+        # Görünür karolarla birlikte kaydırma yönündeki bir sonraki karoyu da hazırla
+        for index in self.tile_indices(x_position, view_width, self.TILE_WIDTH):
+            self._get_tile(index)
+        self._evict(x_position, view_width)
+
+    def draw(self, cr, x_position, view_width):
+        # Karolar tam piksele hizalanır, böylece kopyalama sırasında metin bulanıklaşmaz
+        origin = round(x_position)
+        for index in self.tile_indices(x_position, view_width):
+            tile = self._get_tile(index)
+            tile_screen_x = origin + index * self.TILE_WIDTH
+            cr.set_source_surface(tile, tile_screen_x, 0)
+            cr.rectangle(tile_screen_x, 0, self.TILE_WIDTH, self.height)
+            cr.fill()
+        self._evict(x_position, view_width)
+
+    def _get_tile(self, index):
+        tile = self.tiles.get(index)
+        if tile is None:
+            tile = self._render_tile(index)
+            self.tiles[index] = tile
+        else:
+            self.tiles.move_to_end(index)
+        return tile
+
+    def _evict(self, x_position, view_width):
+        # Ekranın solundan çıkmış karoları ve sınırı aşan en eski karoları at
+        visible = self.tile_indices(x_position, view_width)
+        first_visible = visible.start if visible else 0
+        for index in [i for i in self.tiles if i < first_visible]:
+            del self.tiles[index]
+        max_tiles = int(math.ceil(view_width / self.TILE_WIDTH)) + self.EXTRA_CACHED_TILES
+        while len(self.tiles) > max_tiles:
+            self.tiles.popitem(last=False)
+
+    def _render_tile(self, index):
+        tile_x = index * self.TILE_WIDTH
+        surface = cairo.ImageSurface(cairo_argb32_format(),
+                                     int(math.ceil(self.TILE_WIDTH * self.scale)),
+                                     int(math.ceil(self.height * self.scale)))
+        if self.scale != 1:
+            surface.set_device_scale(self.scale, self.scale)
+        cr = cairo.Context(surface)
+        self.set_font_settings(cr, self.height * 0.7)
+        fascent, fdescent, fheight, fxadvance, fyadvance = cr.font_extents()
+        text_y = (self.height / 2) + (fheight / 2) - fdescent
+
+        # Karo sınırından taşan glifler için her iki yanda bir yükseklik kadar pay bırak
+        margin = self.height
+        tile_runs = []
+        for i in range(bisect.bisect_left(self.run_ends, tile_x - margin), len(self.runs)):
+            start_px, _, text = self.runs[i]
+            if start_px > tile_x + self.TILE_WIDTH + margin:
+                break
+            tile_runs.append((start_px - tile_x, text))
+
+        # Önce gölge (siyah, 1 piksel kaydırılmış), sonra ana metin (beyaz)
+        cr.set_source_rgb(0, 0, 0)
+        for run_x, text in tile_runs:
+            cr.move_to(run_x + self.SHADOW_OFFSET, text_y + self.SHADOW_OFFSET)
+            cr.show_text(text)
+        cr.set_source_rgb(1, 1, 1)
+        for run_x, text in tile_runs:
+            cr.move_to(run_x, text_y)
+            cr.show_text(text)
+        surface.flush()
+        return surface
+
+# Metin genişliklerini tek bir paylaşılan Cairo bağlamıyla ölçer ve
+# (yazı tipi, boyut, metin) anahtarıyla LRU önbellekte tutar. Her ölçümde
+# ekran genişliğinde yeni bir yüzey ayırmak ve aynı başlıkları (ve ayırıcıyı)
+# tekrar tekrar ölçmek gerekmez.
+class TextMeasurer:
+
+    MAX_CACHED_EXTENTS = 8192
+
+    def __init__(self, set_font_settings, font_key):
+        self.context = cairo.Context(cairo.ImageSurface(cairo_argb32_format(), 1, 1))
+        self.set_font_settings = set_font_settings
+        self.font_key = font_key
+        self.context_font_size = None
+        self.extents = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def text_width(self, text, font_size):
+        key = (self.font_key, font_size, text)
+        width = self.extents.get(key)
+        if width is not None:
+            self.extents.move_to_end(key)
+            self.hits += 1
+            return width
+
+        self.misses += 1
+        if font_size != self.context_font_size:
+            self.set_font_settings(self.context, font_size)
+            self.context_font_size = font_size
+        _, _, _, _, width, _ = self.context.text_extents(text)
+        self.extents[key] = width
+        if len(self.extents) > self.MAX_CACHED_EXTENTS:
+            self.extents.popitem(last=False)
+        return width
+
+# Başlıkların bant içindeki başlangıç konumlarına göre sıralı dizini.
+# Fare konumundaki başlık doğrusal tarama yerine ikili arama ile bulunur.
+class TitleOffsetIndex:
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def rebuild(self, positions):
+        self.starts = [start_px for start_px, _ in positions]
+        self.ends = [end_px for _, end_px in positions]
+
+    def append(self, start_px, end_px):
+        self.starts.append(start_px)
+        self.ends.append(end_px)
+
+    # Bant koordinatındaki noktayı içeren başlığın sırasını döndür
+    def find(self, band_x):
+        index = bisect.bisect_right(self.starts, band_x) - 1
+        if index >= 0 and band_x <= self.ends[index]:
+            return index
+        return None
+
+# Kare süresi ve düşen kare istatistikleri
+class FrameStats:
+
+    WINDOW_SIZE = 600
+    LOG_INTERVAL = 30
+
+    def __init__(self):
+        self.frame_times = deque(maxlen=self.WINDOW_SIZE)
+        self.total_frames = 0
+        self.dropped_frames = 0
+        self.last_log_time = time.monotonic()
+
+    def record(self, frame_seconds, refresh_interval):
+        self.total_frames += 1
+        self.frame_times.append(frame_seconds)
+        # Beklenen yenileme aralığının 1.5 katından uzun süren kareler düşmüş sayılır
+        if refresh_interval and frame_seconds > refresh_interval * 1.5:
+            self.dropped_frames += int(round(frame_seconds / refresh_interval)) - 1
+
+        now = time.monotonic()
+        if now - self.last_log_time >= self.LOG_INTERVAL:
+            self.last_log_time = now
+            stats = self.snapshot()
+            logger.debug(f"Kare istatistikleri: {stats['fps']:.1f} FPS, ortalama {stats['avg_ms']:.2f} ms, "
+                         f"p95 {stats['p95_ms']:.2f} ms, en uzun {stats['max_ms']:.2f} ms, "
+                         f"düşen kare {stats['dropped_frames']}/{stats['total_frames']}")
+
+    def reset_window(self):
+        self.frame_times.clear()
+
+    def snapshot(self):
+        times = sorted(self.frame_times)
+        if not times:
+            return {'total_frames': self.total_frames, 'dropped_frames': self.dropped_frames,
+                    'fps': 0.0, 'avg_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        average = sum(times) / len(times)
+        return {
+            'total_frames': self.total_frames,
+            'dropped_frames': self.dropped_frames,
+            'fps': 1 / average if average > 0 else 0.0,
+            'avg_ms': average * 1000,
+            'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+            'max_ms': times[-1] * 1000,
+        }
+
+# Seslendirme zamanlayıcısı.
+# Pencere, kaydırma konumu ve hızından her başlığın tetikleme noktasına ne
+# zaman varacağını tahmin eder; sıradaki birkaç başlık tek bir ön sentez iş
+# parçacığında önceden sentezlenir. Oynatma tek bir kuyruktan sırayla yapılır,
+# böylece seslendirmeler üst üste binmez. Bant yeniden başladığında veya
+# yenilendiğinde eski öğeler atılır; ekrandan çıkmış başlıklar seslendirilmez.
+class SpeechScheduler:
+
+    LOOKAHEAD = 3
+    MAX_PLAY_QUEUE = 3
+    PREPARE_WAIT_TIMEOUT = PIPER_TIMEOUT
+
+    def __init__(self, on_spoken=None):
+        self.on_spoken = on_spoken
+        self.condition = threading.Condition()
+        self.generation = 0
+        self.prepare_heap = []  # (tahmini tetiklenme zamanı, sıra, metin)
+        self.prepare_sequence = 0
+        self.queued_texts = set()
+        self.preparing = {}  # metin -> ön sentez bitince işaretlenen Event
+        self.play_queue = deque()  # (nesil, son geçerlilik zamanı, başlık)
+        threading.Thread(target=self.prepare_loop, name="speech-prepare", daemon=True).start()
+        threading.Thread(target=self.play_loop, name="speech-play", daemon=True).start()
+
+    # Bant yeniden başladı veya yenilendi: bekleyen tüm öğeleri geçersiz kıl
+    def reset(self):
+        with self.condition:
+            self.generation += 1
+            self.prepare_heap.clear()
+            self.queued_texts.clear()
+            self.play_queue.clear()
+
+    # upcoming: (tetiklenmeye kalan saniye, metin) çiftleri
+    def prepare(self, upcoming):
+        now = time.monotonic()
+        with self.condition:
+            for eta, text in upcoming:
+                if text in self.queued_texts or text in self.preparing:
+                    continue
+                self.prepare_sequence += 1
+                heapq.heappush(self.prepare_heap, (now + eta, self.prepare_sequence, text))
+                self.queued_texts.add(text)
+            self.condition.notify_all()
+
+    def enqueue_playback(self, entry, expires_at):
+        with self.condition:
+            self.play_queue.append((self.generation, expires_at, entry))
+            while len(self.play_queue) > self.MAX_PLAY_QUEUE:
+                _, _, dropped = self.play_queue.popleft()
+                logger.debug(f"Seslendirme kuyruğu dolu, atlandı: {dropped.title[:50]}")
+            self.condition.notify_all()
+
+    def queue_depth(self):
+        with self.condition:
+            return len(self.play_queue)
+
+    def prepare_loop(self):
+        while True:
+            with self.condition:
+                while not self.prepare_heap:
+                    self.condition.wait()
+                _, _, text = heapq.heappop(self.prepare_heap)
+                self.queued_texts.discard(text)
+                done = threading.Event()
+                self.preparing[text] = done
+            try:
+                presynthesize_text(text)
+            finally:
+                with self.condition:
+                    self.preparing.pop(text, None)
+                done.set()
+
+    def play_loop(self):
+        while True:
+            with self.condition:
+                while not self.play_queue:
+                    self.condition.wait()
+                generation, expires_at, entry = self.play_queue.popleft()
+                if generation != self.generation:
+                    continue
+                preparing = self.preparing.get(entry.title)
+
+            if time.monotonic() > expires_at:
+                logger.debug(f"Başlık ekrandan çıktı, seslendirilmedi: {entry.title[:50]}")
+                continue
+            # Başlık şu anda ön sentezdeyse bitmesini bekle, sonra önbellekten oynat
+            if preparing is not None:
+                preparing.wait(self.PREPARE_WAIT_TIMEOUT)
+            speak_text(entry.title)
+            if self.on_spoken:
+                try:
+                    self.on_spoken(entry)
+                except Exception as e:
+                    logger.error(f"Seslendirme sonrası işlem hatası: {e}")
 
-# Log ayarları
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
+# Başlıkları servis ile pencereler arasında JSON olarak taşı
+def entry_to_message(entry):
+    return {
+        "title": entry.title,
+        "link": entry.link,
+        "guid": entry.guid,
+        "description": (entry.raw_description or b"").decode("utf-8", "replace"),
+        "feed": entry.feed,
+        "first_seen": entry.first_seen,
+        "boost": entry.boost,
+    }
 
-# Konfigürasyon dosyası ayarları
-CONFIG_DIR = os.path.expanduser("~/.config")
-CONFIG_FILE = os.path.join(CONFIG_DIR, "rss.ini")
-DEFAULT_RSS_URL = "https://www.gercekgundem.com/rss/"
+def entry_from_message(data):
+    return FeedEntry(data["title"], data.get("link", ""), data.get("guid", ""),
+                     data.get("description", "").encode("utf-8"), data.get("feed", ""),
+                     data.get("first_seen"), data.get("boost", 0))
 
-# Ses cihazını başlatmak için boş ses çal
-def initialize_audio():
-    try:
-        command = ["aplay", "-r", "22050", "-f", "S16_LE", "-t", "raw", "/dev/zero"]
-        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        try:
-            proc.wait(timeout=1)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            logger.debug("Ses cihazı başlatma denemesi zaman aşımına uğradı, devam ediliyor.")
-        except Exception as e:
-            logger.error(f"aplay başlatma sürecinde hata: {e}")
-    except FileNotFoundError:
-        logger.error("aplay komutu bulunamadı. Lütfen aplay'in yüklü olduğundan emin olun.")
-    except Exception as e:
-        logger.error(f"Ses cihazı başlatma hatası: {e}")
+# Satır başına bir JSON iletisini sokete ayrı bir iş parçacığıyla yazan kuyruk.
+# Karşı taraf yavaşlar veya soket tamponu dolarsa gönderen (GTK ana döngüsü ya
+# da servis) beklemez. Kuyruk MAX_PENDING iletiye ulaşınca yeni ileti
+# kuyruğa alınmaz ve on_overflow çağrılır.
+class MessageWriter:
 
-# Metni seslendirme fonksiyonu (RAM'de işleme)
-def speak_text(text):
-    if not text or text.isspace() or re.fullmatch(r'[- .]*', text):
-        return
+    MAX_PENDING = 256
+    PEER_NAME = "Karşı tarafa"  # günlük iletileri için
 
-    try:
-        cleaned_text = re.sub(r'\s*----------\s*', '. ', text).strip()
-        if len(cleaned_text) < 10:
-            return
+    def __init__(self, sock, thread_name):
+        self.socket = sock
+        self.condition = threading.Condition()
+        self.pending = deque()
+        self.closed = False
+        self.dropping = False  # son yazımdan beri ileti atıldı mı
+        threading.Thread(target=self.write_loop, name=thread_name, daemon=True).start()
 
-        escaped_text_for_shell = cleaned_text.replace("'", "'\"'\"'")
-        quoted_text = f"'{escaped_text_for_shell}'"
-
-        home_dir = os.path.expanduser("~")
-        model_dir = os.path.join(home_dir, "piper-voices", "tr", "tr_TR", "fettah", "medium")
-        os.makedirs(model_dir, exist_ok=True)
-
-        model_files = {
-            "model": {
-                "url": "https://huggingface.co/rhasspy/piper-voices/raw/main/tr/tr_TR/fettah/medium/tr_TR-fettah-medium.onnx",
-                "path": os.path.join(model_dir, "tr_TR-fettah-medium.onnx")
-            },
-            "config": {
-                "url": "https://huggingface.co/rhasspy/piper-voices/raw/main/tr/tr_TR/fettah/medium/tr_TR-fettah-medium.onnx.json",
-                "path": os.path.join(model_dir, "tr_TR-fettah-medium.onnx.json")
-            }
-        }
+    def send(self, message):
+        data = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+        with self.condition:
+            if self.closed:
+                return
+            overflow = len(self.pending) >= self.MAX_PENDING
+            if not overflow:
+                self.pending.append(data)
+                self.condition.notify()
+        if overflow:
+            self.on_overflow()
 
-        for file_type, file_info in model_files.items():
-            if not os.path.exists(file_info["path"]):
-                logger.info(f"{file_type} dosyası indiriliyor: {file_info['url']}")
-                try:
-                    response = requests.get(file_info["url"], stream=True, timeout=10)
-                    response.raise_for_status()
-                    with open(file_info["path"], "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    logger.info(f"{file_type} dosyası indirildi: {file_info['path']}")
-                except Exception as e:
-                    logger.error(f"{file_type} dosyası indirilemedi: {e}")
+    def on_overflow(self):
+        pass
+
+    def write_loop(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if self.closed:
                     return
+                data = self.pending.popleft()
+                self.dropping = False
+            try:
+                self.socket.sendall(data)
+            except OSError as e:
+                logger.debug(f"{self.PEER_NAME} ileti gönderilemedi: {e}")
+                self.close()
+                return
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.pending.clear()
+            self.condition.notify()
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+# Pencerenin ortak servise bağlantısı. Servisten satır satır gelen JSON
+# iletileri ana döngüye GLib.idle_add ile iletilir.
+class DaemonClient(MessageWriter):
+
+    PEER_NAME = "Ortak servise"
 
-        piper_command = (
-            f"echo {quoted_text} | piper "
-            f"--model {model_files['model']['path']} "
-            f"--config {model_files['config']['path']} "
-            f"--length-scale 0.733 "
-            "--output_raw"
-        )
+    def __init__(self, sock):
+        super().__init__(sock, "daemon-writer")
 
-        piper_process = subprocess.Popen(piper_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=False)
+    @classmethod
+    def connect(cls, socket_path=DAEMON_SOCKET_PATH):
+        if not os.path.exists(socket_path):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            logger.debug(f"Ortak servise bağlanılamadı ({socket_path}): {e}")
+            sock.close()
+            return None
+        logger.info(f"Ortak servise bağlanıldı: {socket_path}")
+        return cls(sock)
+
+    def start(self, on_message, on_disconnect):
+        threading.Thread(target=self.read_loop, args=(on_message, on_disconnect),
+                         name="daemon-reader", daemon=True).start()
 
+    def read_loop(self, on_message, on_disconnect):
         try:
-            audio_data, piper_stderr = piper_process.communicate(timeout=15)
-        except subprocess.TimeoutExpired:
-            piper_process.kill()
-            logger.error("Piper komutu zaman aşımına uğradı.")
-            return
+            with self.socket.makefile("rb") as reader:
+                for line in reader:
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ortak servisten geçersiz ileti alındı.")
+                        continue
+                    GLib.idle_add(on_message, message)
+        except OSError as e:
+            logger.debug(f"Ortak servis okuma hatası: {e}")
+        GLib.idle_add(on_disconnect)
 
-        if piper_stderr:
-            stderr_str = piper_stderr.decode('utf-8', errors='ignore')
-            meaningful_stderr_lines = [line for line in stderr_str.splitlines() if not line.strip().startswith("Playing raw data")]
-            if meaningful_stderr_lines:
-                logger.error(f"Piper stderr: {'\\n'.join(meaningful_stderr_lines)}")
+    # Kuyruk doluysa ileti atılır; seslendirme ve ön sentez istekleri zaten
+    # süreye bağlıdır ve servis yanıt vermezse okuma tarafı bağlantıyı kapatır
+    def on_overflow(self):
+        with self.condition:
+            if self.dropping:
+                return
+            self.dropping = True
+        logger.warning("Ortak servis iletileri okumuyor, yeni iletiler atlanıyor.")
 
-        if piper_process.returncode != 0:
-            logger.error(f"Piper komutu başarısız, çıkış kodu: {piper_process.returncode}")
-            return
+    def close(self):
+        super().close()
+        self.socket.close()
 
-        if not audio_data:
-            logger.warning("Piper'dan ses verisi alınamadı.")
-            return
+# Seslendirmeyi ortak servisin kuyruğuna ileten, SpeechScheduler ile aynı
+# arayüze sahip zamanlayıcı. Bitiş zamanı süreçler arasında monotonic saat
+# paylaşılmadığı için kalan süre olarak gönderilir.
+class RemoteSpeechScheduler:
+
+    def __init__(self, client):
+        self.client = client
+
+    # Ortak kuyruk diğer pencerelerin başlıklarını da taşıdığından temizlenmez
+    def reset(self):
+        pass
+
+    def prepare(self, upcoming):
+        self.client.send({"type": "prepare", "items": [[eta, text] for eta, text in upcoming]})
+
+    def enqueue_playback(self, entry, expires_at):
+        self.client.send({"type": "speak", "key": entry_key(entry), "title": entry.title,
+                          "expires_in": max(0.0, expires_at - time.monotonic())})
+
+    def queue_depth(self):
+        return 0
+
+# Servise bağlı bir pencere. Yavaş veya donmuş bir pencere servisi ve diğer
+# pencereleri bekletmez; kuyruğu dolarsa bağlantısı kapatılır.
+class DaemonConnection(MessageWriter):
+
+    PEER_NAME = "Pencereye"
 
-        audio_buffer = io.BytesIO(audio_data)
+    def __init__(self, sock):
+        super().__init__(sock, "daemon-client")
 
-        aplay_command = ["aplay", "-r", "22050", "-f", "S16_LE", "-t", "raw", "-"]
-        aplay_process = subprocess.Popen(aplay_command, stdin=subprocess.PIPE, stderr=subprocess.PIPE, text=False)
+    def on_overflow(self):
+        logger.warning("Pencere iletileri okumuyor, bağlantısı kapatılıyor.")
+        self.close()
 
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        daemon = self.server.feed_daemon
+        connection = DaemonConnection(self.connection)
+        daemon.add_client(connection)
         try:
-            _, aplay_stderr = aplay_process.communicate(input=audio_buffer.getvalue(), timeout=15)
-        except subprocess.TimeoutExpired:
-            aplay_process.kill()
-            logger.error("Aplay komutu zaman aşımına uğradı.")
-            return
+            for line in self.rfile:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    logger.warning("Pencereden geçersiz ileti alındı.")
+                    continue
+                if isinstance(message, dict):
+                    daemon.handle_message(message)
+        except OSError as e:
+            logger.debug(f"Pencere bağlantısı okuma hatası: {e}")
+        finally:
+            daemon.remove_client(connection)
+            connection.close()
 
-        if aplay_stderr:
-            stderr_str = aplay_stderr.decode('utf-8', errors='ignore')
-            meaningful_stderr_lines = [line for line in stderr_str.splitlines() if not line.strip().startswith("Playing raw data")]
-            if meaningful_stderr_lines:
-                logger.error(f"Aplay stderr: {'\\n'.join(meaningful_stderr_lines)}")
+# Ekransız ortak servis (--daemon). Akış listesi, alma ve yoklama, depo,
+# yinelenen haber ayıklama ve seslendirme kuyruğu burada bir kez çalışır;
+# pencereler Unix soketinden bağlanıp önce tüm başlıkları, sonra yalnızca
+# yeni veya değişmiş başlıkları alır ve seslendirme isteklerini buraya iletir.
+#
+# İletiler satır başına bir JSON nesnesidir:
+#   servis -> pencere: snapshot (feeds, entries), entries, feeds, fetch_failed
+#   pencere -> servis: speak (key, title, expires_in), prepare (items), reload
+class FeedDaemon:
 
-        if aplay_process.returncode != 0:
-            logger.error(f"Aplay komutu başarısız, çıkış kodu: {aplay_process.returncode}")
-            return
+    RECENT_FETCH_WINDOW = 30
 
-    except FileNotFoundError:
-        logger.error("Piper veya aplay komutu bulunamadı. Lütfen kurulu olduklarından ve PATH'inizde olduklarından veya tam yolların doğru olduğundan emin olun.")
-    except Exception as e:
-        logger.error(f"Seslendirme hatası: {e}")
+    def __init__(self, socket_path=DAEMON_SOCKET_PATH):
+        self.socket_path = socket_path
+        self.rss_feeds = load_rss_feeds()
+        self.entry_store = EntryStore()
+        self.story_deduplicator = StoryDeduplicator()
+        self.poll_scheduler = FeedPollScheduler(get_feed_transport().hints_for)
+        self.poll_source_id = None
+        self.speech_scheduler = SpeechScheduler(on_spoken=self.entry_store.mark_spoken)
+        self.lock = threading.Lock()
+        self.entries = []
+        self.entry_positions = {}  # entry_key -> self.entries içindeki sıra
+        self.clients = []
+        self.recent_speech = {}  # entry_key -> son seslendirme isteğinin zamanı
+        self.fetch_generation = 0
+        self.last_fetch_started = float('-inf')
+        self.connectivity = ConnectivityMonitor(self.on_connectivity_changed, self.on_connectivity_retry)
+        self.network_available = self.connectivity.available
+        self.metrics = get_metrics()
+        self.metrics.add_collector(self.collect_metrics)
+        self.main_loop = GLib.MainLoop()
+        self.server = None
 
-# Konfigürasyon dosyasını oku ve varsayılan RSS adresini ekle
-def load_rss_feeds():
-    config = configparser.ConfigParser()
-    os.makedirs(CONFIG_DIR, exist_ok=True)
+    # Soket başka bir servis tarafından kullanılıyorsa False döndür
+    def bind(self):
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                logger.error(f"Ortak servis zaten çalışıyor: {self.socket_path}")
+                return False
+            except OSError:
+                logger.debug(f"Eski soket dosyası siliniyor: {self.socket_path}")
+                os.unlink(self.socket_path)
+            finally:
+                probe.close()
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, DaemonRequestHandler)
+        self.server.daemon_threads = True
+        self.server.feed_daemon = self
+        os.chmod(self.socket_path, 0o600)
+        return True
 
-    if not os.path.exists(CONFIG_FILE):
-        config['RSS'] = {'feeds': DEFAULT_RSS_URL}
-        with open(CONFIG_FILE, 'w') as configfile:
-            config.write(configfile)
-        logger.info(f"Konfigürasyon dosyası oluşturuldu: {CONFIG_FILE}")
-    else:
-        config.read(CONFIG_FILE)
-        if 'RSS' not in config or 'feeds' not in config['RSS']:
-            config['RSS'] = {'feeds': DEFAULT_RSS_URL}
-            with open(CONFIG_FILE, 'w') as configfile:
-                config.write(configfile)
-            logger.info(f"Konfigürasyon dosyasına varsayılan RSS adresi eklendi.")
+    def run(self):
+        if not self.bind():
+            return False
+        threading.Thread(target=self.server.serve_forever, name="daemon-server", daemon=True).start()
+        logger.info(f"Ortak servis {self.socket_path} üzerinde dinliyor.")
 
-    feeds = config['RSS'].get('feeds', DEFAULT_RSS_URL).split(',')
-    feeds = [feed.strip() for feed in feeds if feed.strip()]
-    if not feeds:
-        feeds = [DEFAULT_RSS_URL]
-    return feeds
+        stored_entries = self.entry_store.load_entries(self.rss_feeds)
+        get_feed_transport().seed(stored_entries)
+        stored_entries = self.story_deduplicator.filter(get_headline_filter().filter(stored_entries))
+        if stored_entries:
+            logger.info(f"Depodan {len(stored_entries)} başlık yüklendi.")
+            with self.lock:
+                self.set_entries_locked(apply_entry_retention(stored_entries))
 
-# Konfigürasyon dosyasına RSS feed'lerini kaydet
-def save_rss_feeds(feeds):
-    config = configparser.ConfigParser()
-    config['RSS'] = {'feeds': ','.join(feeds)}
-    with open(CONFIG_FILE, 'w') as configfile:
-        config.write(configfile)
-    logger.info(f"RSS feed'leri kaydedildi: {CONFIG_FILE}")
-
-# Ağ bağlantısını kontrol et
-def check_network():
-    try:
-        socket.create_connection(("8.8.8.8", 53), timeout=5)
+        threading.Thread(target=initialize_audio, daemon=True).start()
+        self.update_rss()
+        self.schedule_next_poll()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal_number, self.stop)
+        try:
+            self.main_loop.run()
+        finally:
+            self.server.shutdown()
+            self.server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+            get_feed_parse_pool().shutdown()
         return True
-    except OSError as e:
-        logger.debug(f"Ağ bağlantısı kontrolü başarısız: {e}")
+
+    def stop(self):
+        logger.info("Ortak servis kapatılıyor.")
+        self.main_loop.quit()
         return False
 
-# RSS verilerini almak ve HTML'i temizlemek
-def get_rss_feed(feeds, max_retries=3, initial_delay=5):
-    all_entries = []
-    for url in feeds:
-        for attempt in range(max_retries):
+    # Yeni pencereye tüm başlıkları gönder ve yayın listesine ekle. Kilit,
+    # anlık görüntü ile sonraki farkların sırasının karışmamasını sağlar.
+    def add_client(self, connection):
+        with self.lock:
+            connection.send({"type": "snapshot", "feeds": self.rss_feeds,
+                             "entries": [entry_to_message(entry) for entry in self.entries]})
+            self.clients.append(connection)
+            logger.info(f"Pencere bağlandı ({len(self.clients)} bağlı).")
+
+    def remove_client(self, connection):
+        with self.lock:
+            if connection in self.clients:
+                self.clients.remove(connection)
+                logger.info(f"Pencere ayrıldı ({len(self.clients)} bağlı).")
+
+    def broadcast_locked(self, message):
+        for connection in self.clients:
+            connection.send(message)
+
+    def set_entries_locked(self, entries):
+        self.entries = entries
+        self.entry_positions = {entry_key(entry): i for i, entry in enumerate(self.entries)}
+        self.story_deduplicator.retain(self.entry_positions)
+
+    def collect_metrics(self, registry):
+        registry.set("rss_tts_queue_depth", self.speech_scheduler.queue_depth())
+        with self.lock:
+            registry.set("rss_band_entries", len(self.entries))
+            registry.set("rss_daemon_clients", len(self.clients))
+
+    # Pencerelerden gelen iletiler (bağlantı iş parçacıklarında çağrılır)
+    def handle_message(self, message):
+        kind = message.get("type")
+        if kind == "speak":
+            self.request_speech(message)
+        elif kind == "prepare":
             try:
-                feed = feedparser.parse(url, request_headers={'User-agent': 'RSSReadScrollWindow'})
-                if feed.bozo:
-                    logger.error(f"RSS ayrıştırma hatası ({url}): {feed.bozo_exception}")
-                    continue
+                upcoming = [(float(eta), str(text)) for eta, text in message.get("items", ())]
+            except (TypeError, ValueError):
+                logger.warning("Geçersiz ön sentez isteği alındı.")
+                return
+            self.speech_scheduler.prepare(upcoming)
+        elif kind == "reload":
+            GLib.idle_add(self.reload_feeds)
+        else:
+            logger.warning(f"Bilinmeyen ileti türü: {kind}")
 
-                for entry in feed.entries:
-                    if not (hasattr(entry, "title") and entry.title.strip()):
-                        continue
+    # Her pencere başlığı kendi bandında tetikleme noktasına geldiğinde ister;
+    # aynı başlık yalnızca bir kez seslendirilir
+    def request_speech(self, message):
+        title = message.get("title")
+        if not isinstance(title, str) or not title:
+            return
+        key = message.get("key") or title
+        try:
+            expires_in = max(0.0, float(message.get("expires_in", 0)))
+        except (TypeError, ValueError):
+            return
+        now = time.monotonic()
+        with self.lock:
+            last_requested = self.recent_speech.get(key)
+            if last_requested is not None and now - last_requested < DAEMON_SPEECH_REPEAT_WINDOW:
+                return
+            self.recent_speech[key] = now
+            if len(self.recent_speech) > 4 * SpeechScheduler.MAX_PLAY_QUEUE + 64:
+                self.recent_speech = {k: t for k, t in self.recent_speech.items()
+                                      if now - t < DAEMON_SPEECH_REPEAT_WINDOW}
+            position = self.entry_positions.get(key)
+            entry = self.entries[position] if position is not None else FeedEntry(title, guid=key)
+        self.speech_scheduler.enqueue_playback(entry, now + expires_in)
 
-                    raw_description = getattr(entry, 'description', getattr(entry, 'summary', '')).strip()
-                    if not raw_description:
-                        description = "Açıklama bulunamadı."
-                    else:
-                        try:
-                            doc = lxml.html.fromstring(raw_description)
-                            for a_tag in doc.xpath('//a'):
-                                a_tag.drop_tree()
-                            h4_elements = doc.xpath('//h4')
-                            if h4_elements:
-                                description = h4_elements[0].text_content().strip()
-                            else:
-                                description = doc.text_content().strip()
-                            if not description:
-                                description = "Açıklama bulunamadı."
-                        except Exception as e:
-                            logger.error(f"HTML ayrıştırma hatası: {e}")
-                            description = "Açıklama ayrıştırılamadı."
-
-                    link = getattr(entry, 'link', '').strip()
-                    if not link:
-                        logger.warning(f"Başlık için link bulunamadı: {entry.title[:50]}...")
-
-                    all_entries.append({
-                        'title': entry.title.strip(),
-                        'description': description,
-                        'link': link
-                    })
-                break
-            except Exception as e:
-                logger.error(f"RSS alınırken hata ({url}, deneme {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    delay = initial_delay * (2 ** attempt)
-                    logger.info(f"{delay} saniye sonra tekrar denenecek...")
-                    time.sleep(delay)
-                continue
-    if not all_entries:
-        logger.warning("RSS akışlarında başlık bulunamadı.")
-        return None
-    return all_entries
+    # Bir pencere akış listesini değiştirdi: yapılandırmayı yeniden oku, çıkarılan
+    # akışların başlıklarını at ve yalnızca yeni eklenen akışları al
+    def reload_feeds(self):
+        previous = set(self.rss_feeds)
+        self.rss_feeds = load_rss_feeds()
+        added = [url for url in self.rss_feeds if url not in previous]
+        logger.info(f"Akış listesi yeniden yüklendi ({len(self.rss_feeds)} akış, {len(added)} yeni).")
+        self.poll_scheduler.forget_removed(self.rss_feeds)
+        get_feed_health().forget_removed(self.rss_feeds)
+        self.publish_feed_list(list(self.rss_feeds))
+        if added and self.network_available:
+            self.poll_scheduler.mark_in_flight(added)
+            threading.Thread(target=self.fetch_and_publish_entries, args=(added,), daemon=True).start()
+        return False
+
+    def update_rss(self):
+        if not self.network_available:
+            logger.debug("Ağ bağlantısı yok, RSS alınmadı.")
+            self.connectivity.report_failure()
+            return
+        threading.Thread(target=self.fetch_and_publish_entries, daemon=True).start()
+
+    def on_connectivity_changed(self, available):
+        was_available = self.network_available
+        self.network_available = available
+        if available and not was_available:
+            get_feed_health().reset_backoff()
+            if time.monotonic() - self.last_fetch_started < self.RECENT_FETCH_WINDOW:
+                return
+            logger.info("Ağ bağlantısı algılandı, RSS verisi alınıyor...")
+            self.update_rss()
+
+    def on_connectivity_retry(self):
+        threading.Thread(target=self.fetch_and_publish_entries, daemon=True).start()
+
+    def schedule_next_poll(self):
+        if self.poll_source_id is not None:
+            GLib.source_remove(self.poll_source_id)
+        delay = self.poll_scheduler.seconds_until_next(self.rss_feeds)
+        delay = 30 if delay is None else min(30, max(5, delay))
+        self.poll_source_id = GLib.timeout_add_seconds(int(math.ceil(delay)), self.on_poll_timer)
+        return False
+
+    def on_poll_timer(self):
+        self.poll_source_id = None
+        if self.network_available:
+            due_feeds = self.poll_scheduler.take_due_feeds(self.rss_feeds)
+            if due_feeds:
+                logger.debug(f"Zamanı gelen {len(due_feeds)} akış yoklanıyor.")
+                threading.Thread(target=self.fetch_and_publish_entries, args=(due_feeds,), daemon=True).start()
+        self.schedule_next_poll()
+        return False
+
+    # Farklar banda değil bağlı pencerelere gönderilir
+    def fetch_and_publish_entries(self, feeds=None):
+        refresh_feeds(self, feeds, self.publish_feed_list, self.publish_entries, self.publish_fetch_failure)
+
+    # Yeni veya değişmiş başlıkları listeye işle ve pencerelere gönder
+    def publish_entries(self, generation, entries):
+        if generation != self.fetch_generation:
+            return False
+        with self.lock:
+            for entry in entries:
+                key = entry_key(entry)
+                position = self.entry_positions.get(key)
+                if position is None:
+                    self.entry_positions[key] = len(self.entries)
+                    self.entries.append(entry)
+                else:
+                    self.entries[position] = entry
+            kept = apply_entry_retention(self.entries)
+            if len(kept) != len(self.entries):
+                self.set_entries_locked(kept)
+            self.broadcast_locked({"type": "entries", "entries": [entry_to_message(entry) for entry in entries]})
+        return False
+
+    # Listeden çıkarılan akışların ve filtre kurallarına artık uymayan başlıkları
+    # at, güncel listeyi gönder
+    def publish_feed_list(self, feeds):
+        feed_set = set(feeds)
+        headline_filter = get_headline_filter()
+        with self.lock:
+            remaining = headline_filter.retain(entry for entry in self.entries if entry.feed in feed_set)
+            if len(remaining) != len(self.entries):
+                self.set_entries_locked(remaining)
+            self.broadcast_locked({"type": "feeds", "feeds": feeds})
+        return False
+
+    def publish_fetch_failure(self):
+        with self.lock:
+            if not self.entries:
+                self.broadcast_locked({"type": "fetch_failed"})
+        return False
 
 # Kayan metin penceresi
 class ScrollingTextWindow(Gtk.Window):
 
     SEPARATOR = " ---------- "
-    SPEAKING_LOCK = threading.Lock()
+    FETCH_FAILED_MESSAGE = "RSS verisi alınamadı veya boş. Tekrar deneniyor..."
+    SPEECH_TRIGGER_RATIO = 0.8
+    RECENT_FETCH_WINDOW = 30
+    # Kaydırma hızı (piksel/saniye) ve tek karede izin verilen en uzun zaman adımı
+    SCROLL_SPEED_PX_PER_SEC = 156.0
+    MAX_FRAME_STEP = 0.1
+    # Performans göstergesi metninin yenilenme aralığı (saniye)
+    METRICS_OVERLAY_REFRESH = 0.5
 
-    def __init__(self):
+    def __init__(self, daemon_client=None):
         super().__init__(title="Kayan Haberler")
 
         display = Gdk.Display.get_default()
@@ -280,46 +3515,133 @@ class ScrollingTextWindow(Gtk.Window):
         self.drawing_area.connect("motion-notify-event", self.on_motion_notify)
         self.drawing_area.connect("button-press-event", self.on_button_press)
         self.drawing_area.connect("leave-notify-event", self.on_leave_notify)
+        self.drawing_area.connect("map", self.on_map_changed)
+        self.drawing_area.connect("unmap", self.on_map_changed)
+        self.connect("window-state-event", self.on_window_state_event)
 
         self.rss_feeds = load_rss_feeds()
+        self.feed_list_writer = FeedListWriter()
+        self.feed_store_batch = False
+        self.entry_store = None
 
         self.entries = []
-        self.text_with_padding = ""  # Start with empty text
+        self.entry_positions = {}  # entry_key -> self.entries içindeki sıra
+        self.description_cache = DescriptionCache()
+        self.story_deduplicator = StoryDeduplicator()
+        self.status_message = None  # Başlık yokken bantta gösterilen durum metni
         self.title_pixel_positions = []
+        self.title_offset_index = TitleOffsetIndex()
+        self.hovered_title_index = None
         self.total_text_band_width_px = 0
+        self.band_content_width_px = 0
+        self.layout_font_size = None
+        self.text_measurer = TextMeasurer(self.set_cairo_font_settings, (BAND_FONT_FAMILY, "bold"))
+        self.band_renderer = TextBandRenderer(self.set_cairo_font_settings)
+        self.tile_prerender_pending = False
         self.x_position = self.screen_width
-        # --- DEĞİŞİKLİK 1 (HIZ AYARI) ---
-        # Yenileme hızı arttığı için (33ms'den 16ms'ye), görsel hızın aynı kalması için
-        # hareket mesafesini (speed) düşürüyoruz.
-        self.speed = 2.5
+        # Hız artık kare başına değil saniye başına piksel olarak tutulur; böylece
+        # zamanlayıcı gecikmeleri ve ana döngü yükü kaydırma hızını etkilemez.
+        self.speed = self.SCROLL_SPEED_PX_PER_SEC
         self.is_paused = False
-        self.network_available = False
+        self.is_iconified = False
+        self.tick_callback_id = None
+        self.last_frame_time = None
+        self.frame_stats = FrameStats()
+        self.metrics = get_metrics()
+        self.metrics.add_collector(self.collect_metrics)
+        self.metrics_overlay_visible = False
+        self.metrics_overlay_text = ""
+        self.metrics_overlay_updated = float('-inf')
+        self.last_layout_ms = 0.0
+        self.first_frame_drawn = False
+        self.exit_after_first_frame = False
+        self.connectivity = None
+        self.network_available = True
         self.initial_fetch_attempted = False
+        self.last_fetch_started = float('-inf')
 
         self.connect("destroy", Gtk.main_quit)
 
         self.next_title_index_to_speak = 0
+        self.speech_scheduler = None
+        self.fetch_generation = 0
+        self.poll_scheduler = FeedPollScheduler(get_feed_transport().hints_for)
+        self.poll_source_id = None
+
+        # Ortak servis çalışıyorsa başlıklar ve seslendirme ondan gelir;
+        # yoksa pencere akışları kendisi alır
+        self.daemon_client = daemon_client
+        if daemon_client is not None:
+            self.speech_scheduler = RemoteSpeechScheduler(daemon_client)
+            daemon_client.start(self.on_daemon_message, self.on_daemon_disconnected)
+        else:
+            self.start_standalone()
+        # Animasyon GTK kare saatine bağlıdır (add_tick_callback) ve yalnızca
+        # gösterilecek metin varken, pencere görünürken ve duraklatılmamışken çalışır.
+
+    # Akışları alma, yoklama ve seslendirmeyi bu pencerede başlat
+    def start_standalone(self):
+        self.daemon_client = None
+        self.entry_store = EntryStore()
+        self.speech_scheduler = SpeechScheduler(on_spoken=self.entry_store.mark_spoken)
+        self.connectivity = ConnectivityMonitor(self.on_connectivity_changed, self.on_connectivity_retry)
+        self.network_available = self.connectivity.available
+
+        # Ağ yanıt vermeden önce bandı depodaki başlıklarla başlat
+        stored_entries = self.entry_store.load_entries(self.rss_feeds)
+        get_feed_transport().seed(stored_entries)
+        if not self.entries:
+            stored_entries = self.story_deduplicator.filter(get_headline_filter().filter(stored_entries))
+            if stored_entries:
+                logger.info(f"Depodan {len(stored_entries)} başlık yüklendi.")
+                GLib.idle_add(self.update_text_in_gui, stored_entries)
 
         threading.Thread(target=initialize_audio, daemon=True).start()
         # Perform initial fetch in a separate thread to avoid blocking
         threading.Thread(target=self.initial_fetch, daemon=True).start()
-        GLib.timeout_add(10000, self.check_network_and_fetch)  # Check every 10 seconds
-        # --- DEĞİŞİKLİK 2 (YENİLEME HIZI) ---
-        # Animasyonun daha akıcı olması için yenileme süresini 33ms'den (~30 FPS)
-        # 16ms'ye (~60 FPS) düşürüyoruz.
-        GLib.timeout_add(16, self.update_position)
+        self.schedule_next_poll()
+
+    # Ortak servisten gelen anlık görüntü ve farkları banda uygula
+    def on_daemon_message(self, message):
+        kind = message.get("type")
+        try:
+            entries = [entry_from_message(data) for data in message.get("entries", ())]
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ortak servisten gelen başlıklar okunamadı: {e}")
+            return False
+        if kind == "snapshot":
+            self.rss_feeds = list(message.get("feeds", self.rss_feeds))
+            if entries:
+                self.update_text_in_gui(entries)
+        elif kind == "entries":
+            self.merge_entries_in_gui(self.fetch_generation, entries)
+        elif kind == "feeds":
+            self.rss_feeds = list(message.get("feeds", ()))
+            self.prune_removed_feeds_in_gui(self.rss_feeds)
+        elif kind == "fetch_failed":
+            self.show_fetch_failure_in_gui()
+        return False
+
+    def on_daemon_disconnected(self):
+        if self.daemon_client is None:
+            return False
+        logger.warning("Ortak servisle bağlantı kesildi, akışlar bu pencerede alınacak.")
+        self.daemon_client.close()
+        self.start_standalone()
+        self.schedule_speech_lookahead()
+        return False
 
     def initial_fetch(self):
-        # Perform initial network check and fetch
-        self.network_available = check_network()
+        # Başlangıçta soket denemesi yapılmaz; sistem bağlı görünüyorsa doğrudan
+        # RSS alınır, sonuç bağlantı durumunu belirler.
         if self.network_available:
             logger.info("Başlangıçta ağ bağlantısı algılandı, RSS verisi alınıyor...")
-            entries = get_rss_feed(self.rss_feeds)
-            GLib.idle_add(self.update_text_in_gui, entries)
+            self.fetch_and_stream_entries()
         else:
             logger.debug("Başlangıçta ağ bağlantısı yok, 10 saniye sonra hata mesajı gösterilecek.")
             # Delay showing error message for 10 seconds
             GLib.timeout_add(10000, self.show_initial_error)
+            self.connectivity.report_failure()
         self.initial_fetch_attempted = True
 
     def show_initial_error(self):
@@ -327,30 +3649,43 @@ class ScrollingTextWindow(Gtk.Window):
             GLib.idle_add(self.update_text_in_gui, None)
         return False  # One-shot timeout
 
-    def check_network_and_fetch(self):
+    def on_connectivity_changed(self, available):
         was_available = self.network_available
-        self.network_available = check_network()
-        if self.network_available and not was_available:
+        self.network_available = available
+        if available and not was_available:
+            get_feed_health().reset_backoff()
+            # Bağlantıyı az önce bir RSS isteği doğruladıysa yeniden alma
+            if time.monotonic() - self.last_fetch_started < self.RECENT_FETCH_WINDOW:
+                return
             logger.info("Ağ bağlantısı algılandı, RSS verisi alınıyor...")
             self.update_rss()
-        elif not self.network_available:
-            logger.debug("Ağ bağlantısı yok, 10 saniye sonra tekrar kontrol edilecek.")
+        elif not available:
+            logger.debug("Ağ bağlantısı yok.")
             if was_available and self.entries:
-                GLib.idle_add(self.update_text_in_gui, None)
-        return True  # Keep the timeout active
+                self.update_text_in_gui(None)
+
+    # Bağlantı yokken gerçek bir RSS isteğiyle yeniden dene
+    def on_connectivity_retry(self):
+        threading.Thread(target=self.fetch_and_stream_entries, daemon=True).start()
 
     def on_size_allocate(self, widget, allocation):
-        if self.entries:
-            self.calculate_title_pixel_positions()
-        elif "RSS verisi alınamadı" in self.text_with_padding:
+        if self.entries or self.status_message:
             self.calculate_title_pixel_positions()
+        self.update_animation_state()
 
     def on_motion_notify(self, widget, event):
         mouse_x = event.x
         title_index = self.get_title_index_at_position(mouse_x)
+        if title_index is not None and title_index >= len(self.entries):
+            title_index = None
+
+        # İpucu ve duraklatma yalnızca fare başka bir başlığa geçtiğinde güncellenir
+        if title_index == self.hovered_title_index:
+            return False
+        self.hovered_title_index = title_index
 
-        if title_index is not None and title_index < len(self.entries):
-            description = self.entries[title_index]['description']
+        if title_index is not None:
+            description = self.description_cache.get(self.entries[title_index])
             self.drawing_area.set_tooltip_text(description)
             self.is_paused = True
         else:
@@ -358,20 +3693,62 @@ class ScrollingTextWindow(Gtk.Window):
             self.is_paused = False
             self.drawing_area.queue_draw()
 
+        self.update_animation_state()
         return False
 
     def on_leave_notify(self, widget, event):
+        self.hovered_title_index = None
         self.drawing_area.set_tooltip_text(None)
         self.is_paused = False
         self.drawing_area.queue_draw()
+        self.update_animation_state()
         return False
 
+    def on_map_changed(self, widget):
+        self.update_animation_state()
+
+    def on_window_state_event(self, widget, event):
+        self.is_iconified = bool(event.new_window_state & Gdk.WindowState.ICONIFIED)
+        self.update_animation_state()
+        return False
+
+    # Kare saati geri çağrısını yalnızca animasyon gerektiğinde etkin tut
+    def update_animation_state(self):
+        should_run = (not self.is_paused
+                      and not self.is_iconified
+                      and self.drawing_area.get_mapped()
+                      and bool(self.title_pixel_positions))
+        if should_run and self.tick_callback_id is None:
+            self.last_frame_time = None
+            self.frame_stats.reset_window()
+            self.tick_callback_id = self.drawing_area.add_tick_callback(self.on_frame_tick)
+        elif not should_run and self.tick_callback_id is not None:
+            self.drawing_area.remove_tick_callback(self.tick_callback_id)
+            self.tick_callback_id = None
+
+    def on_frame_tick(self, widget, frame_clock):
+        frame_time = frame_clock.get_frame_time()  # mikrosaniye
+        if self.last_frame_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = (frame_time - self.last_frame_time) / 1_000_000
+            refresh_interval, _ = frame_clock.get_refresh_info(frame_time)
+            self.frame_stats.record(elapsed, refresh_interval / 1_000_000 if refresh_interval else None)
+            self.metrics.observe("rss_frame_interval_seconds", elapsed)
+        self.last_frame_time = frame_time
+
+        # Uzun bir kesintiden sonra bandın ileri sıçramasını önle
+        started = time.perf_counter()
+        self.update_position(min(elapsed, self.MAX_FRAME_STEP))
+        self.metrics.observe("rss_frame_update_seconds", time.perf_counter() - started)
+        return GLib.SOURCE_CONTINUE
+
     def on_button_press(self, widget, event):
         if event.button == 1:
             mouse_x = event.x
             title_index = self.get_title_index_at_position(mouse_x)
             if title_index is not None and title_index < len(self.entries):
-                link = self.entries[title_index]['link']
+                link = self.entries[title_index].link
                 if link:
                     try:
                         webbrowser.open(link)
@@ -394,6 +3771,11 @@ class ScrollingTextWindow(Gtk.Window):
         manage_feeds_item.connect("activate", self.on_manage_feeds)
         menu.append(manage_feeds_item)
 
+        overlay_item = Gtk.CheckMenuItem(label="Performans Göstergesi")
+        overlay_item.set_active(self.metrics_overlay_visible)
+        overlay_item.connect("toggled", self.on_toggle_metrics_overlay)
+        menu.append(overlay_item)
+
         exit_item = Gtk.MenuItem(label="Kapat")
         exit_item.connect("activate", self.on_exit)
         menu.append(exit_item)
@@ -404,6 +3786,16 @@ class ScrollingTextWindow(Gtk.Window):
     def on_exit(self, widget):
         Gtk.main_quit()
 
+    def on_toggle_metrics_overlay(self, menu_item):
+        self.metrics_overlay_visible = menu_item.get_active()
+        self.metrics_overlay_updated = float('-inf')
+        self.drawing_area.queue_draw()
+
+    # Ölçüm sunucusu okuduğunda pencereye ait göstergeleri güncelle
+    def collect_metrics(self, registry):
+        registry.set("rss_tts_queue_depth", self.speech_scheduler.queue_depth())
+        registry.set("rss_band_entries", len(self.entries))
+
     def on_add_feed(self, widget):
         dialog = Gtk.Dialog(title="Yeni RSS Ekle", parent=self, flags=0)
         dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OK, Gtk.ResponseType.OK)
@@ -418,187 +3810,389 @@ class ScrollingTextWindow(Gtk.Window):
         response = dialog.run()
         if response == Gtk.ResponseType.OK:
             url = entry.get_text().strip()
-            if validators.url(url):
-                if url not in self.rss_feeds:
-                    self.rss_feeds.append(url)
-                    save_rss_feeds(self.rss_feeds)
-                    logger.info(f"Yeni RSS feed eklendi: {url}")
-                    self.update_rss()
-                else:
-                    logger.warning(f"Bu RSS feed zaten mevcut: {url}")
+            valid, duplicates, _ = validate_feed_urls([url], self.rss_feeds)
+            if valid:
+                logger.info(f"Yeni RSS feed eklendi: {url}")
+                self.set_feed_list(self.rss_feeds + valid)
+            elif duplicates:
+                logger.warning(f"Bu RSS feed zaten mevcut: {url}")
             else:
                 logger.error(f"Geçersiz URL: {url}")
         dialog.destroy()
 
+    # Akış listesini değiştir. Liste gecikmeli olarak tek seferde kaydedilir;
+    # yalnızca yeni eklenen akışlar alınır, çıkarılanların başlıkları banttan
+    # kaldırılır. Yalnızca sıra değiştiyse hiçbir akış yeniden alınmaz.
+    def set_feed_list(self, feeds):
+        previous = set(self.rss_feeds)
+        added = [url for url in feeds if url not in previous]
+        removed = previous - set(feeds)
+        self.rss_feeds = list(feeds)
+        self.feed_list_writer.schedule(self.rss_feeds)
+
+        if self.daemon_client is not None:
+            # Ortak servis listeyi dosyadan okuyup farkı uygular
+            if added or removed:
+                self.feed_list_writer.flush()
+                self.daemon_client.send({"type": "reload"})
+            return
+
+        if removed:
+            logger.info(f"{len(removed)} RSS feed listeden çıkarıldı.")
+            self.poll_scheduler.forget_removed(self.rss_feeds)
+            get_feed_health().forget_removed(self.rss_feeds)
+            self.prune_removed_feeds_in_gui(self.rss_feeds)
+        if added and self.network_available:
+            self.poll_scheduler.mark_in_flight(added)
+            threading.Thread(target=self.fetch_and_stream_entries, args=(added,), daemon=True).start()
+
+    # Akış listesi bir Gtk.ListStore modelinde tutulur ve Gtk.TreeView yalnızca
+    # görünen satırları çizer; taşıma ve silme satırları yerinde günceller.
+    # Satırlar sürüklenerek de sıralanabilir.
     def on_manage_feeds(self, widget):
         dialog = Gtk.Dialog(title="RSS Listesini Yönet", parent=self, flags=0)
         dialog.add_buttons(Gtk.STOCK_CLOSE, Gtk.ResponseType.CLOSE)
-        dialog.set_default_size(400, 300)
+        dialog.set_default_size(720, 420)
+
+        # Ortak servis kullanılıyorsa akışları o aldığından sağlık kayıtları dosyadan okunur
+        health_tracker = FeedHealthTracker() if self.daemon_client is not None else get_feed_health()
+        store = Gtk.ListStore(str, str, str)  # adres, sağlık (Pango biçimli), ipucu
+        for feed in self.rss_feeds:
+            store.append(self.feed_store_row(health_tracker, feed))
+
+        tree = Gtk.TreeView(model=store)
+        tree.set_reorderable(True)
+        tree.set_tooltip_column(2)
+        tree.get_selection().set_mode(Gtk.SelectionMode.MULTIPLE)
+        url_column = Gtk.TreeViewColumn("Adres", Gtk.CellRendererText(ellipsize=Pango.EllipsizeMode.MIDDLE), text=0)
+        url_column.set_expand(True)
+        health_column = Gtk.TreeViewColumn("Durum", Gtk.CellRendererText(), markup=1)
+        for column in (url_column, health_column):
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
+            tree.append_column(column)
+        health_column.set_fixed_width(230)
+        url_column.set_fixed_width(420)
+        tree.set_fixed_height_mode(True)
+
+        # Sürükle-bırak satırı önce ekler sonra eskisini siler; liste silmeden sonra eşitlenir.
+        # Düğmelerle yapılan toplu değişiklikler sonunda bir kez eşitlenir.
+        self.feed_store_batch = False
+        store.connect("row-deleted", lambda model, path: self.sync_feed_list_from_store(model))
 
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
-        listbox = Gtk.ListBox()
-        scrolled.add(listbox)
+        scrolled.add(tree)
         dialog.get_content_area().pack_start(scrolled, True, True, 0)
 
-        adjustment = scrolled.get_vadjustment()
-
-        self.populate_feed_list(listbox, adjustment)
+        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        up_button = Gtk.Button()
+        up_button.set_image(Gtk.Image.new_from_icon_name("go-up", Gtk.IconSize.BUTTON))
+        up_button.connect("clicked", lambda button: self.move_selected_feeds(tree, -1))
+        down_button = Gtk.Button()
+        down_button.set_image(Gtk.Image.new_from_icon_name("go-down", Gtk.IconSize.BUTTON))
+        down_button.connect("clicked", lambda button: self.move_selected_feeds(tree, 1))
+        delete_button = Gtk.Button(label="Sil")
+        delete_button.connect("clicked", lambda button: self.delete_selected_feeds(tree))
+        for button in (up_button, down_button, delete_button):
+            button_box.pack_start(button, False, False, 0)
+        export_button = Gtk.Button(label="OPML Dışa Aktar")
+        export_button.connect("clicked", lambda button: self.export_opml(dialog))
+        button_box.pack_end(export_button, False, False, 0)
+        import_button = Gtk.Button(label="OPML İçe Aktar")
+        import_button.connect("clicked", lambda button: self.import_opml(dialog, store, health_tracker))
+        button_box.pack_end(import_button, False, False, 0)
+        dialog.get_content_area().pack_start(button_box, False, False, 6)
 
         dialog.show_all()
         dialog.run()
         dialog.destroy()
+        self.feed_list_writer.flush()
 
-    def populate_feed_list(self, listbox, adjustment):
-        scroll_position = adjustment.get_value() if adjustment else 0
-
-        for child in listbox.get_children():
-            listbox.remove(child)
-
-        for index, feed in enumerate(self.rss_feeds):
-            row = Gtk.ListBoxRow()
-            hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-            label = Gtk.Label(label=feed, xalign=0)
-
-            up_button = Gtk.Button()
-            up_button.set_image(Gtk.Image.new_from_icon_name("go-up", Gtk.IconSize.BUTTON))
-            up_button.set_sensitive(index > 0)
-            up_button.connect("clicked", self.on_move_feed, feed, listbox, -1, adjustment)
-
-            down_button = Gtk.Button()
-            down_button.set_image(Gtk.Image.new_from_icon_name("go-down", Gtk.IconSize.BUTTON))
-            down_button.set_sensitive(index < len(self.rss_feeds) - 1)
-            down_button.connect("clicked", self.on_move_feed, feed, listbox, 1, adjustment)
-
-            delete_button = Gtk.Button(label="Sil")
-            delete_button.connect("clicked", self.on_delete_feed, feed, listbox, adjustment)
-
-            hbox.pack_start(label, True, True, 0)
-            hbox.pack_end(delete_button, False, False, 0)
-            hbox.pack_end(down_button, False, False, 0)
-            hbox.pack_end(up_button, False, False, 0)
-            row.add(hbox)
-            listbox.add(row)
-
-        listbox.show_all()
-        if adjustment:
-            GLib.idle_add(adjustment.set_value, scroll_position)
-
-    def on_move_feed(self, button, feed, listbox, direction, adjustment):
-        index = self.rss_feeds.index(feed)
-        new_index = index + direction
-        if 0 <= new_index < len(self.rss_feeds):
-            self.rss_feeds.pop(index)
-            self.rss_feeds.insert(new_index, feed)
-            save_rss_feeds(self.rss_feeds)
-            logger.info(f"RSS feed taşındı: {feed} -> pozisyon {new_index}")
-            self.populate_feed_list(listbox, adjustment)
-            self.update_rss()
+    def feed_store_row(self, health_tracker, feed):
+        health_markup, health_tooltip = self.describe_feed_health(health_tracker, feed)
+        return [feed, health_markup, GLib.markup_escape_text(health_tooltip or feed)]
 
-    def on_delete_feed(self, button, feed, listbox, adjustment):
-        if feed in self.rss_feeds:
-            self.rss_feeds.remove(feed)
-            save_rss_feeds(self.rss_feeds)
-            logger.info(f"RSS feed silindi: {feed}")
-            self.populate_feed_list(listbox, adjustment)
-            self.update_rss()
+    def sync_feed_list_from_store(self, store):
+        if not self.feed_store_batch:
+            self.set_feed_list([row[0] for row in store])
 
-    def get_title_index_at_position(self, mouse_x):
-        if not self.title_pixel_positions:
-            return None
+    def move_selected_feeds(self, tree, direction):
+        store, paths = tree.get_selection().get_selected_rows()
+        indices = sorted((path.get_indices()[0] for path in paths), reverse=direction > 0)
+        selected = set(indices)
+        moved = False
+        for index in indices:
+            target = index + direction
+            if 0 <= target < len(store) and target not in selected:
+                store.swap(store.get_iter(Gtk.TreePath(index)), store.get_iter(Gtk.TreePath(target)))
+                selected.discard(index)
+                selected.add(target)
+                moved = True
+            else:
+                # Sınıra dayanan satır yerinde kalır; ardındakiler onu geçemez
+                selected.add(index)
+        if moved:
+            tree.scroll_to_cell(Gtk.TreePath(min(selected) if direction < 0 else max(selected)), None, False, 0, 0)
+            self.set_feed_list([row[0] for row in store])
 
-        for i, (start_px, end_px) in enumerate(self.title_pixel_positions):
-            title_start_screen_pos = self.x_position + start_px
-            title_end_screen_pos = self.x_position + end_px
-            if title_start_screen_pos <= mouse_x <= title_end_screen_pos:
-                return i
-        return None
+    def delete_selected_feeds(self, tree):
+        store, paths = tree.get_selection().get_selected_rows()
+        references = [Gtk.TreeRowReference.new(store, path) for path in paths]
+        self.feed_store_batch = True
+        try:
+            for reference in references:
+                store.remove(store.get_iter(reference.get_path()))
+        finally:
+            self.feed_store_batch = False
+        if references:
+            self.set_feed_list([row[0] for row in store])
 
-    def get_cairo_context_for_measurement(self):
-        rect = self.get_allocation()
-        width = max(1, rect.width)
-        height = max(1, rect.height)
+    def create_opml_file_chooser(self, parent, title, action, button_label):
+        chooser = Gtk.FileChooserDialog(title=title, parent=parent, action=action)
+        chooser.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, button_label, Gtk.ResponseType.OK)
+        opml_filter = Gtk.FileFilter()
+        opml_filter.set_name("OPML dosyaları")
+        opml_filter.add_pattern("*.opml")
+        opml_filter.add_pattern("*.xml")
+        chooser.add_filter(opml_filter)
+        return chooser
 
-        if width < 1 or height < 1:
-            logger.warning(f"Pencere boyutu ({width}x{height}) metin ölçümü için uygun değil. Dummy boyut kullanılıyor.")
-            width = self.screen_width
-            height = 30
+    # OPML dosyasındaki akışları toplu doğrulayıp listeye ekle; yalnızca yeni
+    # akışlar alınır
+    def import_opml(self, parent, store, health_tracker):
+        chooser = self.create_opml_file_chooser(parent, "OPML İçe Aktar", Gtk.FileChooserAction.OPEN, "Aç")
+        path = chooser.get_filename() if chooser.run() == Gtk.ResponseType.OK else None
+        chooser.destroy()
+        if not path:
+            return
 
         try:
-            format = cairo.Format.ARGB32
-        except AttributeError:
-            format = cairo.FORMAT_ARGB32
+            urls = read_opml_feeds(path)
+        except (OSError, ElementTree.ParseError) as e:
+            logger.error(f"OPML dosyası okunamadı ({path}): {e}")
+            self.show_message(parent, Gtk.MessageType.ERROR, "OPML dosyası okunamadı.", str(e))
+            return
 
-        surface = cairo.ImageSurface(format, width, height)
-        cr = cairo.Context(surface)
-        font_size = height * 0.7
-        self.set_cairo_font_settings(cr, font_size)
-        return cr
+        valid, duplicates, invalid = validate_feed_urls(urls, self.rss_feeds)
+        if valid:
+            for url in valid:
+                store.append(self.feed_store_row(health_tracker, url))
+            self.set_feed_list([row[0] for row in store])
+        logger.info(f"OPML içe aktarıldı ({path}): {len(valid)} yeni, {len(duplicates)} zaten listede, "
+                    f"{len(invalid)} geçersiz adres.")
+        details = f"{len(duplicates)} akış zaten listede."
+        if invalid:
+            details += f"\n{len(invalid)} geçersiz adres atlandı:\n" + "\n".join(invalid[:10])
+            if len(invalid) > 10:
+                details += f"\n... ve {len(invalid) - 10} adres daha"
+        self.show_message(parent, Gtk.MessageType.INFO, f"{len(valid)} yeni akış eklendi.", details)
+
+    def export_opml(self, parent):
+        chooser = self.create_opml_file_chooser(parent, "OPML Dışa Aktar", Gtk.FileChooserAction.SAVE, "Kaydet")
+        chooser.set_do_overwrite_confirmation(True)
+        chooser.set_current_name("rss_feeds.opml")
+        path = chooser.get_filename() if chooser.run() == Gtk.ResponseType.OK else None
+        chooser.destroy()
+        if not path:
+            return
+        try:
+            write_opml_feeds(path, self.rss_feeds)
+            logger.info(f"{len(self.rss_feeds)} akış OPML olarak dışa aktarıldı: {path}")
+        except OSError as e:
+            logger.error(f"OPML dosyası yazılamadı ({path}): {e}")
+            self.show_message(parent, Gtk.MessageType.ERROR, "OPML dosyası yazılamadı.", str(e))
+
+    def show_message(self, parent, message_type, text, details=None):
+        message = Gtk.MessageDialog(parent=parent, flags=0, message_type=message_type,
+                                    buttons=Gtk.ButtonsType.OK, text=text)
+        if details:
+            message.format_secondary_text(details)
+        message.run()
+        message.destroy()
+
+    # Akışın sağlık durumunu renkli kısa bir metin ve ayrıntılı bir ipucu olarak döndür
+    def describe_feed_health(self, health_tracker, feed):
+        health = health_tracker.snapshot(feed)
+        if health is None:
+            return "<span foreground='gray'>Henüz alınmadı</span>", None
+
+        def format_time(timestamp):
+            return time.strftime("%d.%m %H:%M", time.localtime(timestamp)) if timestamp else "hiç"
+
+        if health.is_quarantined():
+            markup = (f"<span foreground='red'>Karantinada, sonraki deneme "
+                      f"{time.strftime('%H:%M', time.localtime(health.quarantined_until))}</span>")
+        elif health.consecutive_failures:
+            markup = f"<span foreground='orange'>{health.consecutive_failures} ardışık hata</span>"
+        else:
+            markup = f"<span foreground='green'>Sağlıklı, {(health.average_latency or 0) * 1000:.0f} ms</span>"
+
+        tooltip = [f"Son başarılı alma: {format_time(health.last_success)}",
+                   f"Ardışık hata: {health.consecutive_failures}"]
+        if health.average_latency is not None:
+            tooltip.append(f"Ortalama süre: {health.average_latency * 1000:.0f} ms")
+        if health.last_error:
+            tooltip.append(f"Son hata ({format_time(health.last_failure)}): {health.last_error}")
+        return markup, "\n".join(tooltip)
+
+    def get_title_index_at_position(self, mouse_x):
+        if not self.title_pixel_positions:
+            return None
+        return self.title_offset_index.find(mouse_x - self.x_position)
+
+    # Ölçümde kullanılacak yazı boyutu (pencere yüksekliğinin %70'i)
+    def measurement_font_size(self):
+        height = self.get_allocation().height
+        if height <= 1:
+            height = 30
+        return height * 0.7
 
     def set_cairo_font_settings(self, cr, font_size):
-        cr.select_font_face("DejaVu Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        cr.select_font_face(BAND_FONT_FAMILY, cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
         cr.set_font_size(font_size)
 
     def calculate_title_pixel_positions(self):
+        started = time.perf_counter()
+        self.layout_title_pixel_positions()
+        self.record_layout_time(started, "full")
+
+    def record_layout_time(self, started, kind):
+        elapsed = time.perf_counter() - started
+        self.last_layout_ms = elapsed * 1000
+        self.metrics.observe("rss_layout_seconds", elapsed, kind=kind)
+
+    def layout_title_pixel_positions(self):
         self.title_pixel_positions = []
+        self.title_offset_index.rebuild(self.title_pixel_positions)
+        self.hovered_title_index = None
         self.total_text_band_width_px = 0
+        self.band_content_width_px = 0
+        self.band_renderer.clear()
 
-        if not self.entries and "RSS verisi alınamadı" not in self.text_with_padding:
-            return
-
-        cr = self.get_cairo_context_for_measurement()
-        if not cr:
-            logger.error("Metin ölçümü için Cairo context alınamadı.")
+        if not self.entries and not self.status_message:
             return
 
-        current_pixel_offset = 0
+        font_size = self.measurement_font_size()
+        self.layout_font_size = font_size
 
-        if not self.entries and "RSS verisi alınamadı" in self.text_with_padding:
-            _, _, _, _, msg_width_px, _ = cr.text_extents(self.text_with_padding)
+        if not self.entries:
+            msg_width_px = self.text_measurer.text_width(self.status_message, font_size)
             self.title_pixel_positions = [(0, msg_width_px)]
+            self.title_offset_index.rebuild(self.title_pixel_positions)
+            self.band_content_width_px = msg_width_px
             self.total_text_band_width_px = msg_width_px + self.screen_width
+            self.update_band_renderer([(0, msg_width_px, self.status_message)], msg_width_px)
             return
 
-        for i, entry in enumerate(self.entries):
-            title = entry['title']
-            _, _, _, _, title_width_px, _ = cr.text_extents(title)
+        runs = self.append_title_layout(self.entries, font_size)
+        self.update_band_renderer(runs, self.band_content_width_px)
+
+    # Başlıkları mevcut bandın sonuna yerleştir ve çizim parçalarını döndür.
+    # Her başlıktan önce (ilki hariç) ayırıcı gelir.
+    def append_title_layout(self, entries, font_size):
+        separator_width_px = self.text_measurer.text_width(self.SEPARATOR, font_size)
+        current_pixel_offset = self.band_content_width_px
+        runs = []
+
+        for entry in entries:
+            title = entry.title
+            if self.title_pixel_positions:
+                runs.append((current_pixel_offset, current_pixel_offset + separator_width_px, self.SEPARATOR))
+                current_pixel_offset += separator_width_px
+
+            title_width_px = self.text_measurer.text_width(title, font_size)
             start_pixel_offset = current_pixel_offset
             end_pixel_offset = current_pixel_offset + title_width_px
             self.title_pixel_positions.append((start_pixel_offset, end_pixel_offset))
+            self.title_offset_index.append(start_pixel_offset, end_pixel_offset)
+            runs.append((start_pixel_offset, end_pixel_offset, title))
+            current_pixel_offset = end_pixel_offset
 
-            if i < len(self.entries) - 1:
-                _, _, _, _, separator_width_px, _ = cr.text_extents(self.SEPARATOR)
-                current_pixel_offset += title_width_px + separator_width_px
-            else:
-                current_pixel_offset += title_width_px
-
+        self.band_content_width_px = current_pixel_offset
         self.total_text_band_width_px = current_pixel_offset + self.screen_width
+        return runs
+
+    # Yeni eklenen başlıkları yalnızca onları ölçerek bandın sonuna ekle
+    def append_title_pixel_positions(self, new_entries):
+        font_size = self.measurement_font_size()
+        if (font_size != self.layout_font_size
+                or len(self.title_pixel_positions) + len(new_entries) != len(self.entries)):
+            self.calculate_title_pixel_positions()
+            return
+        started = time.perf_counter()
+        runs = self.append_title_layout(new_entries, font_size)
+        self.band_renderer.extend_content(runs, self.band_content_width_px)
+        self.record_layout_time(started, "append")
+
+    # Sıradaki başlıklar yeniden dizildiğinde yalnızca first ve sonrasını yeniden
+    # yerleştir; ekrandaki başlıklar ve karoları korunur
+    def relayout_titles_from(self, first):
+        font_size = self.measurement_font_size()
+        if (first == 0 or font_size != self.layout_font_size
+                or len(self.title_pixel_positions) < first):
+            self.calculate_title_pixel_positions()
+            return
+        started = time.perf_counter()
+        offset = self.title_pixel_positions[first - 1][1]
+        del self.title_pixel_positions[first:]
+        self.title_offset_index.rebuild(self.title_pixel_positions)
+        self.band_content_width_px = offset
+        self.band_renderer.truncate_content(offset)
+        runs = self.append_title_layout(self.entries[first:], font_size)
+        self.band_renderer.extend_content(runs, self.band_content_width_px)
+        self.record_layout_time(started, "reorder")
+
+    # Ekrana henüz girmemiş ve seslendirilmemiş ilk başlığın sırası
+    def first_upcoming_title_index(self):
+        if len(self.title_pixel_positions) != len(self.entries):
+            return len(self.entries)
+        view_right = self.screen_width - self.x_position  # görünümün sağ kenarı, bant koordinatında
+        index = bisect.bisect_right(self.title_offset_index.starts, view_right)
+        return max(index, self.next_title_index_to_speak)
+
+    # Bant içeriği veya boyutu değiştiğinde karo önbelleğini yeniden oluştur
+    def update_band_renderer(self, runs, content_width):
+        rect = self.get_allocation()
+        height = rect.height if rect.height > 1 else 30
+        self.band_renderer.set_content(runs, content_width, height, self.get_scale_factor())
+        self.band_renderer.prerender(self.x_position, self.screen_width)
+
+    def prerender_band_tiles(self):
+        self.tile_prerender_pending = False
+        self.band_renderer.prerender(self.x_position, self.get_allocation().width)
+        return False
 
     def update_text_in_gui(self, entries):
         if entries and isinstance(entries, list) and entries:
-            self.entries = entries
-            self.text_with_padding = self.SEPARATOR.join(entry['title'] for entry in self.entries)
-            self.calculate_title_pixel_positions()
+            self.entries = apply_entry_retention(entries)
+            self.entry_positions = {entry_key(entry): i for i, entry in enumerate(self.entries)}
+            self.description_cache.retain(self.entry_positions)
+            self.story_deduplicator.retain(self.entry_positions)
+            self.status_message = None
             self.x_position = self.screen_width
+            self.calculate_title_pixel_positions()
             self.next_title_index_to_speak = 0
-            if self.SPEAKING_LOCK.locked():
-                logger.warning("RSS güncellendi, devam eden seslendirme olabilir.")
+            self.speech_scheduler.reset()
+            self.schedule_speech_lookahead()
         else:
             self.entries = []
+            self.entry_positions = {}
+            self.description_cache.retain(self.entry_positions)
             self.title_pixel_positions = []
             self.total_text_band_width_px = 0
-            self.text_with_padding = "RSS verisi alınamadı veya boş. Tekrar deneniyor..."
-            self.calculate_title_pixel_positions()
+            self.status_message = self.FETCH_FAILED_MESSAGE
             self.x_position = self.screen_width
+            self.calculate_title_pixel_positions()
             self.next_title_index_to_speak = 0
+            self.speech_scheduler.reset()
             logger.warning("RSS başlıkları güncellenemedi veya boştu.")
 
         self.drawing_area.queue_draw()
+        self.update_animation_state()
         return False
 
     def on_draw(self, widget, cr):
-        # --- DEĞİŞİKLİK 3 (KONTRAST/GÖLGE) ---
-        # Bu metodun tamamı isteğiniz doğrultusunda güncellenmiştir.
+        started = time.perf_counter()
         rect = self.get_allocation()
         width = rect.width
         height = rect.height
@@ -610,39 +4204,76 @@ class ScrollingTextWindow(Gtk.Window):
             cr.set_source_rgb(0, 0, 0) # Düz siyah
         cr.paint()
 
-        if not self.text_with_padding:
+        if not self.entries and not self.status_message:
+            if not self.first_frame_drawn:
+                self.report_first_frame()
             return False  # Çizilecek metin yoksa devam etme
 
-        # Font ayarları
-        font_size = height * 0.7
-        self.set_cairo_font_settings(cr, font_size)
-        fascent, fdescent, fheight, fxadvance, fyadvance = cr.font_extents()
-        text_y = (height / 2) + (fheight / 2) - fdescent
-        
-        # 1. Gölgeyi çiz (Siyah renk, 1 piksel kaydırılmış)
-        # Bu, ana metnin arkasında bir kontrast katmanı oluşturarak okunurluğu artırır.
-        shadow_offset_x = 1
-        shadow_offset_y = 1
-        cr.set_source_rgb(0, 0, 0)  # Siyah gölge
-        cr.move_to(self.x_position + shadow_offset_x, text_y + shadow_offset_y)
-        cr.show_text(self.text_with_padding)
-
-        # 2. Ana metni çiz (Beyaz renk, orijinal pozisyon)
-        cr.set_source_rgb(1, 1, 1)  # Beyaz ana metin
-        cr.move_to(self.x_position, text_y)
-        cr.show_text(self.text_with_padding)
-        
+        # Bant karoları yalnızca içerik veya boyut değiştiğinde çizilir; burada
+        # sadece görünür karolar kopyalanır.
+        self.band_renderer.draw(cr, self.x_position, width)
+
+        # Sıradaki karoyu çizim sırasında değil, boşta kalındığında hazırla
+        if not self.tile_prerender_pending and self.band_renderer.needs_prerender(self.x_position, width):
+            self.tile_prerender_pending = True
+            GLib.idle_add(self.prerender_band_tiles)
+
+        if self.metrics_overlay_visible:
+            self.draw_metrics_overlay(cr, width, height)
+
+        self.metrics.observe("rss_draw_seconds", time.perf_counter() - started)
+        if not self.first_frame_drawn:
+            self.report_first_frame()
         return False
 
-    def update_position(self):
+    # Süreç başlangıcından ilk karenin çizilmesine kadar geçen süreyi bildir.
+    # --measure-startup ile çalışıldıysa sonuç JSON olarak yazılır ve çıkılır.
+    def report_first_frame(self):
+        self.first_frame_drawn = True
+        elapsed = time.monotonic() - STARTUP_TIME
+        self.metrics.set("rss_time_to_first_frame_seconds", elapsed)
+        logger.info(f"İlk kare başlangıçtan {elapsed * 1000:.0f} ms sonra çizildi.")
+        if self.exit_after_first_frame:
+            print(json.dumps({"time_to_first_frame_ms": elapsed * 1000}), flush=True)
+            GLib.idle_add(Gtk.main_quit)
+
+    # Bandın sağ ucuna küçük bir performans özeti çiz. Metin yarım saniyede bir
+    # yenilenir; her karede yalnızca hazır metin çizilir.
+    def draw_metrics_overlay(self, cr, width, height):
+        now = time.monotonic()
+        if now - self.metrics_overlay_updated >= self.METRICS_OVERLAY_REFRESH:
+            self.metrics_overlay_updated = now
+            frame_stats = self.frame_stats.snapshot()
+            draw_p95 = self.metrics.quantile("rss_draw_seconds", 0.95) or 0.0
+            speech_stats = speech_latency_stats.snapshot()
+            self.metrics_overlay_text = (
+                f"{frame_stats['fps']:.0f} FPS  kare p95 {frame_stats['p95_ms']:.1f} ms  "
+                f"çizim p95 {draw_p95 * 1000:.1f} ms  ölçüm {self.last_layout_ms:.1f} ms  "
+                f"TTS kuyruğu {self.speech_scheduler.queue_depth()}  "
+                f"ilk ses p50 {speech_stats['first_audio_p50_ms']:.0f} ms  "
+                f"{resident_memory_bytes() / 2**20:.0f} MB")
+
+        font_size = max(8, height * 0.4)
+        cr.select_font_face("monospace", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+        cr.set_font_size(font_size)
+        _, _, _, _, text_width, _ = cr.text_extents(self.metrics_overlay_text)
+        box_x = width - text_width - 12
+        cr.set_source_rgba(0, 0, 0, 0.8)
+        cr.rectangle(box_x, 0, text_width + 12, height)
+        cr.fill()
+        cr.set_source_rgb(0.4, 1, 0.4)
+        cr.move_to(box_x + 6, (height + font_size * 0.7) / 2)
+        cr.show_text(self.metrics_overlay_text)
+
+    def update_position(self, elapsed):
         if self.is_paused:
-            return True
+            return
 
-        self.x_position -= self.speed
+        self.x_position -= self.speed * elapsed
 
-        if self.SPEAKING_LOCK.locked() or not self.entries:
+        if not self.entries:
             self.drawing_area.queue_draw()
-            return True
+            return
 
         if self.title_pixel_positions and self.next_title_index_to_speak < len(self.title_pixel_positions):
             start_pixel_offset, end_pixel_offset = self.title_pixel_positions[self.next_title_index_to_speak]
@@ -650,26 +4281,40 @@ class ScrollingTextWindow(Gtk.Window):
             title_end_screen_pos = self.x_position + end_pixel_offset
 
             title_center_screen_pos = (title_start_screen_pos + title_end_screen_pos) / 2
-            trigger_threshold = self.screen_width * 0.8
+            trigger_threshold = self.screen_width * self.SPEECH_TRIGGER_RATIO
 
             if title_center_screen_pos <= trigger_threshold:
-                text_to_speak = self.entries[self.next_title_index_to_speak]['title']
-                with self.SPEAKING_LOCK:
-                    threading.Thread(target=self.speak_and_unlock, args=(text_to_speak,), daemon=True).start()
+                entry_to_speak = self.entries[self.next_title_index_to_speak]
+                # Başlığın sonu ekranın solundan çıktığında seslendirme geçersiz olur
+                expires_at = time.monotonic() + max(0.0, title_end_screen_pos) / self.speed
+                self.speech_scheduler.enqueue_playback(entry_to_speak, expires_at)
                 self.next_title_index_to_speak += 1
+                self.schedule_speech_lookahead()
 
         if self.total_text_band_width_px > 0 and self.x_position + self.total_text_band_width_px < 0:
             self.x_position = self.screen_width
+            self.enforce_entry_retention()
             self.next_title_index_to_speak = 0
+            self.speech_scheduler.reset()
+            self.schedule_speech_lookahead()
 
         self.drawing_area.queue_draw()
-        return True
 
-    def speak_and_unlock(self, text):
-        try:
-            speak_text(text)
-        finally:
-            pass
+    # Sıradaki başlıkların tetikleme noktasına ne zaman varacağını tahmin et ve
+    # bunları önceden sentezlenmek üzere zamanlayıcıya bildir
+    def schedule_speech_lookahead(self):
+        if not self.entries or not self.title_pixel_positions:
+            return
+        trigger_threshold = self.screen_width * self.SPEECH_TRIGGER_RATIO
+        first = self.next_title_index_to_speak
+        last = min(len(self.entries), len(self.title_pixel_positions), first + SpeechScheduler.LOOKAHEAD)
+        upcoming = []
+        for index in range(first, last):
+            start_pixel_offset, end_pixel_offset = self.title_pixel_positions[index]
+            title_center_screen_pos = self.x_position + (start_pixel_offset + end_pixel_offset) / 2
+            eta = max(0.0, (title_center_screen_pos - trigger_threshold) / self.speed)
+            upcoming.append((eta, self.entries[index].title))
+        self.speech_scheduler.prepare(upcoming)
 
     def update_rss(self):
         threading.Thread(target=self.periodic_rss_fetch, daemon=True).start()
@@ -679,13 +4324,150 @@ class ScrollingTextWindow(Gtk.Window):
             logger.debug("Ağ bağlantısı yok, RSS alınmadı.")
             GLib.idle_add(self.update_text_in_gui, None)
             return
-        entries = get_rss_feed(self.rss_feeds)
-        GLib.idle_add(self.update_text_in_gui, entries)
+        self.fetch_and_stream_entries()
+
+    # Zamanlayıcının bir sonraki yoklamasını kur. Zamanlayıcı en geç 30 saniyede
+    # bir uyanır; böylece istek sınırı nedeniyle ertelenen akışlar da alınır.
+    def schedule_next_poll(self):
+        if self.poll_source_id is not None:
+            GLib.source_remove(self.poll_source_id)
+        delay = self.poll_scheduler.seconds_until_next(self.rss_feeds)
+        delay = 30 if delay is None else min(30, max(5, delay))
+        self.poll_source_id = GLib.timeout_add_seconds(int(math.ceil(delay)), self.on_poll_timer)
+        return False
+
+    def on_poll_timer(self):
+        self.poll_source_id = None
+        if self.network_available:
+            due_feeds = self.poll_scheduler.take_due_feeds(self.rss_feeds)
+            if due_feeds:
+                logger.debug(f"Zamanı gelen {len(due_feeds)} akış yoklanıyor.")
+                threading.Thread(target=self.fetch_and_stream_entries, args=(due_feeds,), daemon=True).start()
+        self.schedule_next_poll()
+        return False
+
+    # Akışları al ve her akış tamamlandıkça yeni veya değişmiş başlıkları banda
+    # aktar; bant yeniden başlatılmaz, yalnızca farklar uygulanır
+    def fetch_and_stream_entries(self, feeds=None):
+        refresh_feeds(self, feeds, self.prune_removed_feeds_in_gui, self.merge_entries_in_gui,
+                      self.show_fetch_failure_in_gui)
+
+    def show_fetch_failure_in_gui(self):
+        if not self.entries:
+            self.update_text_in_gui(None)
+        return False
+
+    # Yeni başlıkları kaydırmayı ve seslendirme sırasını bozmadan bandın sonuna
+    # ekle, değişmiş başlıkları yerinde güncelle. Öne alma puanı olan yeni
+    # başlıklar ekrana henüz girmemiş başlıkların önüne, puana göre yerleşir.
+    def merge_entries_in_gui(self, generation, entries):
+        if generation != self.fetch_generation:
+            return False
+        if not self.entries:
+            entries = sorted(entries, key=lambda entry: -entry.boost)
+            return self.update_text_in_gui(entries)
+
+        appended = []
+        appended_keys = set()
+        relayout = False
+        for entry in entries:
+            key = entry_key(entry)
+            position = self.entry_positions.get(key)
+            if position is None:
+                if key not in appended_keys:
+                    appended_keys.add(key)
+                    appended.append(entry)
+            else:
+                # Başlığı değişmeyen girdiler yeniden ölçülmeden yerinde güncellenir
+                if self.entries[position].title != entry.title:
+                    relayout = True
+                self.entries[position] = entry
+
+        first = len(self.entries)
+        if any(entry.boost > 0 for entry in appended):
+            first = self.first_upcoming_title_index()
+        if first < len(self.entries):
+            upcoming = self.entries[first:] + appended
+            upcoming.sort(key=lambda entry: -entry.boost)
+            del self.entries[first:]
+            self.entries.extend(upcoming)
+            for index in range(first, len(self.entries)):
+                self.entry_positions[entry_key(self.entries[index])] = index
+        else:
+            for entry in appended:
+                self.entry_positions[entry_key(entry)] = len(self.entries)
+                self.entries.append(entry)
+
+        if relayout:
+            self.calculate_title_pixel_positions()
+        elif first < len(self.entries) - len(appended):
+            self.relayout_titles_from(first)
+        elif appended:
+            self.append_title_pixel_positions(appended)
+        self.schedule_speech_lookahead()
+        self.drawing_area.queue_draw()
+        self.update_animation_state()
+        return False
+
+    # Listeden çıkarılan akışların ve filtre kurallarına artık uymayan başlıkları
+    # banttan kaldır
+    def prune_removed_feeds_in_gui(self, feeds):
+        feed_set = set(feeds)
+        remaining = get_headline_filter().retain(entry for entry in self.entries if entry.feed in feed_set)
+        if len(remaining) != len(self.entries):
+            self.update_text_in_gui(remaining)
+        return False
+
+    # Saklama sınırlarını aşan başlıkları at. Yeni başlıklar bandın sonuna
+    # eklendiğinden sınırlar yalnızca bant başa sardığında uygulanır; böylece
+    # görünür başlıklar kaymaz ve yerleşim tek seferde yeniden hesaplanır.
+    def enforce_entry_retention(self):
+        kept = apply_entry_retention(self.entries)
+        if len(kept) == len(self.entries):
+            return
+        logger.debug(f"Saklama sınırı nedeniyle {len(self.entries) - len(kept)} başlık banttan çıkarıldı.")
+        self.entries = kept
+        self.entry_positions = {entry_key(entry): i for i, entry in enumerate(self.entries)}
+        self.description_cache.retain(self.entry_positions)
+        self.story_deduplicator.retain(self.entry_positions)
+        self.calculate_title_pixel_positions()
 
 def main():
-    win = ScrollingTextWindow()
+    parser = argparse.ArgumentParser(description="Kayan RSS haber okuyucu")
+    parser.add_argument("--metrics-port", type=int,
+                        help=f"Ölçümlerin {METRICS_HOST} üzerinde sunulduğu port (0: kapalı; varsayılan "
+                             f"{METRICS_PORT}, ortak servise bağlı pencerelerde kapalı)")
+    parser.add_argument("--measure-startup", action="store_true",
+                        help="İlk kare çizilince geçen süreyi JSON olarak yaz ve çık")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Akışları ve seslendirmeyi tüm pencereler için yöneten ekransız servisi başlat")
+    parser.add_argument("--standalone", action="store_true",
+                        help="Ortak servis çalışsa bile akışları bu pencerede al")
+    parser.add_argument("--socket", default=DAEMON_SOCKET_PATH, help="Ortak servisin Unix soketi")
+    args = parser.parse_args()
+
+    if args.daemon:
+        start_metrics_server(METRICS_PORT if args.metrics_port is None else args.metrics_port)
+        if not FeedDaemon(args.socket).run():
+            sys.exit(1)
+        return
+
+    daemon_client = None
+    if not args.standalone and not args.measure_startup:
+        daemon_client = DaemonClient.connect(args.socket)
+    # Ölçüm portunu ortak servis kullanır; ona bağlı pencereler yalnızca
+    # port açıkça verilirse kendi ölçümlerini sunar
+    metrics_port = args.metrics_port
+    if metrics_port is None:
+        metrics_port = METRICS_PORT if daemon_client is None else 0
+    if not args.measure_startup:
+        start_metrics_server(metrics_port)
+    win = ScrollingTextWindow(daemon_client)
+    win.exit_after_first_frame = args.measure_startup
     win.show_all()
     Gtk.main()
+    win.feed_list_writer.flush()
+    get_feed_parse_pool().shutdown()
 
 if __name__ == "__main__":
     main()
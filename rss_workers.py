@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+# Arka plan işçilerinin giriş noktaları: RSS ayrıştırma (--parse-worker) ve
+# Piper sentezi (--tts-worker). Bu modül GTK'yı ve kayan bant arayüzünü içe
+# aktarmaz; işçiler hızlı başlar, az bellek kullanır ve ekran gerektirmez.
+
+import argparse
+import calendar
+import json
+import logging
+import os
+import pickle
+import re
+import struct
+import subprocess
+import sys
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# İşçilerle konuşulan uzunluk önekli çerçevelerin başlığı
+FRAME_HEADER = struct.Struct(">I")
+
+# Ayrıştırılamayan (bozo) RSS akışları için hata
+class FeedParseError(Exception):
+    pass
+
+SKIP_HOURS_PATTERN = re.compile(rb"<skipHours\b[^>]*>(.*?)</skipHours>", re.S | re.I)
+SKIP_DAYS_PATTERN = re.compile(rb"<skipDays\b[^>]*>(.*?)</skipDays>", re.S | re.I)
+SKIP_HOUR_PATTERN = re.compile(rb"<hour\b[^>]*>\s*(\d{1,2})\s*</hour>", re.I)
+SKIP_DAY_PATTERN = re.compile(rb"<day\b[^>]*>\s*([A-Za-z]+)\s*</day>", re.I)
+WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# RSS 2.0 kanalının yoklama ipuçlarını çıkar: ttl (dakika), skipHours (GMT saatleri)
+# ve skipDays (haftanın günleri, 0 = pazartesi). feedparser skipHours/skipDays
+# öğelerini sunmadığından bunlar doğrudan belgeden okunur.
+def parse_feed_poll_info(feed, body):
+    feed_info = {"ttl": None, "skip_hours": [], "skip_days": []}
+    ttl = str(feed.feed.get("ttl", "")).strip()
+    if ttl.isdigit() and int(ttl) > 0:
+        feed_info["ttl"] = int(ttl)
+
+    match = SKIP_HOURS_PATTERN.search(body)
+    if match:
+        feed_info["skip_hours"] = sorted({int(hour) % 24 for hour in SKIP_HOUR_PATTERN.findall(match.group(1))})
+    match = SKIP_DAYS_PATTERN.search(body)
+    if match:
+        days = (day.decode("ascii").lower() for day in SKIP_DAY_PATTERN.findall(match.group(1)))
+        feed_info["skip_days"] = sorted({WEEKDAY_NAMES.index(day) for day in days if day in WEEKDAY_NAMES})
+    return feed_info
+
+# İndirilmiş RSS belgesini ayrıştır; akışın yoklama ipuçlarını ve
+# (başlık, link, guid, ham açıklama) kayıtlarını döndür. Ayrıştırma işçisinde çalışır.
+# Açıklamalar burada temizlenmez; yalnızca ipucunda gösterilecekleri için UTF-8
+# bayt olarak saklanır ve ilk kez fare üzerine geldiğinde temizlenir.
+def parse_feed_records(body, response_headers=None, item_cap=None):
+    import feedparser
+    feed = feedparser.parse(body, response_headers=response_headers)
+    if feed.bozo:
+        raise FeedParseError(str(feed.bozo_exception))
+
+    dated_records = []
+    for entry in feed.entries:
+        if not (hasattr(entry, "title") and entry.title.strip()):
+            continue
+
+        raw_description = getattr(entry, 'description', getattr(entry, 'summary', '')).strip()
+
+        link = getattr(entry, 'link', '').strip()
+        if not link:
+            logger.warning(f"Başlık için link bulunamadı: {entry.title[:50]}...")
+
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        dated_records.append((calendar.timegm(published) if published else None,
+                              (entry.title.strip(), link, getattr(entry, 'id', '').strip(),
+                               raw_description.encode("utf-8"))))
+    return parse_feed_poll_info(feed, body), newest_records(dated_records, item_cap)
+
+# RSS (RFC 822) veya Atom (ISO 8601) tarihini Unix zamanına çevir
+def parse_feed_date(text):
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        published = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            published = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
+
+# (zaman, kayıt) çiftlerinden en yeni item_cap kaydı belge sırasını koruyarak
+# seç. Akışlar genellikle yeniden eskiye sıralıdır; tarihler bu sırayı bozuyorsa
+# seçim tarihe göre yapılır. item_cap None ise tüm kayıtlar döner.
+def newest_records(dated_records, item_cap):
+    if item_cap is not None and len(dated_records) > item_cap and not dates_descending(dated_records):
+        ranked = sorted(range(len(dated_records)),
+                        key=lambda index: dated_records[index][0] or float('-inf'), reverse=True)
+        dated_records = [dated_records[index] for index in sorted(ranked[:item_cap])]
+    return [record for _, record in dated_records[:item_cap]]
+
+def dates_descending(dated_records):
+    previous = None
+    for published, _ in dated_records:
+        if published is None:
+            continue
+        if previous is not None and published > previous:
+            return False
+        previous = published
+    return True
+
+# Borudan tam olarak size bayt oku; akış kapanmışsa EOFError
+def read_exact(stream, size):
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        count = stream.readinto(view[received:])
+        if not count:
+            raise EOFError("Boru kapandı.")
+        received += count
+    return data
+
+def write_frame(stream, payload):
+    stream.write(FRAME_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+# Ayrıştırma işçisi (--parse-worker). Girişten (gövde, yanıt başlıkları, item_cap)
+# çerçeveleri okur, her biri için ("ok", (ipuçları, kayıtlar)) veya ("error", hata)
+# çerçevesi yazar.
+def run_parse_worker():
+    stdin = sys.stdin.buffer
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    while True:
+        try:
+            (size,) = FRAME_HEADER.unpack(read_exact(stdin, FRAME_HEADER.size))
+            body, response_headers, item_cap = pickle.loads(read_exact(stdin, size))
+        except EOFError:
+            return
+        try:
+            result = ("ok", parse_feed_records(body, response_headers, item_cap))
+        except Exception as e:
+            result = ("error", e)
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            payload = pickle.dumps(("error", FeedParseError(str(e))))
+        try:
+            write_frame(output, payload)
+        except BrokenPipeError:
+            return
+
+# Piper sentez süreci (--tts-worker). Ses modelini bir kez yükler, girişten
+# JSON satırları okur ve ham PCM sesi uzunluk önekli parçalar halinde yazar.
+def run_tts_worker(model_path, config_path, length_scale):
+    # Kütüphanelerin standart çıktıya yazdıkları ses akışını bozmasın diye
+    # asıl çıktı ayrı bir tanımlayıcıya taşınır, standart çıktı stderr'e yönlendirilir.
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=0)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    header = FRAME_HEADER
+
+    try:
+        from piper import PiperVoice
+        voice = PiperVoice.load(model_path, config_path=config_path)
+        logger.info(f"Piper ses modeli yüklendi: {model_path}")
+    except ImportError:
+        voice = None
+        logger.warning("piper Python modülü bulunamadı, her metin için piper komutu çalıştırılacak.")
+
+    def synthesize_chunks(text):
+        if voice is None:
+            process = subprocess.Popen(
+                ["piper", "--model", model_path, "--config", config_path,
+                 "--length-scale", str(length_scale), "--output_raw"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            process.stdin.write(text.encode("utf-8"))
+            process.stdin.close()
+            # Ses çıkışında örnek hizası bozulmasın diye parçalar çift uzunlukta gönderilir
+            leftover = b""
+            while True:
+                chunk = process.stdout.read1(16384)
+                if not chunk:
+                    break
+                chunk = leftover + chunk
+                even_length = len(chunk) - len(chunk) % 2
+                leftover = chunk[even_length:]
+                yield chunk[:even_length]
+            if process.wait() != 0:
+                logger.error(f"Piper komutu başarısız, çıkış kodu: {process.returncode}")
+        elif hasattr(voice, "synthesize_stream_raw"):
+            yield from voice.synthesize_stream_raw(text, length_scale=length_scale)
+        else:
+            from piper import SynthesisConfig
+            for audio_chunk in voice.synthesize(text, syn_config=SynthesisConfig(length_scale=length_scale)):
+                yield audio_chunk.audio_int16_bytes
+
+    for line in sys.stdin.buffer:
+        try:
+            text = json.loads(line.decode("utf-8"))["text"]
+            for chunk in synthesize_chunks(text):
+                if chunk:
+                    output.write(header.pack(len(chunk)) + chunk)
+        except BrokenPipeError:
+            return
+        except Exception as e:
+            logger.error(f"Piper sentez hatası: {e}")
+        output.write(header.pack(0))
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayan RSS haber okuyucu işçileri")
+    parser.add_argument("--parse-worker", action="store_true")
+    parser.add_argument("--tts-worker", action="store_true")
+    parser.add_argument("--model")
+    parser.add_argument("--config")
+    parser.add_argument("--length-scale", type=float, default=1.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.tts_worker:
+        run_tts_worker(args.model, args.config, args.length_scale)
+    elif args.parse_worker:
+        run_parse_worker()
+    else:
+        parser.error("işçi türü belirtilmedi")
+
+if __name__ == "__main__":
+    # Hatalar ana süreçte rss_workers.FeedParseError olarak açılabilsin diye işçi
+    # __main__ yerine modül adıyla çalıştırılır
+    import rss_workers
+    rss_workers.main()
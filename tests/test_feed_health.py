@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import rss_feed_reader
+except ImportError as e:  # PyGObject kurulu değilse
+    raise unittest.SkipTest(f"rss_feed_reader içe aktarılamadı: {e}")
+
+
+# Ağa çıkmadan get_rss_feed'i besleyen taşıma: ölü sunucular bağlantı hatası
+# verir, diğerleri değişmemiş (304) ve boş yanıt döndürür
+class FakeTransport:
+
+    def __init__(self, dead_urls):
+        self.dead_urls = set(dead_urls)
+
+    def fetch(self, url, item_cap=None):
+        if url in self.dead_urls:
+            raise requests.ConnectionError(f"bağlantı reddedildi: {url}")
+        return None
+
+    def cached(self, url):
+        return []
+
+    def save_validators(self):
+        pass
+
+
+class Connectivity:
+
+    def __init__(self, available):
+        self.available = available
+
+
+class FeedHealthTest(unittest.TestCase):
+
+    FEEDS = ["http://127.0.0.1:9/olu", "http://canli.example.com/rss", "http://diger.example.com/rss"]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.health = rss_feed_reader.FeedHealthTracker(os.path.join(self.directory.name, "health.json"),
+                                                        threshold=3)
+        self.filter = rss_feed_reader.HeadlineFilter([])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def refresh(self, transport, connectivity):
+        rss_feed_reader.get_rss_feed(self.FEEDS, max_retries=1, transport=transport, health=self.health,
+                                     headline_filter=self.filter, connectivity=connectivity)
+
+    def test_dead_host_is_quarantined_while_online(self):
+        transport = FakeTransport([self.FEEDS[0]])
+        for _ in range(3):
+            self.refresh(transport, Connectivity(True))
+        self.assertFalse(self.health.allow(self.FEEDS[0]))
+        self.assertTrue(self.health.allow(self.FEEDS[1]))
+        self.assertTrue(self.health.allow(self.FEEDS[2]))
+
+    def test_outage_is_not_counted(self):
+        transport = FakeTransport(self.FEEDS)
+        for _ in range(5):
+            self.refresh(transport, Connectivity(True))
+        self.assertTrue(all(self.health.allow(url) for url in self.FEEDS))
+        self.assertIsNone(self.health.snapshot(self.FEEDS[0]))
+
+    def test_failures_while_offline_are_not_counted(self):
+        transport = FakeTransport([self.FEEDS[0]])
+        for _ in range(5):
+            self.refresh(transport, Connectivity(False))
+        self.assertTrue(self.health.allow(self.FEEDS[0]))
+
+    def test_reset_backoff_releases_quarantine(self):
+        transport = FakeTransport([self.FEEDS[0]])
+        for _ in range(4):
+            self.refresh(transport, Connectivity(True))
+        self.health.reset_backoff()
+        self.assertTrue(self.health.allow(self.FEEDS[0]))
+        self.assertEqual(self.health.snapshot(self.FEEDS[0]).probe_interval, self.health.min_probe_interval)
+
+
+if __name__ == "__main__":
+    unittest.main()
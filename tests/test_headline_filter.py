@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import rss_feed_reader
+except ImportError as e:  # PyGObject kurulu değilse
+    raise unittest.SkipTest(f"rss_feed_reader içe aktarılamadı: {e}")
+
+FEED = "https://haber.example.com/rss"
+
+
+def make_entry(title, description=""):
+    return rss_feed_reader.FeedEntry(title, f"{FEED}/{abs(hash(title))}", "",
+                                     description.encode("utf-8"), FEED)
+
+
+class HeadlineFilterTest(unittest.TestCase):
+
+    def test_turkish_and_ascii_spellings_match(self):
+        headline_filter = rss_feed_reader.HeadlineFilter([("exclude", "title", "İstanbul"),
+                                                          ("exclude", None, "Şişli")])
+        entries = [make_entry("Istanbul trafiği kilitlendi"), make_entry("ISTANBUL'DA KAR"),
+                   make_entry("Sisli'de yol çalışması"), make_entry("Ankara'da toplantı")]
+        self.assertEqual([entry.title for entry in headline_filter.filter(entries)], ["Ankara'da toplantı"])
+
+    def test_filter_and_dedup_share_folding(self):
+        self.assertEqual(rss_feed_reader.normalize_title("İstanbul'da Işık!"),
+                         " ".join(rss_feed_reader.fold_text("istanbul da isik").split()))
+
+    def test_boost_is_recorded_and_ranked(self):
+        headline_filter = rss_feed_reader.HeadlineFilter([("boost", None, "deprem"),
+                                                          ("boost", "title", "son dakika")])
+        entries = [make_entry("Hava durumu"), make_entry("Deprem bölgesinde son durum"),
+                   make_entry("Son dakika: depremde hasar tespiti")]
+        ranked = headline_filter.filter(entries)
+        self.assertEqual([entry.boost for entry in ranked], [2, 1, 0])
+        self.assertEqual(ranked[0].title, "Son dakika: depremde hasar tespiti")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import rss_feed_reader
+except ImportError as e:  # PyGObject kurulu değilse
+    raise unittest.SkipTest(f"rss_feed_reader içe aktarılamadı: {e}")
+
+ALFA = "https://alfa.example.com/rss"
+BETA = "https://beta.example.com/rss"
+
+
+def make_entry(feed, number, title):
+    return rss_feed_reader.FeedEntry(title, f"{feed}/haber/{number}", "", b"<p>ayrinti</p>", feed)
+
+
+class StoryDedupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = rss_feed_reader.EntryStore(os.path.join(self.directory.name, "entries.db"))
+        self.deduplicator = rss_feed_reader.StoryDeduplicator()
+        self.alfa = [make_entry(ALFA, 1, "Merkez Bankası faiz kararını açıkladı"),
+                     make_entry(ALFA, 2, "İstanbul'da yoğun kar yağışı bekleniyor")]
+        self.beta = [make_entry(BETA, 1, "Merkez Bankası faiz kararını açıkladı!"),
+                     make_entry(BETA, 2, "Süper Lig'de haftanın programı belli oldu")]
+
+    def tearDown(self):
+        self.store.connection.close()
+        self.directory.cleanup()
+
+    # Her yoklamada akışlar aynı başlıkları yeniden gönderir (ör. 304 yanıtı)
+    def poll(self):
+        shown = rss_feed_reader.merge_feed_entries(self.store, self.deduplicator, ALFA, list(self.alfa))
+        shown += rss_feed_reader.merge_feed_entries(self.store, self.deduplicator, BETA, list(self.beta))
+        self.store.prune()
+        return [entry.title for entry in shown]
+
+    def test_copy_is_counted_once(self):
+        first = self.poll()
+        self.assertEqual(len(first), 3)
+        self.assertNotIn(self.beta[0].title, first)
+        self.assertEqual(self.deduplicator.snapshot()["duplicates"], 1)
+
+        self.assertEqual(self.poll(), [])
+        self.assertEqual(self.deduplicator.snapshot()["duplicates"], 1)
+        self.assertEqual(self.poll(), [])
+        self.assertEqual(self.deduplicator.snapshot()["duplicates"], 1)
+
+    def test_copy_is_not_loaded_at_startup(self):
+        self.poll()
+        titles = [entry.title for entry in self.store.load_entries([ALFA, BETA])]
+        self.assertEqual(titles.count("Merkez Bankası faiz kararını açıkladı"), 1)
+        self.assertNotIn(self.beta[0].title, titles)
+
+    def test_copy_is_offered_again_when_original_leaves(self):
+        self.poll()
+        original = rss_feed_reader.entry_key(self.alfa[0])
+        with self.deduplicator.lock:
+            self.deduplicator.remove(original)
+        self.assertIn(self.beta[0].title, self.poll())
+        self.assertEqual(self.poll(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()